@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, Callable
+
+
+def measure(fns: Dict[str, Callable[[], object]], *, repeat: int = 10) -> Dict[str, float]:
+    """Returns the best wall-clock time, in seconds, of `repeat` calls to each function.
+
+    Calls are interleaved so that noise from other processes affects every candidate equally.
+    """
+    best = {name: float("inf") for name in fns}
+    for _ in range(repeat):
+        for name, fn in fns.items():
+            start = time.perf_counter()
+            fn()
+            best[name] = min(best[name], time.perf_counter() - start)
+    return best
+
+
+def report(name: str, seconds: float, **rates: float) -> None:
+    parts = [f"{name:<32} {seconds * 1000:9.2f} ms"]
+    for unit, amount in rates.items():
+        parts.append(f"{amount / seconds:14,.0f} {unit}/s")
+    print("  ".join(parts))
@@ -0,0 +1,108 @@
+#!/usr/bin/env -S rye run python
+"""Measures how the cost of accumulating a chunk with `ChatCompletionStreamState` grows with the length of the stream.
+
+Chunks are fed straight into the state, without a network or SSE decoding, for a stream of
+text content & a stream of tool call arguments. Merging a chunk into the snapshot in place
+costs the same at the end of the stream as at the start, rebuilding the message snapshot
+for every chunk costs more as the message grows.
+
+You can run this script from the root directory like so:
+`python benchmarks/chat_stream_state.py`
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, cast
+from unittest import mock
+
+from openai._models import construct_type
+from openai.types.chat import ChatCompletionChunk
+from openai.lib.streaming.chat import ChatCompletionStreamState, _completions
+
+N_CHUNKS = 16_000
+WINDOW = 1_000
+REPEAT = 3
+
+
+def chunk(delta: Dict[str, Any], *, finish_reason: Any = None) -> ChatCompletionChunk:
+    return cast(
+        ChatCompletionChunk,
+        construct_type(
+            type_=ChatCompletionChunk,
+            value={
+                "id": "chatcmpl-123",
+                "object": "chat.completion.chunk",
+                "created": 1694268190,
+                "model": "gpt-4o-mini",
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}],
+            },
+        ),
+    )
+
+
+def content_chunks() -> List[ChatCompletionChunk]:
+    chunks = [chunk({"role": "assistant", "content": ""})]
+    chunks.extend(chunk({"content": f"token {i} "}) for i in range(N_CHUNKS))
+    return chunks
+
+
+def tool_call_chunks() -> List[ChatCompletionChunk]:
+    chunks = [
+        chunk(
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {"index": 0, "id": "call_1", "type": "function", "function": {"name": "f", "arguments": ""}}
+                ],
+            }
+        )
+    ]
+    chunks.extend(
+        chunk({"tool_calls": [{"index": 0, "function": {"arguments": f'"arg {i}", '}}]}) for i in range(N_CHUNKS)
+    )
+    return chunks
+
+
+def chunk_timings(chunks: List[ChatCompletionChunk]) -> List[float]:
+    state: ChatCompletionStreamState[object] = ChatCompletionStreamState()
+    timings: List[float] = []
+    for item in chunks:
+        start = time.perf_counter()
+        for _ in state.handle_chunk(item):
+            pass
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run(name: str, chunks: List[ChatCompletionChunk]) -> None:
+    print(f"\n{name}, {N_CHUNKS:,} chunks (µs per chunk)")
+    print(f"  {'chunks':<16} {'rebuilt':>8} {'in place':>9}")
+
+    results: Dict[str, List[float]] = {}
+    for mode in ("rebuilt", "in place"):
+        # the best of a few runs, per chunk, to filter out noise
+        best = [float("inf")] * len(chunks)
+        for _ in range(REPEAT):
+            if mode == "rebuilt":
+                # every chunk is merged by dumping & re-constructing the message snapshot, as before
+                with mock.patch.object(_completions, "_accumulate_message_delta", return_value=False):
+                    timings = chunk_timings(chunks)
+            else:
+                timings = chunk_timings(chunks)
+            best = [min(a, b) for a, b in zip(best, timings)]
+        results[mode] = best
+
+    for offset in range(0, N_CHUNKS, N_CHUNKS // 4):
+        window = slice(offset + 1, offset + 1 + WINDOW)
+        row = [sum(results[mode][window]) / WINDOW * 1e6 for mode in ("rebuilt", "in place")]
+        print(f"  {offset:6,} - {offset + WINDOW:6,}  {row[0]:8.1f} {row[1]:9.1f}")
+
+
+def main() -> None:
+    run("content", content_chunks())
+    run("tool call arguments", tool_call_chunks())
+
+
+if __name__ == "__main__":
+    main()
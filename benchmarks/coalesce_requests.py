@@ -0,0 +1,82 @@
+#!/usr/bin/env -S rye run python
+"""Compares the number of requests sent for concurrent identical `models.retrieve()` calls with & without `coalesce_requests`.
+
+Every thread retrieves the same model at the same time from a local server which takes
+50ms to respond and counts the requests it receives.
+
+You can run this script from the root directory like so:
+`python benchmarks/coalesce_requests.py`
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing_extensions import override
+from concurrent.futures import ThreadPoolExecutor
+
+from openai import OpenAI
+
+N_THREADS = 50
+N_ROUNDS = 10
+BODY = json.dumps({"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"}).encode()
+
+lock = threading.Lock()
+received = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        global received
+        with lock:
+            received += 1
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def run(base_url: str, coalesce_requests: bool) -> tuple[int, float]:
+    global received
+    received = 0
+
+    client = OpenAI(api_key="My API Key", base_url=base_url, coalesce_requests=coalesce_requests)
+
+    def retrieve(_: int) -> None:
+        client.models.retrieve("gpt-4o")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        for _ in range(N_ROUNDS):
+            list(executor.map(retrieve, range(N_THREADS)))
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    return received, elapsed
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    print(f"{N_ROUNDS} rounds of {N_THREADS} threads retrieving the same model\n")
+    for name, coalesce_requests in [("a request per call", False), ("coalesce_requests", True)]:
+        requests, elapsed = run(base_url, coalesce_requests)
+        print(f"{name:<20} {requests:5,} requests sent  {elapsed * 1000:7.1f} ms")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
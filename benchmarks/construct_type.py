@@ -0,0 +1,75 @@
+#!/usr/bin/env -S rye run python
+"""Measures how long it takes to construct common response types with `construct_type()`.
+
+You can run this script from the root directory like so:
+`python benchmarks/construct_type.py`
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, Callable
+
+from _utils import report, measure
+
+from openai._models import construct_type
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.responses import ResponseStreamEvent
+
+N = 5_000
+
+CHAT_COMPLETION_CHUNK = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion.chunk",
+    "created": 1694268190,
+    "model": "gpt-4o-mini",
+    "system_fingerprint": "fp_44709d6fcb",
+    "choices": [{"index": 0, "delta": {"content": "token "}, "logprobs": None, "finish_reason": None}],
+}
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1677652288,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello there, how may I assist you today?"},
+            "logprobs": None,
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 9, "completion_tokens": 12, "total_tokens": 21},
+}
+
+RESPONSE_TEXT_DELTA_EVENT: Dict[str, object] = {
+    "type": "response.output_text.delta",
+    "item_id": "msg_123",
+    "output_index": 0,
+    "content_index": 0,
+    "delta": "token ",
+    "sequence_number": 1,
+    "logprobs": [],
+}
+
+
+def construct_all(type_: Any, value: object) -> None:
+    for _ in range(N):
+        construct_type(type_=type_, value=value)
+
+
+def main() -> None:
+    fns: Dict[str, Callable[[], object]] = {
+        "ChatCompletionChunk": functools.partial(construct_all, ChatCompletionChunk, CHAT_COMPLETION_CHUNK),
+        "ChatCompletion": functools.partial(construct_all, ChatCompletion, CHAT_COMPLETION),
+        "ResponseStreamEvent": functools.partial(construct_all, ResponseStreamEvent, RESPONSE_TEXT_DELTA_EVENT),
+    }
+
+    print(f"\nconstructing {N:,} objects of each type")
+    for name, elapsed in measure(fns, repeat=5).items():
+        report(name, elapsed, objects=N)
+
+
+if __name__ == "__main__":
+    main()
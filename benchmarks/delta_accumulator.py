@@ -0,0 +1,115 @@
+#!/usr/bin/env -S rye run python
+"""Measures the cost of accumulating 10k-delta streams into snapshots, like the assistants stream does.
+
+Three synthetic streams are accumulated: the text of a message, the arguments of 100 tool calls
+in a run step & the text of a message without building a snapshot after every delta. Dumping
+the snapshot, merging the delta with `accumulate_delta()` & constructing the snapshot again costs
+more as the snapshot grows, `DeltaAccumulator` only rebuilds the parts that changed.
+
+You can run this script from the root directory like so:
+`python benchmarks/delta_accumulator.py`
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, Callable, cast
+
+from _utils import report, measure
+
+from openai._compat import model_dump
+from openai._models import BaseModel, construct_type
+from openai.types.beta.threads import MessageContent
+from openai.lib.streaming._deltas import DeltaAccumulator, accumulate_delta
+from openai.types.beta.threads.runs import RunStep
+
+N_DELTAS = 10_000
+
+
+def text_deltas() -> List[Dict[str, Any]]:
+    return [{"index": 0, "type": "text", "text": {"value": f"token {i} ", "annotations": []}} for i in range(N_DELTAS)]
+
+
+def tool_call_deltas() -> List[Dict[str, Any]]:
+    deltas: List[Dict[str, Any]] = []
+    for i in range(N_DELTAS):
+        tool_call: Dict[str, Any] = {"index": i // 100, "type": "function", "function": {"arguments": f'"{i}", '}}
+        if i % 100 == 0:
+            tool_call.update(id=f"call_{i // 100}", function={"name": "get_weather", "arguments": ""})
+        deltas.append({"step_details": {"type": "tool_calls", "tool_calls": [tool_call]}})
+    return deltas
+
+
+RUN_STEP: Dict[str, Any] = {
+    "id": "step_123",
+    "object": "thread.run.step",
+    "created_at": 0,
+    "assistant_id": "asst_123",
+    "thread_id": "thread_123",
+    "run_id": "run_123",
+    "type": "tool_calls",
+    "status": "in_progress",
+    "step_details": {"type": "tool_calls", "tool_calls": []},
+}
+
+
+def rebuild_per_delta(type_: Any, initial: Dict[str, Any], deltas: List[Dict[str, Any]]) -> None:
+    snapshot = cast(BaseModel, construct_type(type_=type_, value=copy.deepcopy(initial)))
+    for delta in deltas:
+        merged = accumulate_delta(
+            cast("dict[object, object]", model_dump(snapshot, exclude_unset=True, warnings=False)),
+            cast("dict[object, object]", delta),
+        )
+        snapshot = cast(BaseModel, construct_type(type_=type_, value=merged))
+
+
+def accumulate_per_delta(type_: Any, initial: Dict[str, Any], deltas: List[Dict[str, Any]]) -> None:
+    snapshot = construct_type(type_=type_, value=copy.deepcopy(initial))
+    accumulator = DeltaAccumulator(cast("dict[object, object]", copy.deepcopy(initial)))
+    for delta in deltas:
+        accumulator.add(cast("dict[object, object]", delta))
+        snapshot = accumulator.finalize_model(type_, snapshot)
+
+
+def accumulate_dicts(deltas: List[Dict[str, Any]]) -> None:
+    # the values of the first delta become part of the snapshot, which is changed by the others
+    acc = cast("dict[object, object]", copy.deepcopy(deltas[0]))
+    for delta in deltas[1:]:
+        acc = accumulate_delta(acc, cast("dict[object, object]", delta))
+
+
+def accumulate_fragments(deltas: List[Dict[str, Any]]) -> None:
+    accumulator = DeltaAccumulator()
+    for delta in deltas:
+        accumulator.add(cast("dict[object, object]", delta))
+    accumulator.finalize()
+
+
+def main() -> None:
+    texts = text_deltas()
+    tool_calls = tool_call_deltas()
+
+    benchmarks: Dict[str, Dict[str, Callable[[], object]]] = {
+        "message text, snapshot per delta": {
+            "dump, merge & construct": lambda: rebuild_per_delta(MessageContent, texts[0], texts[1:]),
+            "DeltaAccumulator": lambda: accumulate_per_delta(MessageContent, texts[0], texts[1:]),
+        },
+        "100 tool calls, snapshot per delta": {
+            "dump, merge & construct": lambda: rebuild_per_delta(RunStep, RUN_STEP, tool_calls),
+            "DeltaAccumulator": lambda: accumulate_per_delta(RunStep, RUN_STEP, tool_calls),
+        },
+        "message text, final snapshot only": {
+            "accumulate_delta()": lambda: accumulate_dicts(texts),
+            "DeltaAccumulator": lambda: accumulate_fragments(texts),
+        },
+    }
+
+    for title, fns in benchmarks.items():
+        print(f"{title} ({N_DELTAS:,} deltas)")
+        for name, seconds in measure(fns, repeat=5).items():
+            report(name, seconds, deltas=N_DELTAS)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env -S rye run python
+"""Compares embedding texts one call at a time from many coroutines with an `AsyncEmbeddingBatcher`.
+
+1,000 coroutines each embed a single text, at most 100 at once, the API is mocked and takes 20ms
+to respond to every request.
+
+You can run this script from the root directory like so:
+`python benchmarks/embedding_batcher.py`
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+from typing import Any, Callable, Awaitable
+
+import httpx
+
+from openai import AsyncOpenAI
+from openai.helpers import AsyncEmbeddingBatcher
+
+N_TEXTS = 1_000
+CONCURRENCY = 100
+LATENCY = 0.02
+
+requests = 0
+
+
+async def handle(request: httpx.Request) -> httpx.Response:
+    global requests
+    requests += 1
+    await asyncio.sleep(LATENCY)
+    body: Any = json.loads(request.content)
+    data = [{"object": "embedding", "index": index, "embedding": [0.0] * 8} for index in range(len(body["input"]))]
+    usage = {"prompt_tokens": len(body["input"]), "total_tokens": len(body["input"])}
+    return httpx.Response(200, json={"object": "list", "data": data, "model": body["model"], "usage": usage})
+
+
+async def run(name: str, embed: Callable[[str], Awaitable[object]]) -> None:
+    global requests
+    requests = 0
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def task(index: int) -> None:
+        async with semaphore:
+            await embed(f"text {index}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task(index) for index in range(N_TEXTS)))
+    print(f"{name:<24} {requests:5,} requests  {(time.perf_counter() - start) * 1000:7.1f} ms")
+
+
+async def main() -> None:
+    client = AsyncOpenAI(api_key="My API Key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+    batcher = AsyncEmbeddingBatcher(client)
+
+    print(f"{N_TEXTS:,} texts, {CONCURRENCY} concurrent callers\n")
+
+    async def create(text: str) -> object:
+        return await client.embeddings.create(input=text, model="text-embedding-3-small", encoding_format="float")
+
+    async def batched(text: str) -> object:
+        return await batcher.create(input=text, model="text-embedding-3-small", encoding_format="float")
+
+    await run("embeddings.create()", create)
+    await run("AsyncEmbeddingBatcher", batched)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
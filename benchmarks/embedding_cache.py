@@ -0,0 +1,76 @@
+#!/usr/bin/env -S rye run python
+"""Compares re-embedding documents on every ingestion run with an `EmbeddingCache`.
+
+Each run ingests 2,000 chunks of which 90% were already ingested by a previous run, the API
+is mocked and returns 1536 dimensional embeddings.
+
+You can run this script from the root directory like so:
+`python benchmarks/embedding_cache.py`
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import base64
+import random
+import tempfile
+from typing import Any, List
+
+import httpx
+import numpy as np
+
+from openai import OpenAI
+from openai.helpers import EmbeddingCache
+
+N_RUNS = 5
+N_CHUNKS = 2_000
+DIMS = 1536
+VECTOR = base64.b64encode(np.random.rand(DIMS).astype(np.float32).tobytes()).decode()
+
+embedded = 0
+
+
+def handle(request: httpx.Request) -> httpx.Response:
+    global embedded
+    body: Any = json.loads(request.content)
+    embedded += len(body["input"])
+    data = [{"object": "embedding", "index": index, "embedding": VECTOR} for index in range(len(body["input"]))]
+    return httpx.Response(200, json={"object": "list", "data": data, "model": body["model"]})
+
+
+def chunks(run: int) -> List[str]:
+    # 10% of the chunks are new in every run
+    new = [f"chunk {run}-{index}" for index in range(N_CHUNKS // 10)]
+    old = [f"chunk {index}" for index in range(N_CHUNKS - len(new))]
+    random.shuffle(old)
+    return old + new
+
+
+def main() -> None:
+    global embedded
+    client = OpenAI(api_key="My API Key", http_client=httpx.Client(transport=httpx.MockTransport(handle)))
+
+    print(f"{N_RUNS} runs of {N_CHUNKS:,} chunks\n")
+
+    embedded = 0
+    start = time.perf_counter()
+    for run in range(N_RUNS):
+        batch = chunks(run)
+        for offset in range(0, len(batch), 2048):
+            client.embeddings.create(input=batch[offset : offset + 2048], model="text-embedding-3-small")
+    print(f"{'embeddings.create()':<22} {embedded:7,} inputs embedded  {(time.perf_counter() - start) * 1000:7.1f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(client, directory)
+        embedded = 0
+        start = time.perf_counter()
+        for run in range(N_RUNS):
+            cache.create(input=chunks(run), model="text-embedding-3-small")
+        elapsed = time.perf_counter() - start
+        print(f"{'EmbeddingCache':<22} {embedded:7,} inputs embedded  {elapsed * 1000:7.1f} ms")
+        print(f"\nhit rate: {cache.stats().hit_rate:.0%}")
+
+
+if __name__ == "__main__":
+    main()
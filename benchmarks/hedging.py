@@ -0,0 +1,78 @@
+#!/usr/bin/env -S rye run python
+"""Compares the tail latency of `embeddings.create()` with & without a `HedgingPolicy`.
+
+The API is simulated by a mock transport that responds after 20ms, except for 5% of
+requests which take 500ms.
+
+You can run this script from the root directory like so:
+`python benchmarks/hedging.py`
+"""
+
+from __future__ import annotations
+
+import time
+import random
+import asyncio
+from typing import Dict, List, Optional
+
+import httpx
+
+from openai import AsyncOpenAI, HedgingPolicy
+
+N_REQUESTS = 1_000
+CONCURRENCY = 20
+
+
+def percentile(latencies: List[float], p: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+
+async def run(hedging: Optional[HedgingPolicy]) -> Dict[str, float]:
+    rng = random.Random(0)
+    sent = 0
+
+    async def handle(_: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        await asyncio.sleep(0.5 if rng.random() < 0.05 else 0.02)
+        return httpx.Response(200, json={"object": "list", "data": [{"embedding": [1.0], "index": 0}]})
+
+    client = AsyncOpenAI(
+        api_key="My API Key",
+        hedging=hedging,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def send() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await client.embeddings.create(input="hello", model="text-embedding-3-small")
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(send() for _ in range(N_REQUESTS)))
+
+    return {
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "sent": sent,
+    }
+
+
+def main() -> None:
+    print(f"{N_REQUESTS:,} requests, {CONCURRENCY} at a time, 5% of responses take 500ms instead of 20ms\n")
+
+    for name, hedging in [("no hedging", None), ("HedgingPolicy(p90)", HedgingPolicy(percentile=90))]:
+        result = asyncio.run(run(hedging))
+        print(
+            f"{name:<20} p50 {result['p50'] * 1000:6.1f} ms  p95 {result['p95'] * 1000:6.1f} ms  "
+            f"p99 {result['p99'] * 1000:6.1f} ms  {result['sent']:6,.0f} requests sent"
+        )
+
+
+if __name__ == "__main__":
+    main()
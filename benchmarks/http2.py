@@ -0,0 +1,161 @@
+#!/usr/bin/env -S rye run python
+"""Compares the default HTTP/1.1 connection pool with `http2=True` when sending many concurrent requests.
+
+The requests are sent to a local TLS server that responds after 50ms and counts the
+connections, and therefore TLS handshakes, it accepts. Requires the `h2` package and
+the `openssl` command line tool.
+
+You can run this script from the root directory like so:
+`python benchmarks/http2.py`
+"""
+
+from __future__ import annotations
+
+import os
+import ssl
+import json
+import time
+import asyncio
+import tempfile
+import subprocess
+from typing import Dict, List
+
+import h11
+import h2.config
+import h2.events
+import h2.settings
+import h2.connection
+
+from openai import AsyncOpenAI
+
+N_REQUESTS = 1_000
+CONCURRENCY = 200
+LATENCY = 0.05
+BODY = json.dumps({"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"}).encode()
+
+
+class Server:
+    def __init__(self) -> None:
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        ssl_object = writer.get_extra_info("ssl_object")
+        try:
+            if ssl_object.selected_alpn_protocol() == "h2":
+                await self.handle_h2(reader, writer)
+            else:
+                await self.handle_h11(reader, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def handle_h11(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h11.Connection(h11.SERVER)
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                data = await reader.read(65536)
+                if not data:
+                    return
+                conn.receive_data(data)
+            elif isinstance(event, h11.EndOfMessage):
+                await asyncio.sleep(LATENCY)
+                headers = [("content-type", "application/json"), ("content-length", str(len(BODY)))]
+                writer.write(conn.send(h11.Response(status_code=200, headers=headers)) or b"")
+                writer.write(conn.send(h11.Data(data=BODY)) or b"")
+                writer.write(conn.send(h11.EndOfMessage()) or b"")
+                await writer.drain()
+                conn.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed):
+                return
+
+    async def handle_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.local_settings = h2.settings.Settings(
+            client=False, initial_values={h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: 256}
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(LATENCY)
+            headers = [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(BODY)))]
+            conn.send_headers(stream_id, headers)
+            conn.send_data(stream_id, BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        tasks: List["asyncio.Task[None]"] = []
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.StreamEnded):
+                    tasks.append(asyncio.ensure_future(respond(event.stream_id)))
+                elif isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            writer.write(conn.data_to_send())
+
+
+def create_certificate(directory: str) -> tuple[str, str]:
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost"]
+        + ["-addext", "subjectAltName=DNS:localhost", "-keyout", key, "-out", cert],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+async def run(http2: bool, ssl_context: ssl.SSLContext) -> Dict[str, float]:
+    server = Server()
+    listener = await asyncio.start_server(server.handle, "localhost", 0, ssl=ssl_context, backlog=1024)
+    port = listener.sockets[0].getsockname()[1]
+
+    client = AsyncOpenAI(api_key="My API Key", base_url=f"https://localhost:{port}/v1", http2=http2, max_retries=0)
+
+    peak_connections = 0
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def send() -> None:
+        nonlocal peak_connections
+        async with semaphore:
+            await client.models.retrieve("gpt-4o")
+            status = client.connection_pool_status()
+            assert status is not None
+            peak_connections = max(peak_connections, status.connections)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(N_REQUESTS)))
+    elapsed = time.perf_counter() - start
+
+    await client.close()
+    listener.close()
+    await listener.wait_closed()
+
+    return {"elapsed": elapsed, "handshakes": server.connections, "peak_connections": peak_connections}
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = create_certificate(directory)
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(cert, key)
+        ssl_context.set_alpn_protocols(["h2", "http/1.1"])
+        # trust the self-signed certificate in the clients
+        os.environ["SSL_CERT_FILE"] = cert
+
+        print(f"{N_REQUESTS:,} requests, {CONCURRENCY} at a time, {LATENCY * 1000:.0f}ms server latency\n")
+        for name, http2 in [("HTTP/1.1 pool", False), ("http2=True", True)]:
+            result = asyncio.run(run(http2, ssl_context))
+            print(
+                f"{name:<16} {result['elapsed']:6.2f}s  {N_REQUESTS / result['elapsed']:7,.0f} req/s  "
+                f"{result['handshakes']:4,.0f} TLS handshakes  {result['peak_connections']:4,.0f} peak open connections"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env -S rye run python
+"""Compares streaming a chat completion with the default `json` backend and with `orjson`.
+
+You can run this script from the root directory like so:
+`python benchmarks/json_backend.py`
+"""
+
+from __future__ import annotations
+
+import json
+import functools
+from typing import Any, Dict, List, Callable
+
+import httpx
+from _utils import report, measure
+
+from openai import OpenAI
+
+N_EVENTS = 5_000
+
+
+def make_body() -> bytes:
+    events: List[bytes] = []
+    for i in range(N_EVENTS):
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1694268190,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": f"token {i} "}, "logprobs": None, "finish_reason": None}],
+        }
+        events.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    events.append(b"data: [DONE]\n\n")
+    return b"".join(events)
+
+
+def loads_all(loads: Callable[[str], object], payloads: List[str]) -> None:
+    for payload in payloads:
+        loads(payload)
+
+
+def stream_all(client: OpenAI) -> None:
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": "Say this is a test"}],
+        stream=True,
+    )
+    count = sum(1 for _ in stream)
+    assert count == N_EVENTS
+
+
+def main() -> None:
+    body = make_body()
+    transport = httpx.MockTransport(
+        lambda _: httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+    )
+
+    backends: Dict[str, Any] = {"json": None}
+    try:
+        import orjson
+    except ImportError:
+        print("orjson is not installed, only the default backend will be measured")
+    else:
+        backends["orjson"] = orjson
+
+    payloads = [line[len(b"data: ") :].decode() for line in body.splitlines() if line][:-1]
+    print(f"\ndecoding {N_EVENTS:,} chat completion chunks")
+    results = measure(
+        {name: functools.partial(loads_all, (backend or json).loads, payloads) for name, backend in backends.items()}
+    )
+    for name, elapsed in results.items():
+        report(name, elapsed, events=N_EVENTS)
+
+    fns: Dict[str, Callable[[], object]] = {}
+    for name, backend in backends.items():
+        client = OpenAI(api_key="My API Key", http_client=httpx.Client(transport=transport), json_backend=backend)
+        fns[name] = functools.partial(stream_all, client)
+
+    print(f"\nstreaming {N_EVENTS:,} chat completion chunks")
+    for name, elapsed in measure(fns, repeat=5).items():
+        report(name, elapsed, events=N_EVENTS)
+
+
+if __name__ == "__main__":
+    main()
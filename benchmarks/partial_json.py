@@ -0,0 +1,74 @@
+#!/usr/bin/env -S rye run python
+"""Measures the cost of partially parsing a streamed structured output after every chunk.
+
+A large JSON document is split into small chunks, like the deltas of a streamed response,
+& the accumulated text is parsed after every chunk. Parsing the whole text with `jiter`
+every time costs more as the text grows, `PartialJSONParser` only reads the new text.
+
+You can run this script from the root directory like so:
+`python benchmarks/partial_json.py`
+"""
+
+from __future__ import annotations
+
+import json
+import functools
+from typing import Iterator
+
+from jiter import from_json
+from _utils import report, measure
+
+from openai.lib.streaming._partial_json import PartialJSONParser
+
+CHUNK_SIZE = 8
+
+
+def document(n_items: int) -> str:
+    return json.dumps(
+        {
+            "items": [
+                {"id": i, "name": f"item {i}", "price": i * 1.25, "tags": ["a", "b", "c"], "in_stock": i % 2 == 0}
+                for i in range(n_items)
+            ]
+        }
+    )
+
+
+def prefixes(text: str) -> Iterator[str]:
+    """Yields the text accumulated after every chunk."""
+    for end in range(CHUNK_SIZE, len(text) + CHUNK_SIZE, CHUNK_SIZE):
+        yield text[:end]
+
+
+def parse_whole(text: str) -> None:
+    for prefix in prefixes(text):
+        from_json(bytes(prefix, "utf-8"), partial_mode=True)
+
+
+def parse_incrementally(text: str) -> None:
+    parser = PartialJSONParser()
+    for prefix in prefixes(text):
+        parser.parse(prefix)
+
+
+def main() -> None:
+    for n_items in (100, 300, 1_000):
+        text = document(n_items)
+        n_chunks = -(-len(text) // CHUNK_SIZE)
+        assert PartialJSONParser().parse(text) == json.loads(text)
+
+        print(f"{len(text):,} characters in {n_chunks:,} chunks")
+        results = measure(
+            {
+                "jiter.from_json() per chunk": functools.partial(parse_whole, text),
+                "PartialJSONParser.parse()": functools.partial(parse_incrementally, text),
+            },
+            repeat=3,
+        )
+        for name, seconds in results.items():
+            report(name, seconds, chunks=n_chunks)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env -S rye run python
+"""Compares how many requests are rejected with a 429 when a burst of requests is sent with & without a `RateLimiter`.
+
+The API is simulated by a mock transport that enforces request & token limits which are
+replenished continuously, like the real API does.
+
+You can run this script from the root directory like so:
+`python benchmarks/rate_limiter.py`
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+import threading
+from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from openai import OpenAI, AsyncOpenAI, RateLimiter, RateLimitError
+
+WINDOW = 1.0
+
+
+class Budget:
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.available = limit
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.available = min(self.limit, self.available + (now - self.updated_at) * self.limit / WINDOW)
+        self.updated_at = now
+
+    def headers(self, name: str) -> Dict[str, str]:
+        reset = (self.limit - self.available) * WINDOW / self.limit
+        return {
+            f"x-ratelimit-limit-{name}": str(self.limit),
+            f"x-ratelimit-remaining-{name}": str(int(self.available)),
+            f"x-ratelimit-reset-{name}": f"{reset * 1000:.0f}ms",
+        }
+
+
+class SimulatedAPI:
+    """Rate limits requests and the tokens of their prompts, and reports the state like the API does."""
+
+    def __init__(self, *, requests: float, tokens: float) -> None:
+        self._lock = threading.Lock()
+        self._requests = Budget(requests)
+        self._tokens = Budget(tokens)
+        self.rejected = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body: Dict[str, Any] = json.loads(request.content) if request.content else {}
+        # the real tokenizer is a bit more efficient than the client's estimate
+        prompt_tokens = len(json.dumps(body.get("messages", []))) // 5
+        cost = prompt_tokens + body.get("max_completion_tokens", 0)
+
+        with self._lock:
+            now = time.monotonic()
+            self._requests.refill(now)
+            self._tokens.refill(now)
+
+            allowed = self._requests.available >= 1 and self._tokens.available >= cost
+            if allowed:
+                self._requests.available -= 1
+                self._tokens.available -= cost
+            else:
+                self.rejected += 1
+
+            headers = {**self._requests.headers("requests"), **self._tokens.headers("tokens")}
+
+        if not allowed:
+            return httpx.Response(429, json={"error": {"message": "Rate limit reached"}}, headers=headers)
+
+        completion: Dict[str, object] = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": 0, "total_tokens": prompt_tokens},
+        }
+        return httpx.Response(200, json=completion, headers=headers)
+
+
+def requests_per_second(limiter: Optional[RateLimiter]) -> Dict[str, float]:
+    """200 requests from 16 threads against a limit of 100 requests/s"""
+    api = SimulatedAPI(requests=100, tokens=1_000_000)
+    client = OpenAI(
+        api_key="My API Key",
+        max_retries=0,
+        rate_limiter=limiter,
+        http_client=httpx.Client(transport=httpx.MockTransport(api.handle)),
+    )
+
+    def send(_: int) -> bool:
+        try:
+            client.models.list()
+        except RateLimitError:
+            return False
+        return True
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(16) as executor:
+        succeeded = sum(executor.map(send, range(200)))
+
+    return {"seconds": time.perf_counter() - start, "succeeded": succeeded, "rejected": api.rejected}
+
+
+async def tokens_per_second(limiter: Optional[RateLimiter]) -> Dict[str, float]:
+    """1,000 concurrent chat completions of ~300 tokens each against a limit of 100,000 tokens/s"""
+    api = SimulatedAPI(requests=10_000, tokens=100_000)
+    client = AsyncOpenAI(
+        api_key="My API Key",
+        max_retries=0,
+        rate_limiter=limiter,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(api.handle)),
+    )
+
+    async def send() -> bool:
+        try:
+            await client.chat.completions.create(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "Say this is a test. " * 60}],
+                max_completion_tokens=50,
+            )
+        except RateLimitError:
+            return False
+        return True
+
+    # the first response tells the limiter what the budget is
+    await send()
+
+    start = time.perf_counter()
+    succeeded = sum(await asyncio.gather(*(send() for _ in range(1_000))))
+
+    return {"seconds": time.perf_counter() - start, "succeeded": succeeded, "rejected": api.rejected}
+
+
+def main() -> None:
+    print(f"\n{requests_per_second.__doc__}")
+    for name, limiter in [("no limiter", None), ("RateLimiter", RateLimiter(window=WINDOW))]:
+        print_result(name, requests_per_second(limiter))
+
+    print(f"\n{tokens_per_second.__doc__}")
+    for name, limiter in [("no limiter", None), ("RateLimiter", RateLimiter(window=WINDOW))]:
+        print_result(name, asyncio.run(tokens_per_second(limiter)))
+
+
+def print_result(name: str, result: Dict[str, float]) -> None:
+    print(
+        f"{name:<16} {result['seconds']:6.2f} s  {result['succeeded']:5.0f} succeeded  {result['rejected']:5.0f} rejected"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env -S rye run python
+"""Measures the peak memory of sending a request with a large body, with & without `stream_request_body`.
+
+The request contains 16 base64 encoded images of 2MB each.
+
+You can run this script from the root directory like so:
+`python benchmarks/request_body.py`
+"""
+
+from __future__ import annotations
+
+import time
+import base64
+import tracemalloc
+from typing import Any, Dict
+from typing_extensions import override
+
+import httpx
+
+from openai import OpenAI
+
+IMAGES = [base64.b64encode(bytes([index]) * 1_500_000).decode() for index in range(16)]
+COMPLETION = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+}
+
+
+class Transport(httpx.BaseTransport):
+    # unlike `httpx.MockTransport`, this doesn't read the whole body into memory
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        # consume the body chunk by chunk, like a transport writing it to a socket
+        assert isinstance(request.stream, httpx.SyncByteStream)
+        for _ in request.stream:
+            pass
+        return httpx.Response(200, json=COMPLETION)
+
+
+def run(stream_request_body: bool) -> Dict[str, float]:
+    client = OpenAI(
+        api_key="My API Key",
+        stream_request_body=stream_request_body,
+        http_client=httpx.Client(transport=Transport()),
+    )
+    messages: Any = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{image}"}} for image in IMAGES
+            ],
+        }
+    ]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    client.chat.completions.create(messages=messages, model="gpt-4o")
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"elapsed": elapsed, "peak": peak}
+
+
+def main() -> None:
+    print(f"{sum(len(image) for image in IMAGES) / 1_000_000:.0f}MB request body\n")
+    for name, stream_request_body in [("encoded as a whole", False), ("stream_request_body", True)]:
+        result = run(stream_request_body)
+        print(f"{name:<22} {result['elapsed'] * 1000:7.1f} ms  {result['peak'] / 1_000_000:6.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
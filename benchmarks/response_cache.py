@@ -0,0 +1,76 @@
+#!/usr/bin/env -S rye run python
+"""Measures how long repeatedly listing & retrieving models takes with & without a `ResponseCache`.
+
+The requests are sent to a local server which takes 20ms to respond.
+
+You can run this script from the root directory like so:
+`python benchmarks/response_cache.py`
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import tempfile
+import threading
+from typing import Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing_extensions import override
+
+from openai import OpenAI, SQLiteCache, ResponseCache
+
+N_REQUESTS = 50
+MODEL = {"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"}
+BODIES = {
+    "/v1/models": json.dumps({"object": "list", "data": [MODEL] * 50}).encode(),
+    "/v1/models/gpt-4o": json.dumps(MODEL).encode(),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        time.sleep(0.02)
+        body = BODIES[self.path]
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def run(base_url: str, cache: Optional[ResponseCache]) -> float:
+    client = OpenAI(api_key="My API Key", base_url=base_url, response_cache=cache)
+    start = time.perf_counter()
+    for _ in range(N_REQUESTS):
+        client.models.list()
+        client.models.retrieve("gpt-4o")
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    print(f"{N_REQUESTS} x models.list() & models.retrieve()\n")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, cache in [
+            ("no cache", None),
+            ("InMemoryCache", ResponseCache()),
+            ("SQLiteCache", ResponseCache(backend=SQLiteCache(f"{directory}/cache.sqlite3"))),
+        ]:
+            print(f"{name:<16} {run(base_url, cache) * 1000:8.1f} ms")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
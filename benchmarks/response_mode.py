@@ -0,0 +1,75 @@
+#!/usr/bin/env -S rye run python
+"""Compares the per-chunk cost of streaming a chat completion with `response_mode="model"` and `"raw"`.
+
+You can run this script from the root directory like so:
+`python benchmarks/response_mode.py`
+"""
+
+from __future__ import annotations
+
+import json
+import functools
+from typing import Dict, List, Callable
+from typing_extensions import Literal
+
+import httpx
+from _utils import report, measure
+
+from openai import OpenAI
+
+N_EVENTS = 5_000
+
+
+def make_body() -> bytes:
+    events: List[bytes] = []
+    for i in range(N_EVENTS):
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1694268190,
+            "model": "gpt-4o-mini",
+            "system_fingerprint": "fp_44709d6fcb",
+            "choices": [{"index": 0, "delta": {"content": f"token {i} "}, "logprobs": None, "finish_reason": None}],
+        }
+        events.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    events.append(b"data: [DONE]\n\n")
+    return b"".join(events)
+
+
+def stream_all(client: OpenAI) -> None:
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": "Say this is a test"}],
+        stream=True,
+    )
+    count = sum(1 for _ in stream)
+    assert count == N_EVENTS
+
+
+def main() -> None:
+    body = make_body()
+    client = OpenAI(
+        api_key="My API Key",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+            )
+        ),
+    )
+
+    modes: List[Literal["model", "raw"]] = ["model", "raw"]
+    fns: Dict[str, Callable[[], object]] = {
+        mode: functools.partial(stream_all, client.with_options(response_mode=mode)) for mode in modes
+    }
+
+    print(f"\nstreaming {N_EVENTS:,} chat completion chunks")
+    results = measure(fns, repeat=5)
+    for name, elapsed in results.items():
+        report(name, elapsed, events=N_EVENTS)
+
+    saved = (results["model"] - results["raw"]) / N_EVENTS
+    print(f"\nraw mode saves {saved * 1_000_000:.1f} µs per chunk")
+
+
+if __name__ == "__main__":
+    main()
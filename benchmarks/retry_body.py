@@ -0,0 +1,84 @@
+#!/usr/bin/env -S rye run python
+"""Measures the time & peak memory of retrying a request with a large body.
+
+The request contains an 8MB base64 encoded image and fails three times before it succeeds.
+The benchmark compares re-using the body encoded for the first attempt with re-building
+the whole request for every attempt.
+
+You can run this script from the root directory like so:
+`python benchmarks/retry_body.py`
+"""
+
+from __future__ import annotations
+
+import time
+import base64
+import tracemalloc
+from typing import Any, Dict
+
+import httpx
+
+from openai import OpenAI, RetryPolicy
+from openai._models import FinalRequestOptions
+
+FAILURES = 3
+IMAGE = base64.b64encode(b"\x00" * 6_000_000).decode()
+COMPLETION = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o",
+    "choices": [{"index": 0, "message": {"role": "assistant", "content": "hi"}, "finish_reason": "stop"}],
+}
+
+
+def run(rebuild_every_attempt: bool) -> Dict[str, float]:
+    attempts = 0
+
+    def handle(_: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts % (FAILURES + 1) != 0:
+            return httpx.Response(500)
+        return httpx.Response(200, json=COMPLETION)
+
+    client = OpenAI(
+        api_key="My API Key",
+        max_retries=FAILURES,
+        retry_policy=RetryPolicy(initial_delay=0, max_delay=0),
+        http_client=httpx.Client(transport=httpx.MockTransport(handle)),
+    )
+    if rebuild_every_attempt:
+
+        def rebuild(_request: httpx.Request, options: FinalRequestOptions, *, retries_taken: int) -> httpx.Request:
+            return client._build_request(options, retries_taken=retries_taken)
+
+        client._rebuild_request = rebuild  # type: ignore[method-assign,assignment]
+
+    messages: Any = [
+        {
+            "role": "user",
+            "content": [{"type": "image_url", "image_url": {"url": f"data:image/png;base64,{IMAGE}"}}],
+        }
+    ]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(5):
+        client.chat.completions.create(messages=messages, model="gpt-4o")
+    elapsed = (time.perf_counter() - start) / 5
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"elapsed": elapsed, "peak": peak}
+
+
+def main() -> None:
+    print(f"{len(IMAGE) / 1_000_000:.0f}MB request body, {FAILURES} failed attempts before each success\n")
+    for name, rebuild in [("rebuild every attempt", True), ("re-use encoded body", False)]:
+        result = run(rebuild)
+        print(f"{name:<24} {result['elapsed'] * 1000:7.1f} ms per request  {result['peak'] / 1_000_000:6.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
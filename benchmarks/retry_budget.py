@@ -0,0 +1,69 @@
+#!/usr/bin/env -S rye run python
+"""Compares the load sent to an API that is failing with & without a `RetryBudget` and `CircuitBreaker`.
+
+The API is simulated by a mock transport that responds with a 503 to every request while
+the application sends its requests number `HEALTHY` to `HEALTHY + OUTAGE`.
+
+You can run this script from the root directory like so:
+`python benchmarks/retry_budget.py`
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Callable, Optional
+
+import httpx
+
+from openai import OpenAI, RetryBudget, APIStatusError, CircuitBreaker, APIConnectionError
+
+N_REQUESTS = 1_000
+HEALTHY = 500
+OUTAGE = 300
+
+
+def run(retry_budget: Optional[RetryBudget], circuit_breaker: Optional[CircuitBreaker]) -> Dict[str, int]:
+    sent = 0
+    down = False
+
+    def handle(_: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        if down:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"object": "list", "data": []})
+
+    client = OpenAI(
+        api_key="My API Key",
+        retry_budget=retry_budget,
+        circuit_breaker=circuit_breaker,
+        http_client=httpx.Client(transport=httpx.MockTransport(handle)),
+    )
+    # the retry delay is irrelevant here
+    client._calculate_retry_timeout = lambda *_args, **_kwargs: 0  # type: ignore[method-assign]
+
+    failed = 0
+    for i in range(N_REQUESTS):
+        down = HEALTHY <= i < HEALTHY + OUTAGE
+        try:
+            client.models.list()
+        except (APIStatusError, APIConnectionError):
+            failed += 1
+
+    return {"sent": sent, "failed": failed}
+
+
+def main() -> None:
+    print(f"{N_REQUESTS:,} requests, the API is down for {OUTAGE} of them\n")
+
+    scenarios: Dict[str, Callable[[], Dict[str, int]]] = {
+        "max_retries=2": lambda: run(None, None),
+        "RetryBudget": lambda: run(RetryBudget(), None),
+        "RetryBudget + CircuitBreaker": lambda: run(RetryBudget(), CircuitBreaker(recovery_time=0.01)),
+    }
+    for name, scenario in scenarios.items():
+        result = scenario()
+        print(f"{name:<32} {result['sent']:6,} requests sent  {result['failed']:6,} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env -S rye run python
+"""Compares how synchronized the retries of many clients that fail at the same time are for each retry strategy.
+
+Every worker fails at t=0 and on each of its retries, the script reports the largest number of
+retries that land in the same 100ms window.
+
+You can run this script from the root directory like so:
+`python benchmarks/retry_policy.py`
+"""
+
+from __future__ import annotations
+
+from typing import List, Callable, Optional
+from collections import Counter
+
+from openai import OpenAI, RetryPolicy
+from openai._models import FinalRequestOptions
+
+N_WORKERS = 1_000
+MAX_RETRIES = 4
+WINDOW = 0.1
+
+TimeoutFn = Callable[[int, Optional[float]], float]
+
+
+def simulate(compute_timeout: TimeoutFn) -> List[float]:
+    """Returns the times at which the workers send their retries."""
+    retries: List[float] = []
+    for _ in range(N_WORKERS):
+        now = 0.0
+        previous: Optional[float] = None
+        for retries_taken in range(MAX_RETRIES):
+            previous = compute_timeout(retries_taken, previous)
+            now += previous
+            retries.append(now)
+    return retries
+
+
+def main() -> None:
+    client = OpenAI(api_key="My API Key", max_retries=MAX_RETRIES)
+    options = FinalRequestOptions.construct(method="get", url="/models")
+
+    def default(retries_taken: int, _previous: Optional[float]) -> float:
+        return client._calculate_retry_timeout(MAX_RETRIES - retries_taken, options)
+
+    strategies: List[tuple[str, TimeoutFn]] = [("default backoff", default)]
+    for strategy in ("full_jitter", "decorrelated_jitter"):
+        policy = RetryPolicy(strategy=strategy)
+
+        def compute(retries_taken: int, previous: Optional[float], policy: RetryPolicy = policy) -> float:
+            return policy.compute_timeout(
+                retries_taken=retries_taken, retry_after=None, previous_timeout=previous, elapsed=0
+            )
+
+        strategies.append((strategy, compute))
+
+    print(f"{N_WORKERS:,} workers failing at the same time, {MAX_RETRIES} retries each\n")
+    for name, compute_timeout in strategies:
+        retries = simulate(compute_timeout)
+        peak = max(Counter(int(at / WINDOW) for at in retries).values())
+        print(f"{name:<24} at most {peak:5,} retries per {WINDOW * 1000:.0f}ms, last retry after {max(retries):5.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env -S rye run python
+"""Compares SSE decoding throughput of `SSEDecoder` and `BufferedSSEDecoder`.
+
+You can run this script from the root directory like so:
+`python benchmarks/sse_decoder.py`
+"""
+
+from __future__ import annotations
+
+import json
+import functools
+from typing import List
+
+from _utils import report, measure
+
+from openai._streaming import SSEDecoder, BufferedSSEDecoder
+
+N_EVENTS = 20_000
+CHUNK_SIZES = [64, 1024, 16384]
+
+
+def make_events() -> List[bytes]:
+    events: List[bytes] = []
+    for i in range(N_EVENTS):
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1694268190,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": f"token {i} "}, "finish_reason": None}],
+        }
+        events.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    events.append(b"data: [DONE]\n\n")
+    return events
+
+
+def decode_all(decoder_cls: type[SSEDecoder], chunks: List[bytes]) -> None:
+    count = sum(1 for _ in decoder_cls().iter_bytes(iter(chunks)))
+    assert count == N_EVENTS + 1
+
+
+def main() -> None:
+    events = make_events()
+    body = b"".join(events)
+
+    # the API flushes every event separately, so "one event per chunk" is the most common shape
+    scenarios = [("one event per chunk", events)]
+    for chunk_size in CHUNK_SIZES:
+        chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        scenarios.append((f"{chunk_size} byte chunks", chunks))
+
+    for name, chunks in scenarios:
+        print(f"\n{len(body):,} bytes in {len(chunks):,} chunks ({name})")
+
+        results = measure(
+            {
+                decoder_cls.__name__: functools.partial(decode_all, decoder_cls, chunks)
+                for decoder_cls in (SSEDecoder, BufferedSSEDecoder)
+            }
+        )
+        for name, elapsed in results.items():
+            report(name, elapsed, events=N_EVENTS + 1, bytes=len(body))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env -S rye run python
+"""Compares iterating a stream with slow work for every event, with & without `stream_prefetch`.
+
+The events arrive with a delay, like tokens generated by the API, and the consumer spends about
+as long on every event, e.g. writing it to a socket, so that prefetching overlaps the two.
+
+You can run this script from the root directory like so:
+`python benchmarks/stream_prefetch.py`
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import functools
+from typing import Dict, Callable, Iterator, Optional
+
+import httpx
+from _utils import report, measure
+
+from openai import OpenAI
+
+N_EVENTS = 500
+DELAY = 0.001
+
+
+def body() -> Iterator[bytes]:
+    for i in range(N_EVENTS):
+        time.sleep(DELAY)
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1694268190,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": f"token {i} "}, "logprobs": None, "finish_reason": None}],
+        }
+        yield b"data: " + json.dumps(chunk).encode() + b"\n\n"
+    yield b"data: [DONE]\n\n"
+
+
+def stream_all(client: OpenAI) -> None:
+    stream = client.chat.completions.create(model="gpt-4o-mini", messages=[], stream=True)
+    count = 0
+    for _ in stream:
+        time.sleep(DELAY)
+        count += 1
+    assert count == N_EVENTS
+
+
+def main() -> None:
+    client = OpenAI(
+        api_key="My API Key",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(200, content=body(), headers={"Content-Type": "text/event-stream"})
+            )
+        ),
+    )
+
+    prefetch_sizes: Dict[str, Optional[int]] = {"no prefetch": None, "stream_prefetch=16": 16}
+    fns: Dict[str, Callable[[], object]] = {
+        name: functools.partial(stream_all, client.with_options(stream_prefetch=size))
+        for name, size in prefetch_sizes.items()
+    }
+
+    print(
+        f"\nstreaming {N_EVENTS:,} chat completion chunks, {DELAY * 1000:g}ms apart, with {DELAY * 1000:g}ms of work each"
+    )
+    for name, elapsed in measure(fns, repeat=3).items():
+        report(name, elapsed, events=N_EVENTS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env -S rye run python
+"""Compares reading the text of a streamed chat completion from its chunks, from the events of
+`chat.completions.stream()` & from `text_deltas()`.
+
+You can run this script from the root directory like so:
+`python benchmarks/text_deltas.py`
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Callable
+
+import httpx
+from _utils import report, measure
+
+from openai import OpenAI
+
+N_EVENTS = 10_000
+
+
+def make_body() -> bytes:
+    events: List[bytes] = []
+    for i in range(N_EVENTS):
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1694268190,
+            "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "delta": {"content": f"token {i} "}, "logprobs": None, "finish_reason": None}],
+        }
+        events.append(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+    events.append(b"data: [DONE]\n\n")
+    return b"".join(events)
+
+
+def read_chunks(client: OpenAI) -> str:
+    stream = client.chat.completions.create(model="gpt-4o-mini", messages=[], stream=True)
+    return "".join(chunk.choices[0].delta.content or "" for chunk in stream)
+
+
+def read_events(client: OpenAI) -> str:
+    with client.chat.completions.stream(model="gpt-4o-mini", messages=[]) as stream:
+        return "".join(event.delta for event in stream if event.type == "content.delta")
+
+
+def read_text_deltas(client: OpenAI) -> str:
+    with client.chat.completions.stream(model="gpt-4o-mini", messages=[]) as stream:
+        return "".join(stream.text_deltas())
+
+
+def main() -> None:
+    body = make_body()
+    client = OpenAI(
+        api_key="My API Key",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(
+                lambda _: httpx.Response(200, content=body, headers={"Content-Type": "text/event-stream"})
+            )
+        ),
+    )
+
+    fns: Dict[str, Callable[[], object]] = {
+        "chunks": lambda: read_chunks(client),
+        "stream() events": lambda: read_events(client),
+        "text_deltas()": lambda: read_text_deltas(client),
+    }
+    expected = "".join(f"token {i} " for i in range(N_EVENTS))
+    for fn in fns.values():
+        assert fn() == expected
+
+    print(f"\nreading the text of {N_EVENTS:,} chat completion chunks")
+    for name, elapsed in measure(fns, repeat=3).items():
+        report(name, elapsed, events=N_EVENTS)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env -S rye run python
+"""Measures how long it takes to transform chat completion request params with `maybe_transform()`.
+
+You can run this script from the root directory like so:
+`python benchmarks/transform.py`
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, List, Callable
+
+from _utils import report, measure
+
+from openai._utils import maybe_transform
+from openai.types.chat import completion_create_params
+
+N_MESSAGES = 500
+N_TOOLS = 128
+N_TOOL_PROPERTIES = 32
+
+
+def make_messages() -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = [{"role": "system", "content": "You are a helpful assistant."}]
+    for i in range(N_MESSAGES // 2):
+        messages.append(
+            {"role": "user", "content": [{"type": "text", "text": f"This is message number {i}, please respond."}]}
+        )
+        messages.append({"role": "assistant", "content": f"Sure, this is my response to message number {i}."})
+    return messages
+
+
+def make_tools() -> List[Dict[str, Any]]:
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": f"tool_{i}",
+                "description": "A tool with a large JSON schema",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        f"property_{j}": {
+                            "type": "string",
+                            "description": f"The property number {j}",
+                            "enum": ["a", "b"],
+                        }
+                        for j in range(N_TOOL_PROPERTIES)
+                    },
+                    "required": [f"property_{j}" for j in range(N_TOOL_PROPERTIES)],
+                    "additionalProperties": False,
+                },
+                "strict": True,
+            },
+        }
+        for i in range(N_TOOLS)
+    ]
+
+
+def transform(params: Dict[str, Any]) -> None:
+    maybe_transform(params, completion_create_params.CompletionCreateParamsNonStreaming)
+
+
+def main() -> None:
+    messages = make_messages()
+    tools = make_tools()
+
+    fns: Dict[str, Callable[[], object]] = {
+        f"{len(messages)} messages": functools.partial(transform, {"model": "gpt-4o", "messages": messages}),
+        f"{len(tools)} tools": functools.partial(
+            transform, {"model": "gpt-4o", "messages": messages[:2], "tools": tools}
+        ),
+        "both": functools.partial(transform, {"model": "gpt-4o", "messages": messages, "tools": tools}),
+    }
+
+    print("\ntransforming chat completion params")
+    for name, elapsed in measure(fns, repeat=20).items():
+        report(name, elapsed, requests=1)
+
+
+if __name__ == "__main__":
+    main()
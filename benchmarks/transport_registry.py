@@ -0,0 +1,76 @@
+#!/usr/bin/env -S rye run python
+"""Compares the number of connections opened by many per-tenant clients with & without a `TransportRegistry`.
+
+Each tenant has its own client, created with its own API key, and sends a few requests
+to a local server that counts the connections it accepts.
+
+You can run this script from the root directory like so:
+`python benchmarks/transport_registry.py`
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from typing import Set, Tuple, Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing_extensions import override
+
+from openai import OpenAI, TransportRegistry
+
+N_TENANTS = 200
+N_REQUESTS = 5
+BODY = json.dumps({"object": "list", "data": []}).encode()
+
+connections: Set[Tuple[str, int]] = set()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def run(base_url: str, registry: Optional[TransportRegistry]) -> int:
+    connections.clear()
+
+    clients = [
+        OpenAI(api_key=f"tenant-{tenant}", base_url=base_url, transport_registry=registry)
+        for tenant in range(N_TENANTS)
+    ]
+    for _ in range(N_REQUESTS):
+        for client in clients:
+            client.models.list()
+
+    for client in clients:
+        client.close()
+    if registry is not None:
+        registry.close()
+
+    return len(connections)
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    print(f"{N_TENANTS} tenant clients sending {N_REQUESTS} requests each\n")
+    for name, registry in [("a client each", None), ("TransportRegistry", TransportRegistry())]:
+        print(f"{name:<20} {run(base_url, registry):5,} connections opened")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
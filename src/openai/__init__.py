@@ -11,6 +11,9 @@ from ._types import NOT_GIVEN, Omit, NoneType, NotGiven, Transport, ProxiesTypes
 from ._utils import file_from_path
 from ._client import Client, OpenAI, Stream, Timeout, Transport, AsyncClient, AsyncOpenAI, AsyncStream, RequestOptions
 from ._models import BaseModel
+from ._caching import SQLiteCache, CacheBackend, InMemoryCache, ResponseCache, CachedResponse, CompletionCache
+from ._hedging import HedgingPolicy, HedgingStatus
+from ._retries import RetryBudget, RetryPolicy, CircuitStatus, CircuitBreaker, RetryBudgetStatus
 from ._version import __title__, __version__
 from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
 from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS
@@ -27,6 +30,7 @@ from ._exceptions import (
     AuthenticationError,
     InternalServerError,
     PermissionDeniedError,
+    CircuitBreakerOpenError,
     LengthFinishReasonError,
     UnprocessableEntityError,
     APIResponseValidationError,
@@ -34,6 +38,8 @@ from ._exceptions import (
     ContentFilterFinishReasonError,
 )
 from ._base_client import DefaultHttpxClient, DefaultAioHttpClient, DefaultAsyncHttpxClient
+from ._connections import KeepalivePolicy, TransportStatus, TransportRegistry, ConnectionPoolStatus
+from ._rate_limits import RateLimiter, RateLimitStatus
 from ._utils._logs import setup_logging as _setup_logging
 from ._legacy_response import HttpxBinaryResponseContent as HttpxBinaryResponseContent
 
@@ -64,6 +70,7 @@ __all__ = [
     "LengthFinishReasonError",
     "ContentFilterFinishReasonError",
     "InvalidWebhookSignatureError",
+    "CircuitBreakerOpenError",
     "Timeout",
     "RequestOptions",
     "Client",
@@ -80,6 +87,25 @@ __all__ = [
     "DefaultHttpxClient",
     "DefaultAsyncHttpxClient",
     "DefaultAioHttpClient",
+    "RateLimiter",
+    "RateLimitStatus",
+    "RetryPolicy",
+    "RetryBudget",
+    "RetryBudgetStatus",
+    "CircuitBreaker",
+    "CircuitStatus",
+    "HedgingPolicy",
+    "HedgingStatus",
+    "ConnectionPoolStatus",
+    "KeepalivePolicy",
+    "TransportRegistry",
+    "TransportStatus",
+    "ResponseCache",
+    "CompletionCache",
+    "CachedResponse",
+    "CacheBackend",
+    "InMemoryCache",
+    "SQLiteCache",
 ]
 
 if not _t.TYPE_CHECKING:
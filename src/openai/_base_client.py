@@ -8,7 +8,10 @@ import email
 import asyncio
 import inspect
 import logging
+import weakref
 import platform
+import functools
+import threading
 import email.utils
 from types import TracebackType
 from random import random
@@ -34,6 +37,7 @@ from typing_extensions import Literal, override, get_origin
 import anyio
 import httpx
 import distro
+import sniffio
 import pydantic
 from httpx import URL
 from pydantic import PrivateAttr
@@ -52,6 +56,7 @@ from ._types import (
     ResponseT,
     AnyMapping,
     PostParser,
+    JSONBackend,
     RequestFiles,
     HttpxSendArgs,
     RequestOptions,
@@ -60,7 +65,10 @@ from ._types import (
 )
 from ._utils import SensitiveHeadersFilter, is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
 from ._compat import PYDANTIC_V2, model_copy, model_dump
-from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
+from ._models import RawDict, GenericModel, FinalRequestOptions, validate_type, construct_type
+from ._caching import ResponseCache, CompletionCache
+from ._hedging import HedgingPolicy
+from ._retries import RetryState, RetryBudget, RetryPolicy, CircuitBreaker
 from ._response import (
     APIResponse,
     BaseAPIResponse,
@@ -73,17 +81,32 @@ from ._constants import (
     DEFAULT_MAX_RETRIES,
     INITIAL_RETRY_DELAY,
     RAW_RESPONSE_HEADER,
+    RESPONSE_MODE_HEADER,
     OVERRIDE_CAST_TO_HEADER,
     DEFAULT_CONNECTION_LIMITS,
 )
-from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder
+from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder, BufferedSSEDecoder
+from ._coalescing import SingleFlight, AsyncSingleFlight, coalescing_key
 from ._exceptions import (
     APIStatusError,
     APITimeoutError,
     APIConnectionError,
     APIResponseValidationError,
 )
+from ._connections import (
+    KeepalivePolicy,
+    SharedTransport,
+    TransportRegistry,
+    AsyncSharedTransport,
+    ConnectionPoolStatus,
+    resolve_http2,
+    get_pool_status,
+    warmup_connections,
+    async_warmup_connections,
+)
+from ._rate_limits import RateLimiter
 from ._legacy_response import LegacyAPIResponse
+from ._utils._json_stream import JSONBodyStream, AsyncJSONBodyStream
 
 log: logging.Logger = logging.getLogger(__name__)
 log.addFilter(SensitiveHeadersFilter())
@@ -366,6 +389,15 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     timeout: Union[float, Timeout, None]
     _strict_response_validation: bool
     _idempotency_header: str | None
+    _json_backend: JSONBackend | None
+    _stream_request_body: bool
+    _response_mode: Literal["model", "raw"]
+    _rate_limiter: RateLimiter | None
+    _retry_policy: RetryPolicy | None
+    _retry_budget: RetryBudget | None
+    _circuit_breaker: CircuitBreaker | None
+    _response_cache: ResponseCache | None
+    _completion_cache: CompletionCache | None
     _default_stream_cls: type[_DefaultStreamT] | None = None
 
     def __init__(
@@ -378,6 +410,15 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         timeout: float | Timeout | None = DEFAULT_TIMEOUT,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
     ) -> None:
         self._version = version
         self._base_url = self._enforce_trailing_slash(URL(base_url))
@@ -388,6 +429,15 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         self._strict_response_validation = _strict_response_validation
         self._idempotency_header = None
         self._platform: Platform | None = None
+        self._json_backend = json_backend
+        self._stream_request_body = stream_request_body
+        self._response_mode = response_mode
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+        self._response_cache = response_cache
+        self._completion_cache = completion_cache
 
         if max_retries is None:  # pyright: ignore[reportUnnecessaryComparison]
             raise TypeError(
@@ -470,7 +520,12 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         return merge_url
 
     def _make_sse_decoder(self) -> SSEDecoder | SSEBytesDecoder:
-        return SSEDecoder()
+        return BufferedSSEDecoder()
+
+    def _json_loads(self, data: str | bytes) -> Any:
+        if self._json_backend is None:
+            return json.loads(data)
+        return self._json_backend.loads(data)
 
     def _build_request(
         self,
@@ -536,6 +591,21 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         if is_body_allowed:
             if isinstance(json_data, bytes):
                 kwargs["content"] = json_data
+            elif (
+                self._stream_request_body
+                and is_given(json_data)
+                and json_data is not None
+                and not files
+                and "data" not in kwargs
+            ):
+                # encode the body while it is being sent, so that it never has to be held in memory as a whole
+                if isinstance(self._client, httpx.AsyncClient):
+                    kwargs["content"] = AsyncJSONBodyStream(json_data)
+                else:
+                    kwargs["content"] = JSONBodyStream(json_data)
+            elif self._json_backend is not None and json_data is not None and not files and "data" not in kwargs:
+                # let httpx handle multipart requests as usual, otherwise we encode the body ourselves
+                kwargs["content"] = self._json_backend.dumps(json_data)
             else:
                 kwargs["json"] = json_data if is_given(json_data) else None
             kwargs["files"] = files
@@ -544,7 +614,7 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             kwargs.pop("data", None)
 
         # TODO: report this error to httpx
-        return self._client.build_request(  # pyright: ignore[reportUnknownMemberType]
+        request = self._client.build_request(  # pyright: ignore[reportUnknownMemberType]
             headers=headers,
             timeout=self.timeout if isinstance(options.timeout, NotGiven) else options.timeout,
             method=options.method,
@@ -556,6 +626,46 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
             params=self.qs.stringify(cast(Mapping[str, Any], params)) if params else None,
             **kwargs,
         )
+        if self._rate_limiter is not None:
+            # estimate the tokens up front so that the budget can be reserved before the request is sent
+            self._rate_limiter.prepare(request, endpoint=options.url, json_data=json_data)
+        return request
+
+    def _rebuild_request(
+        self,
+        request: httpx.Request,
+        options: FinalRequestOptions,
+        *,
+        retries_taken: int,
+    ) -> httpx.Request:
+        """Builds another attempt of the given request, re-using its URL & encoded body.
+
+        The headers are built again from the options, without any from the previous attempt,
+        so that the retry count & any refreshed credentials are sent. Bodies that aren't held
+        in memory, e.g. multipart file uploads, are built again from the options.
+        """
+        if not isinstance(request.stream, httpx.ByteStream):
+            return self._build_request(options, retries_taken=retries_taken)
+
+        headers = self._build_headers(options, retries_taken=retries_taken)
+        # the content type depends on how the body was encoded
+        content_type = request.headers.get("Content-Type")
+        if content_type is None:
+            headers.pop("Content-Type", None)
+        else:
+            headers["Content-Type"] = content_type
+
+        retry = self._client.build_request(  # pyright: ignore[reportUnknownMemberType]
+            request.method,
+            request.url,
+            headers=headers,
+            # the encoded bytes are shared, not copied
+            content=request.content,
+            extensions=dict(request.extensions),
+        )
+        if self._rate_limiter is not None:
+            self._rate_limiter.prepare_retry(retry, previous=request)
+        return retry
 
     def _serialize_multipartform(self, data: Mapping[object, object]) -> dict[str, object]:
         items = self.qs.stringify_items(
@@ -604,9 +714,49 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
 
         return cast_to
 
+    def _is_raw_response_mode(self, options: FinalRequestOptions) -> bool:
+        if not is_given(options.headers):
+            return False
+
+        # the endpoints that support the `"raw"` response mode opt in with a temporary header,
+        # so that the helpers built on top of them, e.g. `.stream()`, can still opt out
+        headers = dict(options.headers)
+        response_mode = headers.pop(RESPONSE_MODE_HEADER, NOT_GIVEN)
+        if not is_given(response_mode):
+            return False
+
+        options.headers = headers
+        return response_mode == "raw"
+
     def _should_stream_response_body(self, request: httpx.Request) -> bool:
         return request.headers.get(RAW_RESPONSE_HEADER) == "stream"  # type: ignore[no-any-return]
 
+    def _get_cached_response(
+        self, request: httpx.Request, options: FinalRequestOptions, *, stream: bool
+    ) -> httpx.Response | None:
+        if self._completion_cache is not None:
+            response = self._completion_cache.get(
+                request, options, stream=stream or self._should_stream_response_body(request=request)
+            )
+            if response is not None:
+                return response
+
+        if self._response_cache is None or stream:
+            return None
+        return self._response_cache.get(request, path=options.url)
+
+    def _store_response(
+        self, request: httpx.Request, response: httpx.Response, options: FinalRequestOptions, *, stream: bool
+    ) -> None:
+        # the body of streamed responses hasn't been read yet
+        streamed = stream or self._should_stream_response_body(request=request)
+        if self._completion_cache is not None:
+            self._completion_cache.set(request, response, stream=streamed)
+
+        if self._response_cache is None or streamed:
+            return
+        self._response_cache.set(request, response, path=options.url)
+
     def _process_response_data(
         self,
         *,
@@ -617,9 +767,18 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         if data is None:
             return cast(ResponseT, None)
 
+        if self._rate_limiter is not None:
+            self._rate_limiter.record_usage(response, data)
+
         if cast_to is object:
             return cast(ResponseT, data)
 
+        if cast_to is RawDict:
+            # skip model construction entirely for the endpoints that were called in the `"raw"` response mode
+            if isinstance(data, dict):
+                return cast(ResponseT, RawDict(cast("dict[str, object]", data)))
+            return cast(ResponseT, data)
+
         try:
             if inspect.isclass(cast_to) and issubclass(cast_to, ModelBuilderProtocol):
                 return cast(ResponseT, cast_to.build(response=response, data=data))
@@ -728,11 +887,21 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         remaining_retries: int,
         options: FinalRequestOptions,
         response_headers: Optional[httpx.Headers] = None,
+        *,
+        retry_state: RetryState | None = None,
     ) -> float:
         max_retries = options.get_max_retries(self.max_retries)
+        retry_after = self._parse_retry_after_header(response_headers)
+
+        if self._retry_policy is not None:
+            return self._retry_policy.compute_timeout(
+                retries_taken=max_retries - remaining_retries,
+                retry_after=retry_after,
+                previous_timeout=retry_state.previous_timeout if retry_state is not None else None,
+                elapsed=time.monotonic() - retry_state.started_at if retry_state is not None else 0,
+            )
 
         # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-        retry_after = self._parse_retry_after_header(response_headers)
         if retry_after is not None and 0 < retry_after <= 60:
             return retry_after
 
@@ -782,6 +951,28 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         log.debug("Not retrying")
         return False
 
+    def _retry_allowed(self, retry_state: RetryState, *, retries_taken: int, response: httpx.Response | None) -> bool:
+        if self._retry_policy is not None and not self._retry_policy.allows_retry(
+            retries_taken=retries_taken,
+            status_code=response.status_code if response is not None else None,
+            elapsed=time.monotonic() - retry_state.started_at,
+        ):
+            return False
+
+        if self._retry_budget is None or self._retry_budget.acquire():
+            return True
+
+        log.debug("Not retrying as the retry budget is exhausted")
+        return False
+
+    def _record_attempt(self, request: httpx.Request, response: httpx.Response | None) -> None:
+        """Records the outcome of sending a request, a `None` response means that it failed with a connection error."""
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record(request, response)
+
+        if self._retry_budget is not None and response is not None and response.is_success:
+            self._retry_budget.record_success()
+
     def _idempotency_key(self) -> str:
         return f"stainless-python-retry-{uuid.uuid4()}"
 
@@ -807,6 +998,47 @@ else:
 
 
 class SyncHttpxClientWrapper(DefaultHttpxClient):
+    _keepalive: KeepalivePolicy | None
+    _last_request_at: float
+    _pinger: threading.Thread | None
+    _pinger_stopped: threading.Event
+
+    def __init__(self, *, keepalive: KeepalivePolicy | None = None, **kwargs: Any) -> None:
+        if keepalive is not None:
+            kwargs.setdefault("limits", keepalive.limits())
+        super().__init__(**kwargs)
+        self._keepalive = keepalive
+        self._last_request_at = time.monotonic()
+        self._pinger = None
+        self._pinger_lock = threading.Lock()
+        self._pinger_stopped = threading.Event()
+
+    @override
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        self._last_request_at = time.monotonic()
+        if self._keepalive is not None:
+            self._start_pinger(self._keepalive)
+        return super().send(request, **kwargs)
+
+    @override
+    def close(self) -> None:
+        self._pinger_stopped.set()
+        super().close()
+
+    def _start_pinger(self, keepalive: KeepalivePolicy) -> None:
+        with self._pinger_lock:
+            if self._pinger is not None and self._pinger.is_alive():
+                return
+
+            # the thread only holds a weak reference so that the client can still be garbage collected
+            self._pinger = threading.Thread(
+                target=_keep_connections_alive,
+                args=(weakref.ref(self), keepalive, self._pinger_stopped),
+                name="openai-keepalive",
+                daemon=True,
+            )
+            self._pinger.start()
+
     def __del__(self) -> None:
         if self.is_closed:
             return
@@ -817,8 +1049,35 @@ class SyncHttpxClientWrapper(DefaultHttpxClient):
             pass
 
 
+def _keep_connections_alive(
+    ref: weakref.ref[SyncHttpxClientWrapper], keepalive: KeepalivePolicy, stopped: threading.Event
+) -> None:
+    while not stopped.wait(keepalive.interval):
+        client = ref()
+        if client is None or client.is_closed:
+            return
+
+        if time.monotonic() - client._last_request_at >= keepalive.idle_timeout:
+            log.debug("Not pinging connections as no request has been made for %f seconds", keepalive.idle_timeout)
+            return
+
+        requests = [client.build_request("HEAD", client.base_url) for _ in range(keepalive.connections)]
+        try:
+            # bypass `send()` as pings don't count as requests
+            warmup_connections(functools.partial(httpx.Client.send, client), requests)
+        except Exception:
+            log.debug("Failed to ping connections", exc_info=True)
+
+        del client
+
+
 class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
     _client: httpx.Client
+    _http2: bool | Literal["auto"]
+    _keepalive: KeepalivePolicy | None
+    _transport_registry: TransportRegistry | None
+    _single_flight: SingleFlight | None
+    _stream_prefetch: int | None
     _default_stream_cls: type[Stream[Any]] | None = None
 
     def __init__(
@@ -831,6 +1090,20 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         http_client: httpx.Client | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         _strict_response_validation: bool,
     ) -> None:
         if not is_given(timeout):
@@ -851,6 +1124,9 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 f"Invalid `http_client` argument; Expected an instance of `httpx.Client` but got {type(http_client)}"
             )
 
+        if stream_prefetch is not None and stream_prefetch < 0:
+            raise ValueError(f"Expected `stream_prefetch` to be at least 0 but got {stream_prefetch}")
+
         super().__init__(
             version=version,
             # cast to a valid type because mypy doesn't understand our type narrowing
@@ -859,17 +1135,75 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
             _strict_response_validation=_strict_response_validation,
         )
+        self._http2 = http2
+        self._keepalive = keepalive
+        # the registry is only used when the http client is created here
+        self._transport_registry = transport_registry if http_client is None else None
         self._client = http_client or SyncHttpxClientWrapper(
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            http2=resolve_http2(http2),
+            keepalive=keepalive,
+            transport=None
+            if transport_registry is None
+            else transport_registry.transport(self.base_url, http2=resolve_http2(http2)),
         )
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._stream_prefetch = stream_prefetch
 
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    def warmup(self, n_connections: int | None = None) -> None:
+        """Opens connections to the `base_url` ahead of the first request, e.g. when a worker starts.
+
+        This sends `n_connections` concurrent `HEAD` requests, which defaults to the number of
+        connections kept open by the `keepalive` policy.
+        """
+        if n_connections is None:
+            n_connections = self._keepalive.connections if self._keepalive is not None else 1
+        elif n_connections < 1:
+            raise ValueError(f"Expected `n_connections` to be at least 1 but got {n_connections}")
+
+        requests = [
+            self._client.build_request("HEAD", self.base_url, timeout=self.timeout) for _ in range(n_connections)
+        ]
+        try:
+            warmup_connections(self._client.send, requests)
+        except httpx.TimeoutException as err:
+            raise APITimeoutError(request=err.request) from err
+        except httpx.RequestError as err:
+            raise APIConnectionError(request=err.request) from err
+
+    def in_flight_requests(self) -> int | None:
+        """Returns the number of requests made by this client that are currently waiting for or reading a response.
+
+        Only requests sent through a `transport_registry` are counted, `None` is returned otherwise.
+        """
+        transport = getattr(self._client, "_transport", None)
+        if isinstance(transport, SharedTransport):
+            return transport.in_flight
+        return None
+
+    def connection_pool_status(self) -> ConnectionPoolStatus | None:
+        """Returns the number of connections & concurrent requests in the connection pool.
+
+        Returns `None` if the client wasn't created with the default transport.
+        """
+        return get_pool_status(self._client)
+
     def close(self) -> None:
         """Close the underlying HTTPX client.
 
@@ -945,8 +1279,29 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         *,
         stream: bool = False,
         stream_cls: type[_StreamT] | None = None,
+    ) -> ResponseT | _StreamT:
+        if self._single_flight is not None:
+            key = coalescing_key(
+                cast_to, options, stream=stream, base_url=str(self.base_url), default_headers=self.default_headers
+            )
+            if key is not None:
+                return self._single_flight.do(key, lambda: self._request(cast_to, options, stream=False))
+
+        return self._request(cast_to, options, stream=stream, stream_cls=stream_cls)
+
+    def _request(
+        self,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        *,
+        stream: bool,
+        stream_cls: type[_StreamT] | None = None,
     ) -> ResponseT | _StreamT:
         cast_to = self._maybe_override_cast_to(cast_to, options)
+        if self._is_raw_response_mode(options):
+            cast_to = cast(Type[ResponseT], RawDict)
+            if stream_cls is not None:
+                stream_cls = cast("type[_StreamT]", Stream[RawDict])
 
         # create a copy of the options we were given so that if the
         # options are mutated later & we then retry, the retries are
@@ -959,13 +1314,19 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
+        retry_state = RetryState()
+        request: httpx.Request | None = None
         retries_taken = 0
         for retries_taken in range(max_retries + 1):
             options = model_copy(input_options)
             options = self._prepare_options(options)
 
             remaining_retries = max_retries - retries_taken
-            request = self._build_request(options, retries_taken=retries_taken)
+            if request is None:
+                request = self._build_request(options, retries_taken=retries_taken)
+            else:
+                # retries only rebuild the headers, the body is encoded once
+                request = self._rebuild_request(request, options, retries_taken=retries_taken)
             self._prepare_request(request)
 
             kwargs: HttpxSendArgs = {}
@@ -975,6 +1336,16 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             if options.follow_redirects is not None:
                 kwargs["follow_redirects"] = options.follow_redirects
 
+            response = self._get_cached_response(request, options, stream=stream)
+            if response is not None:
+                break
+
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.acquire(request)
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire(request)
+
             log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
             response = None
@@ -986,13 +1357,17 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 )
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._retry_allowed(
+                    retry_state, retries_taken=retries_taken, response=None
+                ):
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
                         options=input_options,
                         response=None,
+                        retry_state=retry_state,
                     )
                     continue
 
@@ -1000,13 +1375,17 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 raise APITimeoutError(request=request) from err
             except Exception as err:
                 log.debug("Encountered Exception", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._retry_allowed(
+                    retry_state, retries_taken=retries_taken, response=None
+                ):
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
                         options=input_options,
                         response=None,
+                        retry_state=retry_state,
                     )
                     continue
 
@@ -1023,18 +1402,27 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             )
             log.debug("request_id: %s", response.headers.get("x-request-id"))
 
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response)
+            self._record_attempt(request, response)
+
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
                 log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-                if remaining_retries > 0 and self._should_retry(err.response):
+                if (
+                    remaining_retries > 0
+                    and self._should_retry(err.response)
+                    and self._retry_allowed(retry_state, retries_taken=retries_taken, response=err.response)
+                ):
                     err.response.close()
                     self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
                         options=input_options,
                         response=response,
+                        retry_state=retry_state,
                     )
                     continue
 
@@ -1046,6 +1434,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 log.debug("Re-raising status error")
                 raise self._make_status_error_from_response(err.response) from None
 
+            self._store_response(request, response, options, stream=stream)
             break
 
         assert response is not None, "could not resolve response (should never happen)"
@@ -1059,7 +1448,13 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         )
 
     def _sleep_for_retry(
-        self, *, retries_taken: int, max_retries: int, options: FinalRequestOptions, response: httpx.Response | None
+        self,
+        *,
+        retries_taken: int,
+        max_retries: int,
+        options: FinalRequestOptions,
+        response: httpx.Response | None,
+        retry_state: RetryState | None = None,
     ) -> None:
         remaining_retries = max_retries - retries_taken
         if remaining_retries == 1:
@@ -1067,7 +1462,11 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         else:
             log.debug("%i retries left", remaining_retries)
 
-        timeout = self._calculate_retry_timeout(remaining_retries, options, response.headers if response else None)
+        timeout = self._calculate_retry_timeout(
+            remaining_retries, options, response.headers if response else None, retry_state=retry_state
+        )
+        if retry_state is not None:
+            retry_state.previous_timeout = timeout
         log.info("Retrying request to %s in %f seconds", options.url, timeout)
 
         time.sleep(timeout)
@@ -1351,6 +1750,41 @@ else:
 
 
 class AsyncHttpxClientWrapper(DefaultAsyncHttpxClient):
+    _keepalive: KeepalivePolicy | None
+    _last_request_at: float
+    _pinger: asyncio.Task[None] | None
+
+    def __init__(self, *, keepalive: KeepalivePolicy | None = None, **kwargs: Any) -> None:
+        if keepalive is not None:
+            kwargs.setdefault("limits", keepalive.limits())
+        super().__init__(**kwargs)
+        self._keepalive = keepalive
+        self._last_request_at = time.monotonic()
+        self._pinger = None
+
+    @override
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        self._last_request_at = time.monotonic()
+        if self._keepalive is not None and (self._pinger is None or self._pinger.done()):
+            self._start_pinger(self._keepalive)
+        return await super().send(request, **kwargs)
+
+    @override
+    async def aclose(self) -> None:
+        if self._pinger is not None:
+            self._pinger.cancel()
+        await super().aclose()
+
+    def _start_pinger(self, keepalive: KeepalivePolicy) -> None:
+        # TODO(someday): support non asyncio runtimes here
+        if sniffio.current_async_library() != "asyncio":
+            return
+
+        # the task only holds a weak reference so that the client can still be garbage collected
+        self._pinger = asyncio.get_running_loop().create_task(
+            _async_keep_connections_alive(weakref.ref(self), keepalive)
+        )
+
     def __del__(self) -> None:
         if self.is_closed:
             return
@@ -1362,8 +1796,35 @@ class AsyncHttpxClientWrapper(DefaultAsyncHttpxClient):
             pass
 
 
+async def _async_keep_connections_alive(ref: weakref.ref[AsyncHttpxClientWrapper], keepalive: KeepalivePolicy) -> None:
+    while True:
+        await asyncio.sleep(keepalive.interval)
+
+        client = ref()
+        if client is None or client.is_closed:
+            return
+
+        if time.monotonic() - client._last_request_at >= keepalive.idle_timeout:
+            log.debug("Not pinging connections as no request has been made for %f seconds", keepalive.idle_timeout)
+            return
+
+        requests = [client.build_request("HEAD", client.base_url) for _ in range(keepalive.connections)]
+        try:
+            # bypass `send()` as pings don't count as requests
+            await async_warmup_connections(functools.partial(httpx.AsyncClient.send, client), requests)
+        except Exception:
+            log.debug("Failed to ping connections", exc_info=True)
+
+        del client
+
+
 class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
     _client: httpx.AsyncClient
+    _hedging: HedgingPolicy | None
+    _http2: bool | Literal["auto"]
+    _keepalive: KeepalivePolicy | None
+    _transport_registry: TransportRegistry | None
+    _single_flight: AsyncSingleFlight | None
     _default_stream_cls: type[AsyncStream[Any]] | None = None
 
     def __init__(
@@ -1377,6 +1838,20 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         http_client: httpx.AsyncClient | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1404,17 +1879,75 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
             _strict_response_validation=_strict_response_validation,
         )
+        self._http2 = http2
+        self._keepalive = keepalive
+        # the registry is only used when the http client is created here
+        self._transport_registry = transport_registry if http_client is None else None
         self._client = http_client or AsyncHttpxClientWrapper(
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            http2=resolve_http2(http2),
+            keepalive=keepalive,
+            transport=None
+            if transport_registry is None
+            else transport_registry.async_transport(self.base_url, http2=resolve_http2(http2)),
         )
+        self._hedging = hedging
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
 
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    async def warmup(self, n_connections: int | None = None) -> None:
+        """Opens connections to the `base_url` ahead of the first request, e.g. when a worker starts.
+
+        This sends `n_connections` concurrent `HEAD` requests, which defaults to the number of
+        connections kept open by the `keepalive` policy.
+        """
+        if n_connections is None:
+            n_connections = self._keepalive.connections if self._keepalive is not None else 1
+        elif n_connections < 1:
+            raise ValueError(f"Expected `n_connections` to be at least 1 but got {n_connections}")
+
+        requests = [
+            self._client.build_request("HEAD", self.base_url, timeout=self.timeout) for _ in range(n_connections)
+        ]
+        try:
+            await async_warmup_connections(self._client.send, requests)
+        except httpx.TimeoutException as err:
+            raise APITimeoutError(request=err.request) from err
+        except httpx.RequestError as err:
+            raise APIConnectionError(request=err.request) from err
+
+    def in_flight_requests(self) -> int | None:
+        """Returns the number of requests made by this client that are currently waiting for or reading a response.
+
+        Only requests sent through a `transport_registry` are counted, `None` is returned otherwise.
+        """
+        transport = getattr(self._client, "_transport", None)
+        if isinstance(transport, AsyncSharedTransport):
+            return transport.in_flight
+        return None
+
+    def connection_pool_status(self) -> ConnectionPoolStatus | None:
+        """Returns the number of connections & concurrent requests in the connection pool.
+
+        Returns `None` if the client wasn't created with the default transport.
+        """
+        return get_pool_status(self._client)
+
     async def close(self) -> None:
         """Close the underlying HTTPX client.
 
@@ -1451,6 +1984,83 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         """
         return None
 
+    async def _send_hedged(
+        self,
+        request: httpx.Request,
+        *,
+        options: FinalRequestOptions,
+        retries_taken: int,
+        stream: bool,
+        kwargs: HttpxSendArgs,
+    ) -> httpx.Response:
+        """Sends the request, and a second identical one if the first doesn't respond within the hedging delay.
+
+        The response that arrives first is returned and the other request is cancelled.
+        """
+        assert self._hedging is not None
+        hedging = self._hedging
+
+        path = hedging.match(options.url)
+        delay = hedging.delay(path) if path is not None else None
+        if path is None or delay is None:
+            start = time.monotonic()
+            response = await self._client.send(request, stream=stream, **kwargs)
+            if path is not None:
+                hedging.record(path, time.monotonic() - start)
+            return response
+
+        responses: list[tuple[httpx.Response, float, bool]] = []
+        errors: list[Exception] = []
+        finished = anyio.Event()
+        started = 0
+        done = 0
+
+        async def attempt(attempt_request: httpx.Request, *, is_hedge: bool) -> None:
+            nonlocal done
+            start = time.monotonic()
+            try:
+                response = await self._client.send(attempt_request, stream=stream, **kwargs)
+            except Exception as err:
+                errors.append(err)
+            else:
+                if responses:
+                    # both requests responded before the slower one could be cancelled
+                    with anyio.CancelScope(shield=True):
+                        await response.aclose()
+                    return
+                responses.append((response, time.monotonic() - start, is_hedge))
+
+            done += 1
+            if responses or done == started:
+                finished.set()
+
+        async with anyio.create_task_group() as tg:
+            started += 1
+            tg.start_soon(functools.partial(attempt, request, is_hedge=False))
+
+            with anyio.move_on_after(delay):
+                await finished.wait()
+
+            if not finished.is_set():
+                # the same options are used so the idempotency key is shared by both requests
+                hedge_request = self._rebuild_request(request, options, retries_taken=retries_taken)
+                await self._prepare_request(hedge_request)
+
+                log.debug("Sending hedged HTTP Request: %s %s", hedge_request.method, hedge_request.url)
+                started += 1
+                tg.start_soon(functools.partial(attempt, hedge_request, is_hedge=True))
+                await finished.wait()
+
+            # cancel the request that lost, which also closes its connection
+            tg.cancel_scope.cancel()
+
+        if not responses:
+            raise errors[0]
+
+        response, latency, is_hedge = responses[0]
+        hedging.record(path, latency, hedged=started > 1, hedge_won=is_hedge)
+        return response
+
     @overload
     async def request(
         self,
@@ -1487,6 +2097,23 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         *,
         stream: bool = False,
         stream_cls: type[_AsyncStreamT] | None = None,
+    ) -> ResponseT | _AsyncStreamT:
+        if self._single_flight is not None:
+            key = coalescing_key(
+                cast_to, options, stream=stream, base_url=str(self.base_url), default_headers=self.default_headers
+            )
+            if key is not None:
+                return await self._single_flight.do(key, lambda: self._request(cast_to, options, stream=False))
+
+        return await self._request(cast_to, options, stream=stream, stream_cls=stream_cls)
+
+    async def _request(
+        self,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        *,
+        stream: bool,
+        stream_cls: type[_AsyncStreamT] | None = None,
     ) -> ResponseT | _AsyncStreamT:
         if self._platform is None:
             # `get_platform` can make blocking IO calls so we
@@ -1494,6 +2121,10 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             self._platform = await asyncify(get_platform)()
 
         cast_to = self._maybe_override_cast_to(cast_to, options)
+        if self._is_raw_response_mode(options):
+            cast_to = cast(Type[ResponseT], RawDict)
+            if stream_cls is not None:
+                stream_cls = cast("type[_AsyncStreamT]", AsyncStream[RawDict])
 
         # create a copy of the options we were given so that if the
         # options are mutated later & we then retry, the retries are
@@ -1506,13 +2137,19 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
+        retry_state = RetryState()
+        request: httpx.Request | None = None
         retries_taken = 0
         for retries_taken in range(max_retries + 1):
             options = model_copy(input_options)
             options = await self._prepare_options(options)
 
             remaining_retries = max_retries - retries_taken
-            request = self._build_request(options, retries_taken=retries_taken)
+            if request is None:
+                request = self._build_request(options, retries_taken=retries_taken)
+            else:
+                # retries only rebuild the headers, the body is encoded once
+                request = self._rebuild_request(request, options, retries_taken=retries_taken)
             await self._prepare_request(request)
 
             kwargs: HttpxSendArgs = {}
@@ -1522,24 +2159,47 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             if options.follow_redirects is not None:
                 kwargs["follow_redirects"] = options.follow_redirects
 
+            response = self._get_cached_response(request, options, stream=stream)
+            if response is not None:
+                break
+
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.acquire(request)
+
+            if self._rate_limiter is not None:
+                await self._rate_limiter.async_acquire(request)
+
             log.debug("Sending HTTP Request: %s %s", request.method, request.url)
 
             response = None
             try:
-                response = await self._client.send(
-                    request,
-                    stream=stream or self._should_stream_response_body(request=request),
-                    **kwargs,
-                )
+                if self._hedging is not None:
+                    response = await self._send_hedged(
+                        request,
+                        options=options,
+                        retries_taken=retries_taken,
+                        stream=stream or self._should_stream_response_body(request=request),
+                        kwargs=kwargs,
+                    )
+                else:
+                    response = await self._client.send(
+                        request,
+                        stream=stream or self._should_stream_response_body(request=request),
+                        **kwargs,
+                    )
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._retry_allowed(
+                    retry_state, retries_taken=retries_taken, response=None
+                ):
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
                         options=input_options,
                         response=None,
+                        retry_state=retry_state,
                     )
                     continue
 
@@ -1547,13 +2207,17 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 raise APITimeoutError(request=request) from err
             except Exception as err:
                 log.debug("Encountered Exception", exc_info=True)
+                self._record_attempt(request, None)
 
-                if remaining_retries > 0:
+                if remaining_retries > 0 and self._retry_allowed(
+                    retry_state, retries_taken=retries_taken, response=None
+                ):
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
                         options=input_options,
                         response=None,
+                        retry_state=retry_state,
                     )
                     continue
 
@@ -1570,18 +2234,27 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             )
             log.debug("request_id: %s", response.headers.get("x-request-id"))
 
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(response)
+            self._record_attempt(request, response)
+
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
                 log.debug("Encountered httpx.HTTPStatusError", exc_info=True)
 
-                if remaining_retries > 0 and self._should_retry(err.response):
+                if (
+                    remaining_retries > 0
+                    and self._should_retry(err.response)
+                    and self._retry_allowed(retry_state, retries_taken=retries_taken, response=err.response)
+                ):
                     await err.response.aclose()
                     await self._sleep_for_retry(
                         retries_taken=retries_taken,
                         max_retries=max_retries,
                         options=input_options,
                         response=response,
+                        retry_state=retry_state,
                     )
                     continue
 
@@ -1593,6 +2266,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 log.debug("Re-raising status error")
                 raise self._make_status_error_from_response(err.response) from None
 
+            self._store_response(request, response, options, stream=stream)
             break
 
         assert response is not None, "could not resolve response (should never happen)"
@@ -1606,7 +2280,13 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         )
 
     async def _sleep_for_retry(
-        self, *, retries_taken: int, max_retries: int, options: FinalRequestOptions, response: httpx.Response | None
+        self,
+        *,
+        retries_taken: int,
+        max_retries: int,
+        options: FinalRequestOptions,
+        response: httpx.Response | None,
+        retry_state: RetryState | None = None,
     ) -> None:
         remaining_retries = max_retries - retries_taken
         if remaining_retries == 1:
@@ -1614,7 +2294,11 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         else:
             log.debug("%i retries left", remaining_retries)
 
-        timeout = self._calculate_retry_timeout(remaining_retries, options, response.headers if response else None)
+        timeout = self._calculate_retry_timeout(
+            remaining_retries, options, response.headers if response else None, retry_state=retry_state
+        )
+        if retry_state is not None:
+            retry_state.previous_timeout = timeout
         log.info("Retrying request to %s in %f seconds", options.url, timeout)
 
         await anyio.sleep(timeout)
@@ -0,0 +1,524 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+import hashlib
+import logging
+import sqlite3
+import datetime
+import threading
+from typing import List, Tuple, Union, Mapping, Callable, Iterator, Optional, Sequence, NamedTuple, AsyncIterator, cast
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+from typing_extensions import Protocol, override
+
+import httpx
+
+from ._utils import is_mapping
+from ._models import FinalRequestOptions
+
+__all__ = ["ResponseCache", "CompletionCache", "CachedResponse", "CacheBackend", "InMemoryCache", "SQLiteCache"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+DEFAULT_COMPLETION_PATHS = ("/chat/completions", "/responses", "/embeddings")
+
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    "/models": 600.0,
+    "/models/": 600.0,
+}
+
+# the statuses of objects that are still being processed, which change with every poll
+_PENDING_STATUSES = frozenset(
+    {"queued", "in_progress", "uploaded", "validating", "finalizing", "cancelling", "requires_action"}
+)
+
+# the request headers that identify who a response belongs to, responses are
+# only shared between requests made with the same credentials
+_IDENTITY_HEADERS = ("authorization", "api-key", "openai-organization", "openai-project")
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+    expires_at: float
+    """The unix timestamp after which the response is stale"""
+
+    @property
+    def size(self) -> int:
+        """Roughly how many bytes the response takes up"""
+        return len(self.content) + sum(len(name) + len(value) for name, value in self.headers)
+
+
+class CacheBackend(Protocol):
+    """Stores cached responses, e.g. in memory or in a file.
+
+    Keys are hashes that don't contain any credentials, the expiry of the
+    responses is checked by the `ResponseCache` that uses the backend.
+    """
+
+    def get(self, key: str) -> Optional[CachedResponse]: ...
+
+    def set(self, key: str, response: CachedResponse) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryCache:
+    """Keeps responses in memory, evicting the least recently used ones once they take up more than `max_size` bytes."""
+
+    def __init__(self, *, max_size: int = 64 * 1024 * 1024) -> None:
+        self._max_size = max_size
+        self._size = 0
+        self._lock = threading.Lock()
+        self._responses: OrderedDict[str, CachedResponse] = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """How many bytes the stored responses take up"""
+        return self._size
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if response.size > self._max_size:
+            return
+
+        with self._lock:
+            previous = self._responses.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._responses[key] = response
+            self._size += response.size
+            while self._size > self._max_size:
+                _, evicted = self._responses.popitem(last=False)
+                self._size -= evicted.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            response = self._responses.pop(key, None)
+            if response is not None:
+                self._size -= response.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self._size = 0
+
+
+class SQLiteCache:
+    """Keeps responses in an SQLite database file, so that they can be shared between processes & restarts.
+
+    The least recently used responses are evicted once they take up more than `max_size` bytes.
+    """
+
+    def __init__(self, path: str, *, max_size: int = 256 * 1024 * 1024) -> None:
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT, content BLOB, "
+            "expires_at REAL, used_at REAL, size INTEGER)"
+        )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status_code, headers, content, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+
+        status_code, headers, content, expires_at = row
+        return CachedResponse(
+            status_code=status_code,
+            headers=[(name, value) for name, value in json.loads(headers)],
+            content=content,
+            expires_at=expires_at,
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if response.size > self._max_size:
+            return
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    response.content,
+                    response.expires_at,
+                    time.time(),
+                    response.size,
+                ),
+            )
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _evict(self) -> None:
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+
+        (size,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if size <= self._max_size:
+            return
+
+        # delete the least recently used responses until the rest fits
+        evicted: List[Tuple[str]] = []
+        for key, entry_size in self._db.execute("SELECT key, size FROM responses ORDER BY used_at"):
+            if size <= self._max_size:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+
+class ResponseCache:
+    """Caches successful responses to `GET` requests to read-only endpoints for a fixed time.
+
+    Responses are cached per endpoint for the number of seconds given in `ttls`, which
+    defaults to the `models` endpoints. Responses from the cache are handled like any other,
+    so `.with_raw_response` returns their original headers & request ID. Responses are never
+    shared between different API keys, organizations or projects.
+
+    Objects that are still being processed, e.g. a file with the `"uploaded"` status, and the
+    requests of the `*_and_poll()` helpers are never cached. A successful `POST` or `DELETE`
+    request to a cached path removes the cached response to that path.
+
+    ```py
+    from openai import OpenAI, ResponseCache, SQLiteCache
+
+    client = OpenAI(response_cache=ResponseCache(backend=SQLiteCache("openai-cache.sqlite3")))
+    ```
+
+    A request can skip the cache by sending a `Cache-Control: no-cache` header, its response is still cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: Mapping[str, float] = DEFAULT_CACHE_TTLS,
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        """
+        Args:
+            ttls: How long, in seconds, responses are cached for per path, a path ending with `/`
+                matches every path it prefixes. The longest matching path is used.
+            backend: Where responses are stored, defaults to an `InMemoryCache`.
+        """
+        # longer paths are more specific, so they're matched first
+        self._ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+        self.backend: CacheBackend = backend if backend is not None else InMemoryCache()
+
+    def ttl(self, url: str) -> Optional[float]:
+        """Returns how long responses from the given request path are cached for, `None` if they aren't cached."""
+        for path, ttl in self._ttls:
+            if _matches(url, path):
+                return ttl
+        return None
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def get(self, request: httpx.Request, *, path: str) -> Optional[httpx.Response]:
+        """Returns a fresh cached response for the given request, if there is one."""
+        if request.method != "GET" or self.ttl(path) is None:
+            return None
+        if "no-cache" in request.headers.get("cache-control", "") or _is_poll(request):
+            return None
+
+        key = _cache_key(request)
+        cached = self.backend.get(key)
+        if cached is None:
+            return None
+
+        if cached.expires_at <= time.time():
+            self.backend.delete(key)
+            return None
+
+        log.debug("Using cached response for %s %s", request.method, request.url)
+        return _to_response(cached, request, stream=False)
+
+    def set(self, request: httpx.Request, response: httpx.Response, *, path: str) -> None:
+        """Stores the given response if it is a successful response to a cached endpoint."""
+        ttl = self.ttl(path)
+        if ttl is None or not response.is_success:
+            return
+
+        if request.method != "GET":
+            # e.g. the object was updated or deleted, the key doesn't depend on the method
+            self.backend.delete(_cache_key(request))
+            return
+
+        if response.status_code != 200 or _is_poll(request) or _is_pending(response):
+            return
+
+        self.backend.set(
+            _cache_key(request),
+            CachedResponse(
+                status_code=response.status_code,
+                headers=_decoded_headers(response),
+                content=response.content,
+                expires_at=time.time() + ttl,
+            ),
+        )
+
+
+class CompletionCache:
+    """Caches the responses to identical requests, e.g. to re-run evals without calling the API again.
+
+    Requests are identified by their URL & a canonical form of their JSON body, which doesn't
+    depend on the order of the arguments, so every request with the same model, messages,
+    tools, temperature, seed etc. receives the same response, including streamed responses
+    which are recorded and replayed event by event.
+
+    Like the `ResponseCache`, responses are never shared between different API keys, organizations
+    or projects unless `share_across_credentials=True` is given, and are kept for `ttl` seconds,
+    or forever by default.
+
+    ```py
+    from openai import OpenAI, SQLiteCache, CompletionCache
+
+    client = OpenAI(completion_cache=CompletionCache(backend=SQLiteCache(".openai-cache.sqlite3")))
+    ```
+
+    A request can skip the cache by sending a `Cache-Control: no-cache` header, its response is still cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        paths: Sequence[str] = DEFAULT_COMPLETION_PATHS,
+        share_across_credentials: bool = False,
+    ) -> None:
+        """
+        Args:
+            backend: Where responses are stored, defaults to an `InMemoryCache`.
+            ttl: How long, in seconds, responses are kept, `None` to keep them until they are evicted.
+            paths: The paths of the endpoints that are cached, a path ending with `/` matches every path it prefixes.
+            share_across_credentials: Whether requests made with different API keys, organizations or
+                projects receive each other's responses, e.g. to share recorded evals within a team.
+        """
+        self.backend: CacheBackend = backend if backend is not None else InMemoryCache()
+        self._ttl = ttl
+        self._paths = tuple(paths)
+        self._share_across_credentials = share_across_credentials
+        self._lock = threading.Lock()
+        # the keys of the requests that missed the cache, so their response can be stored under the same key
+        self._keys: WeakKeyDictionary[httpx.Request, str] = WeakKeyDictionary()
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def get(self, request: httpx.Request, options: FinalRequestOptions, *, stream: bool) -> Optional[httpx.Response]:
+        """Returns the cached response to an identical request, if there is one.
+
+        With `stream=True` the response body is replayed chunk by chunk, as it was received.
+        """
+        if request.method != "POST" or not any(_matches(options.url, path) for path in self._paths):
+            return None
+
+        key = _completion_key(request, options, with_identity=not self._share_across_credentials)
+        if key is None:
+            return None
+
+        with self._lock:
+            self._keys[request] = key
+
+        if "no-cache" in request.headers.get("cache-control", ""):
+            return None
+
+        cached = self.backend.get(key)
+        if cached is None:
+            return None
+
+        if cached.expires_at <= time.time():
+            self.backend.delete(key)
+            return None
+
+        log.debug("Using cached response for %s %s", request.method, request.url)
+        return _to_response(cached, request, stream=stream)
+
+    def set(self, request: httpx.Request, response: httpx.Response, *, stream: bool) -> None:
+        """Stores the response to a request that missed the cache, streamed responses once they have been read to completion."""
+        with self._lock:
+            key = self._keys.pop(request, None)
+        if key is None or response.status_code != 200:
+            return
+
+        expires_at = math.inf if self._ttl is None else time.time() + self._ttl
+        if not stream:
+            self.backend.set(
+                key,
+                CachedResponse(
+                    status_code=response.status_code,
+                    headers=_decoded_headers(response),
+                    content=response.content,
+                    expires_at=expires_at,
+                ),
+            )
+            return
+
+        def store(content: bytes) -> None:
+            # the raw body is stored, which is decoded again when it is replayed
+            self.backend.set(
+                key,
+                CachedResponse(
+                    status_code=response.status_code,
+                    headers=list(response.headers.multi_items()),
+                    content=content,
+                    expires_at=expires_at,
+                ),
+            )
+
+        response.stream = _RecordingStream(response.stream, store)
+
+
+class _RecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Passes through the raw body of a streamed response and calls `on_complete` with it once it has been read."""
+
+    def __init__(
+        self,
+        stream: Union[httpx.SyncByteStream, httpx.AsyncByteStream],
+        on_complete: Callable[[bytes], None],
+    ) -> None:
+        self._stream = stream
+        self._on_complete = on_complete
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        assert isinstance(self._stream, httpx.SyncByteStream)
+        chunks: List[bytes] = []
+        for chunk in self._stream:
+            chunks.append(chunk)
+            yield chunk
+        self._on_complete(b"".join(chunks))
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        assert isinstance(self._stream, httpx.AsyncByteStream)
+        chunks: List[bytes] = []
+        async for chunk in self._stream:
+            chunks.append(chunk)
+            yield chunk
+        self._on_complete(b"".join(chunks))
+
+    @override
+    def close(self) -> None:
+        if isinstance(self._stream, httpx.SyncByteStream):
+            self._stream.close()
+
+    @override
+    async def aclose(self) -> None:
+        if isinstance(self._stream, httpx.AsyncByteStream):
+            await self._stream.aclose()
+
+
+def _matches(url: str, path: str) -> bool:
+    return url == path or (path.endswith("/") and url.startswith(path))
+
+
+def _to_response(cached: CachedResponse, request: httpx.Request, *, stream: bool) -> httpx.Response:
+    if stream:
+        response = httpx.Response(
+            status_code=cached.status_code,
+            headers=cached.headers,
+            stream=httpx.ByteStream(cached.content),
+            request=request,
+        )
+    else:
+        response = httpx.Response(
+            status_code=cached.status_code,
+            headers=cached.headers,
+            content=cached.content,
+            request=request,
+        )
+
+    # the request wasn't sent
+    response.elapsed = datetime.timedelta(0)
+    return response
+
+
+def _decoded_headers(response: httpx.Response) -> List[Tuple[str, str]]:
+    # the body is stored decoded, so it must not be decoded again when it is read from the cache
+    return [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name not in ("content-encoding", "transfer-encoding", "content-length")
+    ]
+
+
+def _identity(request: httpx.Request) -> List[str]:
+    return [request.headers.get(name, "") for name in _IDENTITY_HEADERS]
+
+
+def _is_poll(request: httpx.Request) -> bool:
+    return request.headers.get("x-stainless-poll-helper") == "true"  # type: ignore[no-any-return]
+
+
+def _is_pending(response: httpx.Response) -> bool:
+    try:
+        data = json.loads(response.content)
+    except ValueError:
+        return False
+    return is_mapping(data) and data.get("status") in _PENDING_STATUSES
+
+
+def _cache_key(request: httpx.Request) -> str:
+    return hashlib.sha256(json.dumps([str(request.url), *_identity(request)]).encode()).hexdigest()
+
+
+def _completion_key(request: httpx.Request, options: FinalRequestOptions, *, with_identity: bool) -> Optional[str]:
+    if options.files:
+        return None
+
+    body = options.json_data
+    if options.extra_json is not None:
+        body = {**body, **options.extra_json} if is_mapping(body) else options.extra_json
+
+    try:
+        canonical = json.dumps(_normalize(body), sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except (TypeError, ValueError):
+        return None
+
+    identity = _identity(request) if with_identity else []
+    return hashlib.sha256(json.dumps([str(request.url), canonical, *identity]).encode()).hexdigest()
+
+
+def _normalize(value: object) -> object:
+    """Makes equal values encode the same way, e.g. `temperature=1` & `temperature=1.0`."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if is_mapping(value):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in cast("Sequence[object]", value)]
+    return value
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 from typing import TYPE_CHECKING, Any, Union, Mapping
-from typing_extensions import Self, override
+from typing_extensions import Self, Literal, override
 
 import httpx
 
@@ -16,6 +16,7 @@ from ._types import (
     Timeout,
     NotGiven,
     Transport,
+    JSONBackend,
     ProxiesTypes,
     RequestOptions,
 )
@@ -25,6 +26,9 @@ from ._utils import (
     get_async_library,
 )
 from ._compat import cached_property
+from ._caching import ResponseCache, CompletionCache
+from ._hedging import HedgingPolicy
+from ._retries import RetryBudget, RetryPolicy, CircuitBreaker
 from ._version import __version__
 from ._streaming import Stream as Stream, AsyncStream as AsyncStream
 from ._exceptions import OpenAIError, APIStatusError
@@ -33,6 +37,8 @@ from ._base_client import (
     SyncAPIClient,
     AsyncAPIClient,
 )
+from ._connections import KeepalivePolicy, TransportRegistry
+from ._rate_limits import RateLimiter
 
 if TYPE_CHECKING:
     from .resources import (
@@ -106,6 +112,48 @@ class OpenAI(SyncAPIClient):
         # We provide a `DefaultHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
+        # Use HTTP/2 for the default http client, which multiplexes concurrent requests over a single
+        # connection per host. Requires the `h2` package, `"auto"` enables HTTP/2 only if it is installed.
+        http2: bool | Literal["auto"] = False,
+        # Keep connections to the API open between requests by pinging them in the background,
+        # see `KeepalivePolicy` for details. Use `client.warmup()` to open connections ahead of time.
+        keepalive: KeepalivePolicy | None = None,
+        # Share one connection pool per host with every other client that is given the same registry,
+        # see `TransportRegistry` for details.
+        transport_registry: TransportRegistry | None = None,
+        # Use a faster JSON implementation for encoding request bodies and decoding responses,
+        # e.g. `json_backend=orjson`. Any object with `loads()` & `dumps()` functions is supported.
+        json_backend: JSONBackend | None = None,
+        # Encode JSON request bodies while they are being sent instead of up front, so that large
+        # bodies, e.g. with base64 encoded images, are never held in memory as a whole.
+        stream_request_body: bool = False,
+        # Set to `"raw"` to skip model construction and return the decoded JSON as plain dicts from
+        # `chat.completions.create()`, `responses.create()` & `embeddings.create()`, which is faster
+        # for responses that are forwarded or serialized again as-is.
+        response_mode: Literal["model", "raw"] = "model",
+        # Delay requests on the client once the budget reported by the `x-ratelimit-*` response
+        # headers has been used up, instead of sending them only to receive a 429.
+        rate_limiter: RateLimiter | None = None,
+        # Configure how long to wait between retries, e.g. with full or decorrelated jitter,
+        # and when to stop retrying, see `RetryPolicy` for details.
+        retry_policy: RetryPolicy | None = None,
+        # Limit retries across all requests to a fraction of the successful ones, so that
+        # failing requests don't multiply the load on the API during an outage.
+        retry_budget: RetryBudget | None = None,
+        # Fail requests to an endpoint without sending them after repeated connection errors or 5xx responses.
+        circuit_breaker: CircuitBreaker | None = None,
+        # Share a single HTTP request between concurrent, identical, `GET` requests made with this client,
+        # e.g. `models.retrieve()` for the same ID, every caller receives the same parsed result.
+        coalesce_requests: bool = False,
+        # Cache responses from read-only endpoints, e.g. `models.list()`, for a fixed time,
+        # see `ResponseCache` for details.
+        response_cache: ResponseCache | None = None,
+        # Re-use the responses to identical completion & embedding requests, e.g. when re-running evals,
+        # see `CompletionCache` for details.
+        completion_cache: CompletionCache | None = None,
+        # Read & decode the events of streamed responses on a background thread, up to this many ahead
+        # of the code iterating over the stream, see `Stream` for details. Can be overridden per stream.
+        stream_prefetch: int | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -157,8 +205,22 @@ class OpenAI(SyncAPIClient):
             max_retries=max_retries,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
+            keepalive=keepalive,
+            transport_registry=transport_registry,
             custom_headers=default_headers,
             custom_query=default_query,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
+            stream_prefetch=stream_prefetch,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -310,6 +372,20 @@ class OpenAI(SyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
+        http2: bool | Literal["auto"] | None = None,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool | None = None,
+        response_mode: Literal["model", "raw"] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_requests: bool | None = None,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -338,8 +414,11 @@ class OpenAI(SyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
-        return self.__class__(
+        # clients using a transport registry get their own http client on top of the shared
+        # connection pools, so that their requests are counted separately
+        if http_client is None and self._transport_registry is None:
+            http_client = self._client
+        client = self.__class__(
             api_key=api_key or self.api_key,
             organization=organization or self.organization,
             project=project or self.project,
@@ -348,11 +427,29 @@ class OpenAI(SyncAPIClient):
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=self._http2 if http2 is None else http2,
+            keepalive=keepalive or self._keepalive,
+            transport_registry=transport_registry or self._transport_registry,
+            json_backend=json_backend or self._json_backend,
+            stream_request_body=self._stream_request_body if stream_request_body is None else stream_request_body,
+            response_mode=response_mode or self._response_mode,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            retry_policy=retry_policy or self._retry_policy,
+            retry_budget=retry_budget or self._retry_budget,
+            circuit_breaker=circuit_breaker or self._circuit_breaker,
+            coalesce_requests=False if coalesce_requests is None else coalesce_requests,
+            response_cache=response_cache or self._response_cache,
+            completion_cache=completion_cache or self._completion_cache,
+            stream_prefetch=self._stream_prefetch if stream_prefetch is None else stream_prefetch,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
             **_extra_kwargs,
         )
+        if coalesce_requests is None:
+            # copies share the requests that are in flight on this client
+            client._single_flight = self._single_flight
+        return client
 
     # Alias for `copy` for nicer inline usage, e.g.
     # client.with_options(timeout=10).foo.create(...)
@@ -425,6 +522,48 @@ class AsyncOpenAI(AsyncAPIClient):
         # We provide a `DefaultAsyncHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
         http_client: httpx.AsyncClient | None = None,
+        # Use HTTP/2 for the default http client, which multiplexes concurrent requests over a single
+        # connection per host. Requires the `h2` package, `"auto"` enables HTTP/2 only if it is installed.
+        http2: bool | Literal["auto"] = False,
+        # Keep connections to the API open between requests by pinging them in the background,
+        # see `KeepalivePolicy` for details. Use `client.warmup()` to open connections ahead of time.
+        keepalive: KeepalivePolicy | None = None,
+        # Share one connection pool per host with every other client that is given the same registry,
+        # see `TransportRegistry` for details.
+        transport_registry: TransportRegistry | None = None,
+        # Use a faster JSON implementation for encoding request bodies and decoding responses,
+        # e.g. `json_backend=orjson`. Any object with `loads()` & `dumps()` functions is supported.
+        json_backend: JSONBackend | None = None,
+        # Encode JSON request bodies while they are being sent instead of up front, so that large
+        # bodies, e.g. with base64 encoded images, are never held in memory as a whole.
+        stream_request_body: bool = False,
+        # Set to `"raw"` to skip model construction and return the decoded JSON as plain dicts from
+        # `chat.completions.create()`, `responses.create()` & `embeddings.create()`, which is faster
+        # for responses that are forwarded or serialized again as-is.
+        response_mode: Literal["model", "raw"] = "model",
+        # Delay requests on the client once the budget reported by the `x-ratelimit-*` response
+        # headers has been used up, instead of sending them only to receive a 429.
+        rate_limiter: RateLimiter | None = None,
+        # Configure how long to wait between retries, e.g. with full or decorrelated jitter,
+        # and when to stop retrying, see `RetryPolicy` for details.
+        retry_policy: RetryPolicy | None = None,
+        # Limit retries across all requests to a fraction of the successful ones, so that
+        # failing requests don't multiply the load on the API during an outage.
+        retry_budget: RetryBudget | None = None,
+        # Fail requests to an endpoint without sending them after repeated connection errors or 5xx responses.
+        circuit_breaker: CircuitBreaker | None = None,
+        # Send a second request to idempotent endpoints when the first one is unusually slow
+        # and use whichever responds first, see `HedgingPolicy` for details.
+        hedging: HedgingPolicy | None = None,
+        # Share a single HTTP request between concurrent, identical, `GET` requests made with this client,
+        # e.g. `models.retrieve()` for the same ID, every caller receives the same parsed result.
+        coalesce_requests: bool = False,
+        # Cache responses from read-only endpoints, e.g. `models.list()`, for a fixed time,
+        # see `ResponseCache` for details.
+        response_cache: ResponseCache | None = None,
+        # Re-use the responses to identical completion & embedding requests, e.g. when re-running evals,
+        # see `CompletionCache` for details.
+        completion_cache: CompletionCache | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -476,8 +615,22 @@ class AsyncOpenAI(AsyncAPIClient):
             max_retries=max_retries,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
+            keepalive=keepalive,
+            transport_registry=transport_registry,
             custom_headers=default_headers,
             custom_query=default_query,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -629,6 +782,20 @@ class AsyncOpenAI(AsyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | Literal["auto"] | None = None,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool | None = None,
+        response_mode: Literal["model", "raw"] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        coalesce_requests: bool | None = None,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -657,8 +824,11 @@ class AsyncOpenAI(AsyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
-        return self.__class__(
+        # clients using a transport registry get their own http client on top of the shared
+        # connection pools, so that their requests are counted separately
+        if http_client is None and self._transport_registry is None:
+            http_client = self._client
+        client = self.__class__(
             api_key=api_key or self.api_key,
             organization=organization or self.organization,
             project=project or self.project,
@@ -667,11 +837,29 @@ class AsyncOpenAI(AsyncAPIClient):
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=self._http2 if http2 is None else http2,
+            keepalive=keepalive or self._keepalive,
+            transport_registry=transport_registry or self._transport_registry,
+            json_backend=json_backend or self._json_backend,
+            stream_request_body=self._stream_request_body if stream_request_body is None else stream_request_body,
+            response_mode=response_mode or self._response_mode,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            retry_policy=retry_policy or self._retry_policy,
+            retry_budget=retry_budget or self._retry_budget,
+            circuit_breaker=circuit_breaker or self._circuit_breaker,
+            hedging=hedging or self._hedging,
+            coalesce_requests=False if coalesce_requests is None else coalesce_requests,
+            response_cache=response_cache or self._response_cache,
+            completion_cache=completion_cache or self._completion_cache,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
             **_extra_kwargs,
         )
+        if coalesce_requests is None:
+            # copies share the requests that are in flight on this client
+            client._single_flight = self._single_flight
+        return client
 
     # Alias for `copy` for nicer inline usage, e.g.
     # client.with_options(timeout=10).foo.create(...)
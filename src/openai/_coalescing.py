@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Dict, Tuple, Generic, Mapping, TypeVar, Callable, Hashable, Optional, Awaitable, cast
+
+import anyio
+
+from ._types import Omit
+from ._utils import is_given
+from ._models import FinalRequestOptions
+from ._constants import RAW_RESPONSE_HEADER, OVERRIDE_CAST_TO_HEADER
+
+_T = TypeVar("_T")
+
+
+def coalescing_key(
+    cast_to: type,
+    options: FinalRequestOptions,
+    *,
+    stream: bool,
+    base_url: str,
+    default_headers: Mapping[str, object],
+) -> Optional[Hashable]:
+    """Returns the key that identical requests share, or `None` if the request can't be coalesced.
+
+    Only `GET` requests whose response is parsed are coalesced, requests for raw or
+    streamed responses, and page requests, which are bound to their own options, are not.
+    The client's base URL & default headers are part of the key as copies of a client share
+    its requests, but not with different credentials.
+    """
+    if stream or options.method.lower() != "get" or is_given(options.post_parser):
+        return None
+    if options.files or options.json_data is not None or options.extra_json:
+        return None
+
+    headers: Mapping[str, object] = options.headers if is_given(options.headers) else {}
+    if RAW_RESPONSE_HEADER in headers or OVERRIDE_CAST_TO_HEADER in headers:
+        return None
+
+    return (
+        cast_to,
+        base_url,
+        json.dumps(
+            {name: value for name, value in default_headers.items() if not isinstance(value, Omit)},
+            sort_keys=True,
+            default=repr,
+        ),
+        options.url,
+        # the params & headers are only made hashable, values that can't be encoded
+        # are compared by their `repr()` which may prevent some requests from being coalesced
+        json.dumps(options.params, sort_keys=True, default=repr),
+        json.dumps(headers, sort_keys=True, default=repr),
+        repr(options.timeout),
+        repr(options.max_retries),
+        options.follow_redirects,
+    )
+
+
+class _Call(Generic[_T]):
+    result: _T
+    error: Optional[BaseException]
+    # set when the call was interrupted, e.g. cancelled, in which case the waiting
+    # callers don't share the interruption but make the request themselves
+    interrupted: bool
+
+    def __init__(self) -> None:
+        self.error = None
+        self.interrupted = False
+
+
+class _SyncCall(_Call[_T]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.done = threading.Event()
+
+
+class _AsyncCall(_Call[_T]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.done = anyio.Event()
+
+
+class SingleFlight:
+    """Makes concurrent calls with the same key, from different threads, share the result of the first one.
+
+    Every caller receives the same result object, or the same exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _SyncCall[Any]] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if call is None:
+                    call = self._calls[key] = _SyncCall[Any]()
+
+            if leader:
+                try:
+                    result = fn()
+                except Exception as err:
+                    call.error = err
+                    raise
+                except BaseException:
+                    call.interrupted = True
+                    raise
+                else:
+                    call.result = result
+                    return result
+                finally:
+                    with self._lock:
+                        del self._calls[key]
+                    call.done.set()
+
+            call.done.wait()
+            if not call.interrupted:
+                # calls are stored for any type, but the calls sharing a key return the same one
+                return cast(_T, _call_result(call))
+
+
+class AsyncSingleFlight:
+    """Makes concurrent calls with the same key, from different tasks, share the result of the first one.
+
+    Every caller receives the same result object, or the same exception.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[int, Hashable], _AsyncCall[Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[_T]]) -> _T:
+        # events can only be awaited from the thread that runs the event loop they were created in
+        key = (threading.get_ident(), key)
+        while True:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _AsyncCall[Any]()
+                try:
+                    result = await fn()
+                except Exception as err:
+                    call.error = err
+                    raise
+                except BaseException:
+                    call.interrupted = True
+                    raise
+                else:
+                    call.result = result
+                    return result
+                finally:
+                    del self._calls[key]
+                    call.done.set()
+
+            await call.done.wait()
+            if not call.interrupted:
+                # calls are stored for any type, but the calls sharing a key return the same one
+                return cast(_T, _call_result(call))
+
+
+def _call_result(call: _Call[_T]) -> _T:
+    if call.error is not None:
+        raise call.error
+    return call.result
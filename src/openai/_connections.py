@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Tuple, Union, Callable, Iterator, Optional, Awaitable, NamedTuple, AsyncIterator
+from typing_extensions import Literal, override
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import httpx
+
+from ._constants import DEFAULT_CONNECTION_LIMITS
+
+__all__ = ["ConnectionPoolStatus", "KeepalivePolicy", "TransportRegistry", "TransportStatus"]
+
+
+class ConnectionPoolStatus(NamedTuple):
+    connections: int
+    """The number of open connections, including connections that are being established"""
+
+    http2_connections: int
+    """The number of open connections that negotiated HTTP/2"""
+
+    idle_connections: int
+    """The number of open connections that aren't serving any request"""
+
+    active_streams: int
+    """The number of requests that are currently being sent or received over a connection"""
+
+    queued_requests: int
+    """The number of requests that are waiting for a connection to become available"""
+
+
+def h2_available() -> bool:
+    try:
+        import h2  # type: ignore  # noqa
+    except ImportError:
+        return False
+
+    return True
+
+
+def resolve_http2(http2: Union[bool, Literal["auto"]]) -> bool:
+    """Returns whether HTTP/2 should be enabled, `"auto"` enables it if the `h2` package is installed."""
+    if http2 == "auto":
+        return h2_available()
+    return http2
+
+
+def get_pool_status(http_client: Union[httpx.Client, httpx.AsyncClient]) -> Optional[ConnectionPoolStatus]:
+    """Inspects the connection pool used by the default transport of the given client.
+
+    Returns `None` if the client uses a different transport, e.g. a mock transport
+    in tests or `httpx_aiohttp`.
+    """
+    transport = getattr(http_client, "_transport", None)
+    if isinstance(transport, (SharedTransport, AsyncSharedTransport)):
+        transport = transport.transport
+    if not isinstance(transport, (httpx.HTTPTransport, httpx.AsyncHTTPTransport)):
+        return None
+
+    return _pool_status(transport)
+
+
+def _pool_status(transport: Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]) -> ConnectionPoolStatus:
+    pool: Any = transport._pool
+    connections = pool.connections
+    # the pool has no public API for the requests it is serving
+    requests = getattr(pool, "_requests", [])
+    queued = sum(1 for request in requests if request.is_queued())
+
+    return ConnectionPoolStatus(
+        connections=len(connections),
+        http2_connections=sum(1 for connection in connections if ", HTTP/2," in connection.info()),
+        idle_connections=sum(1 for connection in connections if connection.is_idle()),
+        active_streams=len(requests) - queued,
+        queued_requests=queued,
+    )
+
+
+class TransportStatus(NamedTuple):
+    origin: str
+    http2: bool
+
+    asynchronous: bool
+    """Whether the connection pool is used by async clients"""
+
+    pool: ConnectionPoolStatus
+
+
+class TransportRegistry:
+    """Shares one bounded connection pool per host between all clients that are given the registry.
+
+    Clients derived from one another with `.copy()` or `.with_options()` share the http
+    client of the original by default, but clients that are created separately, e.g. one
+    per API key, each open their own connections. With a registry, every client sends its
+    requests through the same pool per host, which is bounded by the given `limits`, and
+    keeps track of its own requests, see `client.in_flight_requests()`.
+
+    Closing a client doesn't close the shared pools, use `registry.close()` or
+    `await registry.aclose()` once none of the clients are used anymore.
+
+    ```py
+    from openai import OpenAI, TransportRegistry
+
+    registry = TransportRegistry()
+
+    clients = {tenant.id: OpenAI(api_key=tenant.api_key, transport_registry=registry) for tenant in tenants}
+    ```
+    """
+
+    def __init__(self, *, limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS) -> None:
+        """
+        Args:
+            limits: The connection limits of each pool. When using a `KeepalivePolicy`, pass
+                `limits=keepalive.limits()` so that idle connections are kept open between pings.
+        """
+        self._limits = limits
+        self._lock = threading.Lock()
+        self._transports: Dict[Tuple[str, bool], httpx.HTTPTransport] = {}
+        self._async_transports: Dict[Tuple[str, bool], httpx.AsyncHTTPTransport] = {}
+
+    def status(self) -> List[TransportStatus]:
+        """Returns the state of the connection pool of every host that requests have been made to."""
+        with self._lock:
+            transports: List[Tuple[Tuple[str, bool], bool, Union[httpx.HTTPTransport, httpx.AsyncHTTPTransport]]] = [
+                *((key, False, transport) for key, transport in self._transports.items()),
+                *((key, True, transport) for key, transport in self._async_transports.items()),
+            ]
+
+        return [
+            TransportStatus(origin=origin, http2=http2, asynchronous=asynchronous, pool=_pool_status(transport))
+            for (origin, http2), asynchronous, transport in transports
+        ]
+
+    def transport(self, url: httpx.URL, *, http2: bool = False) -> SharedTransport:
+        """Returns a transport for a single client that sends requests through the shared pool for the given host."""
+        key = (_origin(url), http2)
+        with self._lock:
+            transport = self._transports.get(key)
+            if transport is None:
+                transport = self._transports[key] = httpx.HTTPTransport(limits=self._limits, http2=http2)
+
+        return SharedTransport(transport)
+
+    def async_transport(self, url: httpx.URL, *, http2: bool = False) -> AsyncSharedTransport:
+        """Returns a transport for a single async client that sends requests through the shared pool for the given host."""
+        key = (_origin(url), http2)
+        with self._lock:
+            transport = self._async_transports.get(key)
+            if transport is None:
+                transport = self._async_transports[key] = httpx.AsyncHTTPTransport(limits=self._limits, http2=http2)
+
+        return AsyncSharedTransport(transport)
+
+    def close(self) -> None:
+        """Closes the connection pools used by sync clients."""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+
+        for transport in transports:
+            transport.close()
+
+    async def aclose(self) -> None:
+        """Closes the connection pools used by async clients."""
+        with self._lock:
+            transports = list(self._async_transports.values())
+            self._async_transports.clear()
+
+        for transport in transports:
+            await transport.aclose()
+
+
+def _origin(url: httpx.URL) -> str:
+    return f"{url.scheme}://{url.netloc.decode('ascii')}"
+
+
+class SharedTransport(httpx.BaseTransport):
+    """Sends the requests of a single client through a transport that is shared with other clients."""
+
+    def __init__(self, transport: httpx.HTTPTransport) -> None:
+        self.transport = transport
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.in_flight += 1
+
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountedStream(response.stream, self._release),
+            extensions=response.extensions,
+        )
+
+    @override
+    def close(self) -> None:
+        # the shared transport is closed by the registry
+        pass
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Sends the requests of a single async client through a transport that is shared with other clients."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport) -> None:
+        self.transport = transport
+        self.in_flight = 0
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncCountedStream(response.stream, self._release),
+            extensions=response.extensions,
+        )
+
+    @override
+    async def aclose(self) -> None:
+        # the shared transport is closed by the registry
+        pass
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+
+class _CountedStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    @override
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _AsyncCountedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    @override
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    @override
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class KeepalivePolicy:
+    """Keeps connections to the API open between requests, so that requests don't have to wait for new connections.
+
+    While the client is in use, `connections` connections to the `base_url` are pinged
+    with a `HEAD` request every `interval` seconds, which also re-opens connections that
+    were closed by the server. Once no request has been made for `idle_timeout` seconds
+    the pings stop and the idle connections are closed.
+
+    ```py
+    from openai import OpenAI, KeepalivePolicy
+
+    client = OpenAI(keepalive=KeepalivePolicy(connections=4))
+    client.warmup(n_connections=4)
+    ```
+    """
+
+    def __init__(self, *, connections: int = 1, interval: float = 30.0, idle_timeout: float = 300.0) -> None:
+        """
+        Args:
+            connections: How many connections are kept open.
+            interval: How often, in seconds, the connections are pinged.
+            idle_timeout: How long, in seconds, after the last request the connections are kept open.
+        """
+        self.connections = connections
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+            max_keepalive_connections=max(DEFAULT_CONNECTION_LIMITS.max_keepalive_connections or 0, self.connections),
+            # the pool closes connections that have been idle for longer than this,
+            # so it has to outlast the time between two pings
+            keepalive_expiry=self.interval * 2,
+        )
+
+
+def warmup_connections(
+    send: Callable[..., httpx.Response],
+    requests: List[httpx.Request],
+) -> None:
+    """Opens a connection for each of the given requests by sending them all at the same time.
+
+    The responses are only closed once every request has been sent, so that no connection is
+    re-used and the connections are returned to the pool afterwards.
+    """
+    if not requests:
+        return
+
+    responses: List[httpx.Response] = []
+    errors: List[Exception] = []
+
+    def open_connection(request: httpx.Request) -> None:
+        try:
+            responses.append(send(request, stream=True))
+        except Exception as err:
+            errors.append(err)
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        for _ in executor.map(open_connection, requests):
+            pass
+
+    for response in responses:
+        # the response has to be read, otherwise its connection is closed instead of being returned to the pool
+        response.read()
+
+    if errors:
+        raise errors[0]
+
+
+async def async_warmup_connections(
+    send: Callable[..., Awaitable[httpx.Response]],
+    requests: List[httpx.Request],
+) -> None:
+    """Opens a connection for each of the given requests by sending them all at the same time."""
+    if not requests:
+        return
+
+    responses: List[httpx.Response] = []
+    errors: List[Exception] = []
+
+    async def open_connection(request: httpx.Request) -> None:
+        try:
+            responses.append(await send(request, stream=True))
+        except Exception as err:
+            errors.append(err)
+
+    async with anyio.create_task_group() as task_group:
+        for request in requests:
+            task_group.start_soon(open_connection, request)
+
+    for response in responses:
+        await response.aread()
+
+    if errors:
+        raise errors[0]
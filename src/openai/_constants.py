@@ -4,6 +4,7 @@ import httpx
 
 RAW_RESPONSE_HEADER = "X-Stainless-Raw-Response"
 OVERRIDE_CAST_TO_HEADER = "____stainless_override_cast_to"
+RESPONSE_MODE_HEADER = "____stainless_response_mode"
 
 # default timeout is 10 minutes
 DEFAULT_TIMEOUT = httpx.Timeout(timeout=600, connect=5.0)
@@ -25,6 +25,7 @@ __all__ = [
     "LengthFinishReasonError",
     "ContentFilterFinishReasonError",
     "InvalidWebhookSignatureError",
+    "CircuitBreakerOpenError",
 ]
 
 
@@ -101,6 +102,11 @@ class APITimeoutError(APIConnectionError):
         super().__init__(message="Request timed out.", request=request)
 
 
+class CircuitBreakerOpenError(APIConnectionError):
+    def __init__(self, *, request: httpx.Request) -> None:
+        super().__init__(message="Request not sent as the circuit breaker for this endpoint is open.", request=request)
+
+
 class BadRequestError(APIStatusError):
     status_code: Literal[400] = 400  # pyright: ignore[reportIncompatibleVariableOverride]
 
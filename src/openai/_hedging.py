@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Dict, List, Deque, Optional, Sequence, NamedTuple
+from collections import deque
+
+__all__ = ["HedgingPolicy", "HedgingStatus"]
+
+DEFAULT_HEDGED_PATHS = ("/embeddings", "/moderations", "/models/")
+
+
+class HedgingStatus(NamedTuple):
+    path: str
+
+    delay: Optional[float]
+    """How long, in seconds, a request currently waits for response headers before a second one is sent"""
+
+    hedged: int
+    """The total number of second requests that were sent"""
+
+    hedge_wins: int
+    """The total number of times the second request responded first"""
+
+
+class _Latencies:
+    samples: Deque[float]
+    hedged: int
+    hedge_wins: int
+
+    def __init__(self, window: int) -> None:
+        self.samples = deque(maxlen=window)
+        self.hedged = 0
+        self.hedge_wins = 0
+
+
+class HedgingPolicy:
+    """Sends a second, identical, request when the first one is slower than usual and uses whichever responds first.
+
+    The latency until the response headers are received is tracked for the last `window`
+    requests to each path. Once `min_samples` latencies are known, a request that hasn't
+    received its headers within the given `percentile` of them is duplicated. The request
+    that loses the race is cancelled and its connection is released.
+
+    Both requests use the same idempotency key, so only idempotent endpoints are hedged,
+    by default `embeddings.create()`, `moderations.create()` & `models.retrieve()`.
+
+    Hedging is only supported by the async client:
+
+    ```py
+    from openai import AsyncOpenAI, HedgingPolicy
+
+    client = AsyncOpenAI(hedging=HedgingPolicy(percentile=95))
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        min_delay: float = 0.0,
+        window: int = 100,
+        min_samples: int = 20,
+        paths: Sequence[str] = DEFAULT_HEDGED_PATHS,
+    ) -> None:
+        """
+        Args:
+            percentile: The percentile of recent latencies after which a second request is sent.
+            min_delay: The minimum time, in seconds, to wait before sending a second request.
+            window: How many recent latencies are tracked per path.
+            min_samples: How many latencies have to be known before requests to a path are hedged.
+            paths: The paths of the endpoints that are hedged, a path ending with `/` matches every path it prefixes.
+        """
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._window = window
+        self._min_samples = min_samples
+        self._paths = tuple(paths)
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, _Latencies] = {}
+
+    def status(self) -> List[HedgingStatus]:
+        """Returns the current delay & counters for every path that hedged requests have been made to."""
+        with self._lock:
+            return [
+                HedgingStatus(
+                    path=path,
+                    delay=self._delay(latencies),
+                    hedged=latencies.hedged,
+                    hedge_wins=latencies.hedge_wins,
+                )
+                for path, latencies in self._latencies.items()
+            ]
+
+    def match(self, url: str) -> Optional[str]:
+        """Returns the configured path that the given request path is hedged under, if any."""
+        for path in self._paths:
+            if url == path or (path.endswith("/") and url.startswith(path)):
+                return path
+        return None
+
+    def delay(self, path: str) -> Optional[float]:
+        """Returns how long to wait for a response before sending a second request, `None` to not hedge at all."""
+        with self._lock:
+            latencies = self._latencies.get(path)
+            return None if latencies is None else self._delay(latencies)
+
+    def record(self, path: str, latency: float, *, hedged: bool = False, hedge_won: bool = False) -> None:
+        with self._lock:
+            latencies = self._latencies.get(path)
+            if latencies is None:
+                latencies = self._latencies[path] = _Latencies(self._window)
+
+            latencies.samples.append(latency)
+            if hedged:
+                latencies.hedged += 1
+            if hedge_won:
+                latencies.hedge_wins += 1
+
+    def _delay(self, latencies: _Latencies) -> Optional[float]:
+        if len(latencies.samples) < self._min_samples:
+            return None
+
+        ordered = sorted(latencies.samples)
+        index = min(math.ceil(len(ordered) * self._percentile / 100) - 1, len(ordered) - 1)
+        return max(ordered[max(index, 0)], self._min_delay)
@@ -25,7 +25,7 @@ import pydantic
 
 from ._types import NoneType
 from ._utils import is_given, extract_type_arg, is_annotated_type, is_type_alias_type
-from ._models import BaseModel, is_basemodel, add_request_id
+from ._models import RawDict, BaseModel, is_basemodel, add_request_id
 from ._constants import RAW_RESPONSE_HEADER
 from ._streaming import Stream, AsyncStream, is_stream_class_type, extract_stream_chunk_type
 from ._exceptions import APIResponseValidationError
@@ -138,7 +138,7 @@ class LegacyAPIResponse(Generic[R]):
         if is_given(self._options.post_parser):
             parsed = self._options.post_parser(parsed)
 
-        if isinstance(parsed, BaseModel):
+        if isinstance(parsed, (BaseModel, RawDict)):
             add_request_id(parsed, self.request_id)
 
         self._parsed_by_type[cache_key] = parsed
@@ -294,6 +294,7 @@ class LegacyAPIResponse(Generic[R]):
             cast_to is not object
             and not origin is list
             and not origin is dict
+            and not origin is RawDict
             and not origin is Union
             and not issubclass(origin, BaseModel)
         ):
@@ -307,7 +308,7 @@ class LegacyAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = self._client._json_loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -329,7 +330,7 @@ class LegacyAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = self._client._json_loads(response.content)
 
         return self._client._process_response_data(
             data=data,
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import os
 import inspect
-from typing import TYPE_CHECKING, Any, Type, Tuple, Union, Generic, TypeVar, Callable, Optional, cast
+import functools
+from typing import TYPE_CHECKING, Any, Dict, Type, Tuple, Union, Generic, Mapping, TypeVar, Callable, Optional, cast
+from weakref import WeakKeyDictionary
 from datetime import date, datetime
+from collections import OrderedDict
 from typing_extensions import (
     List,
     Unpack,
@@ -211,34 +214,31 @@ class BaseModel(pydantic.BaseModel):
         m = __cls.__new__(__cls)
         fields_values: dict[str, object] = {}
 
-        config = get_model_config(__cls)
-        populate_by_name = (
-            config.allow_population_by_field_name
-            if isinstance(config, _ConfigProtocol)
-            else config.get("populate_by_name")
-        )
+        plan = _get_construct_plan(__cls)
 
         if _fields_set is None:
             _fields_set = set()
 
-        model_fields = get_model_fields(__cls)
-        for name, field in model_fields.items():
-            key = field.alias
-            if key is None or (key not in values and populate_by_name):
-                key = name
+        for name, key, fallback_key, construct_field, default, get_default in plan.fields:
+            if fallback_key is not None and key not in values:
+                key = fallback_key
 
             if key in values:
-                fields_values[name] = _construct_field(value=values[key], field=field, key=key)
                 _fields_set.add(name)
-            else:
-                fields_values[name] = field_get_default(field)
+                value = values[key]
+                if value is not None:
+                    fields_values[name] = construct_field(value)
+                    continue
 
-        extra_field_type = _get_extra_fields_type(__cls)
+            fields_values[name] = default if get_default is None else get_default()
+
+        model_fields = plan.model_fields
+        construct_extra = plan.construct_extra
 
         _extra = {}
         for key, value in values.items():
             if key not in model_fields:
-                parsed = construct_type(value=value, type_=extra_field_type) if extra_field_type is not None else value
+                parsed = construct_extra(value) if construct_extra is not None else value
 
                 if PYDANTIC_V2:
                     _extra[key] = parsed
@@ -384,19 +384,77 @@ class BaseModel(pydantic.BaseModel):
             )
 
 
-def _construct_field(value: object, field: FieldInfo, key: str) -> object:
-    if value is None:
-        return field_get_default(field)
+class _ConstructPlan:
+    """Everything `BaseModel.construct()` needs to know about a model class that doesn't depend on the values."""
+
+    model_fields: dict[str, FieldInfo]
+
+    fields: list[tuple[str, str, str | None, Callable[[object], object], object, Callable[[], object] | None]]
+    """`(name, key, fallback_key, construct_field, default, get_default)` for every field in the model"""
+
+    construct_extra: Callable[[object], object] | None
+
+    def __init__(self, cls: type[pydantic.BaseModel]) -> None:
+        config = get_model_config(cls)
+        populate_by_name = (
+            config.allow_population_by_field_name
+            if isinstance(config, _ConfigProtocol)
+            else config.get("populate_by_name")
+        )
+
+        self.model_fields = get_model_fields(cls)
+        self.fields = []
+        for name, field in self.model_fields.items():
+            key = field.alias
+            fallback_key = None
+            if key is None:
+                key = name
+            elif populate_by_name:
+                fallback_key = name
+
+            # defaults are copied by pydantic so we can only reuse immutable values
+            default = field_get_default(field)
+            get_default = None
+            if getattr(field, "default_factory", None) is not None or not isinstance(
+                default, (str, int, float, type(None))
+            ):
+                get_default = functools.partial(field_get_default, field)
+
+            self.fields.append((name, key, fallback_key, _build_field_constructor(field, key), default, get_default))
+
+        extra_field_type = _get_extra_fields_type(cls)
+        self.construct_extra = _get_type_constructor(extra_field_type) if extra_field_type is not None else None
+
+
+# weakly keyed so that the plans of models that are created at runtime don't outlive them
+_construct_plans: WeakKeyDictionary[type, _ConstructPlan] = WeakKeyDictionary()
 
+
+def _get_construct_plan(cls: type[pydantic.BaseModel]) -> _ConstructPlan:
+    plan = _construct_plans.get(cls)
+
+    # the fields are replaced when a model is rebuilt, e.g. after resolving forward references
+    if plan is None or plan.model_fields is not get_model_fields(cls):
+        plan = _construct_plans[cls] = _ConstructPlan(cls)
+
+    return plan
+
+
+def _build_field_constructor(field: FieldInfo, key: str) -> Callable[[object], object]:
     if PYDANTIC_V2:
         type_ = field.annotation
     else:
         type_ = cast(type, field.outer_type_)  # type: ignore
 
     if type_ is None:
-        raise RuntimeError(f"Unexpected field type is None for {key}")
 
-    return construct_type(value=value, type_=type_, metadata=getattr(field, "metadata", None))
+        def raise_missing_type(_value: object) -> object:
+            raise RuntimeError(f"Unexpected field type is None for {key}")
+
+        return raise_missing_type
+
+    metadata = getattr(field, "metadata", None)
+    return _get_type_constructor(type_, tuple(metadata) if metadata else ())
 
 
 def _get_extra_fields_type(cls: type[pydantic.BaseModel]) -> type | None:
@@ -472,26 +530,127 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
 
     If the given value does not match the expected type then it is returned as-is.
     """
+    return _get_type_constructor(type_, tuple(metadata) if metadata else ())(value)
+
+
+def construct_update(model: ModelT, values: Mapping[str, object], *, built: Mapping[str, object] = {}) -> ModelT:
+    """Returns a copy of a model with some of its fields replaced, without validation.
+
+    `values` are constructed the same way `BaseModel.construct()` constructs them, while `built` holds
+    values for fields, by name, that already have the right type. The result is the same as constructing
+    the model again from its fields that are set, updated with the new values, but the other fields are
+    shared with the given model instead of being constructed again.
+    """
+    cls = type(model)
+    m = cls.__new__(cls)
+
+    fields_values = dict(model.__dict__)
+    fields_values.update(built)
+    _fields_set = set(model.__pydantic_fields_set__ if PYDANTIC_V2 else model.__fields_set__)  # type: ignore
+    _fields_set.update(built)
+    _extra = dict(model.__pydantic_extra__ or {}) if PYDANTIC_V2 else {}
+
+    if values:
+        plan = _get_construct_plan(cls)
+
+        for name, key, fallback_key, construct_field, default, get_default in plan.fields:
+            if fallback_key is not None and key not in values:
+                key = fallback_key
+
+            if key in values:
+                _fields_set.add(name)
+                value = values[key]
+                if value is not None:
+                    fields_values[name] = construct_field(value)
+                else:
+                    fields_values[name] = default if get_default is None else get_default()
+
+        for key, value in values.items():
+            if key not in plan.model_fields:
+                parsed = plan.construct_extra(value) if plan.construct_extra is not None else value
+
+                if PYDANTIC_V2:
+                    _extra[key] = parsed
+                else:
+                    _fields_set.add(key)
+                    fields_values[key] = parsed
+
+    object.__setattr__(m, "__dict__", fields_values)
+
+    if PYDANTIC_V2:
+        object.__setattr__(m, "__pydantic_private__", model.__pydantic_private__)
+        object.__setattr__(m, "__pydantic_extra__", _extra)
+        object.__setattr__(m, "__pydantic_fields_set__", _fields_set)
+    else:
+        m._init_private_attributes()  # type: ignore
+        object.__setattr__(m, "__fields_set__", _fields_set)
+
+    return m
+
+
+_Constructor = Callable[[object], object]
+
+# keyed by the identity of the type as distinct typing objects can compare equal, e.g. `Union[A, B]`
+# and `Union[B, A]`, even though the order of the variants matters when constructing a union.
+# the type itself is stored as well so that its `id()` cannot be reused while the entry exists,
+# which is why only the most recently used constructors are kept.
+_type_constructors: OrderedDict[Tuple[int, Tuple[Any, ...]], Tuple[object, _Constructor]] = OrderedDict()
+_MAX_TYPE_CONSTRUCTORS = 4096
+
+
+def _get_type_constructor(type_: object, meta: tuple[Any, ...] = ()) -> _Constructor:
+    """Returns a function that constructs values of the given type, building & caching it on first use.
+
+    Everything that only depends on the type, e.g. unwrapping annotations and resolving union variants,
+    is done once here instead of for every value that is constructed.
+    """
+    key = (id(type_), meta)
+    try:
+        cached = _type_constructors.get(key)
+    except TypeError:
+        # unhashable metadata cannot be cached
+        return _build_type_constructor(type_, meta)
+
+    if cached is None:
+        cached = _type_constructors[key] = (type_, _build_type_constructor(type_, meta))
+        while len(_type_constructors) > _MAX_TYPE_CONSTRUCTORS:
+            _type_constructors.popitem(last=False)
+    else:
+        try:
+            _type_constructors.move_to_end(key)
+        except KeyError:
+            # evicted by another thread in the meantime
+            pass
+    return cached[1]
+
+
+def _return_value(value: object) -> object:
+    return value
 
-    # store a reference to the original type we were given before we extract any inner
-    # types so that we can properly resolve forward references in `TypeAliasType` annotations
-    original_type = None
 
+def _build_type_constructor(type_: object, meta: tuple[Any, ...], original_type: object = None) -> _Constructor:
     # we allow `object` as the input type because otherwise, passing things like
     # `Literal['value']` will be reported as a type error by type checkers
     type_ = cast("type[object]", type_)
-    if is_type_alias_type(type_):
-        original_type = type_  # type: ignore[unreachable]
-        type_ = type_.__value__  # type: ignore[unreachable]
+    if original_type is None and is_type_alias_type(type_):
+        # aliases can refer to themselves so we can only resolve the aliased type lazily
+        alias = type_  # type: ignore[unreachable]
+        constructor: _Constructor | None = None
+
+        def construct_alias(value: object) -> object:
+            nonlocal constructor
+            if constructor is None:
+                # store a reference to the original type so that we can properly resolve
+                # forward references in `TypeAliasType` annotations
+                constructor = _build_type_constructor(alias.__value__, meta, original_type=alias)
+            return constructor(value)
+
+        return construct_alias
 
     # unwrap `Annotated[T, ...]` -> `T`
-    if metadata is not None and len(metadata) > 0:
-        meta: tuple[Any, ...] = tuple(metadata)
-    elif is_annotated_type(type_):
+    if not meta and is_annotated_type(type_):
         meta = get_args(type_)[1:]
         type_ = extract_type_arg(type_, 0)
-    else:
-        meta = tuple()
 
     # we need to use the origin class for any types that are subscripted generics
     # e.g. Dict[str, object]
@@ -499,8 +658,85 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
     args = get_args(type_)
 
     if is_union(origin):
+        return _build_union_constructor(
+            union=type_,
+            validate_as=cast("type[object]", original_type or type_),
+            variants=args,
+            meta=meta,
+        )
+
+    if origin == dict:
+        if len(args) != 2:
+            return _return_value
+
+        construct_item = _get_type_constructor(args[1])  # Dict[_, items_type]
+
+        def construct_dict(value: object) -> object:
+            if not is_mapping(value):
+                return value
+            return {key: construct_item(item) for key, item in value.items()}
+
+        return construct_dict
+
+    if (
+        not is_literal_type(type_)
+        and inspect.isclass(origin)
+        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
+    ):
+        construct_model = cast(Any, type_).construct
+
+        def construct_basemodel(value: object) -> object:
+            if is_list(value):
+                return [construct_model(**entry) if is_mapping(entry) else entry for entry in value]
+
+            if is_mapping(value):
+                return construct_model(**value)
+
+            return value
+
+        return construct_basemodel
+
+    if origin == list:
+        if not args:
+            return _return_value
+
+        construct_entry = _get_type_constructor(args[0])  # List[inner_type]
+
+        def construct_list(value: object) -> object:
+            if not is_list(value):
+                return value
+            return [construct_entry(entry) for entry in value]
+
+        return construct_list
+
+    if origin == float:
+        return _construct_float
+
+    if type_ == datetime:
+        return _construct_datetime
+
+    if type_ == date:
+        return _construct_date
+
+    return _return_value
+
+
+def _build_union_constructor(
+    *,
+    union: type,
+    validate_as: type[object],
+    variants: tuple[Any, ...],
+    meta: tuple[Any, ...],
+) -> _Constructor:
+    validate = _get_validator(validate_as)
+    variant_constructors = [_get_type_constructor(variant) for variant in variants]
+    discriminator: DiscriminatorDetails | None = None
+
+    def construct_union(value: object) -> object:
+        nonlocal discriminator
+
         try:
-            return validate_type(type_=cast("type[object]", original_type or type_), value=value)
+            return validate(value)
         except Exception:
             pass
 
@@ -518,73 +754,64 @@ def construct_type(*, value: object, type_: object, metadata: Optional[List[Any]
         #
         # without this block, if the data we get is something like `{'kind': 'bar', 'value': 'foo'}` then
         # we'd end up constructing `FooType` when it should be `BarType`.
-        discriminator = _build_discriminated_union_meta(union=type_, meta_annotations=meta)
+        if discriminator is None:
+            discriminator = _build_discriminated_union_meta(union=union, meta_annotations=meta)
         if discriminator and is_mapping(value):
             variant_value = value.get(discriminator.field_alias_from or discriminator.field_name)
             if variant_value and isinstance(variant_value, str):
                 variant_type = discriminator.mapping.get(variant_value)
                 if variant_type:
-                    return construct_type(type_=variant_type, value=value)
+                    return _get_type_constructor(variant_type)(value)
 
         # if the data is not valid, use the first variant that doesn't fail while deserializing
-        for variant in args:
+        for construct_variant in variant_constructors:
             try:
-                return construct_type(value=value, type_=variant)
+                return construct_variant(value)
             except Exception:
                 continue
 
-        raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
+        raise RuntimeError(f"Could not convert data into a valid instance of {union}")
 
-    if origin == dict:
-        if not is_mapping(value):
-            return value
+    return construct_union
 
-        _, items_type = get_args(type_)  # Dict[_, items_type]
-        return {key: construct_type(value=item, type_=items_type) for key, item in value.items()}
 
-    if (
-        not is_literal_type(type_)
-        and inspect.isclass(origin)
-        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
-    ):
-        if is_list(value):
-            return [cast(Any, type_).construct(**entry) if is_mapping(entry) else entry for entry in value]
+def _get_validator(type_: type[object]) -> _Constructor:
+    if PYDANTIC_V2 and not (inspect.isclass(type_) and issubclass(type_, pydantic.BaseModel)):
+        try:
+            return TypeAdapter(type_).validate_python
+        except Exception:
+            # the error will be raised, and ignored, when validating instead
+            pass
 
-        if is_mapping(value):
-            if issubclass(type_, BaseModel):
-                return type_.construct(**value)  # type: ignore[arg-type]
+    return functools.partial(_validate_type, type_)
 
-            return cast(Any, type_).construct(**value)
 
-    if origin == list:
-        if not is_list(value):
+def _validate_type(type_: type[object], value: object) -> object:
+    return validate_type(type_=type_, value=value)
+
+
+def _construct_float(value: object) -> object:
+    if isinstance(value, int):
+        coerced = float(value)
+        if coerced != value:
             return value
+        return coerced
 
-        inner_type = args[0]  # List[inner_type]
-        return [construct_type(value=entry, type_=inner_type) for entry in value]
+    return value
 
-    if origin == float:
-        if isinstance(value, int):
-            coerced = float(value)
-            if coerced != value:
-                return value
-            return coerced
 
+def _construct_datetime(value: object) -> object:
+    try:
+        return parse_datetime(value)  # type: ignore
+    except Exception:
         return value
 
-    if type_ == datetime:
-        try:
-            return parse_datetime(value)  # type: ignore
-        except Exception:
-            return value
-
-    if type_ == date:
-        try:
-            return parse_date(value)  # type: ignore
-        except Exception:
-            return value
 
-    return value
+def _construct_date(value: object) -> object:
+    try:
+        return parse_date(value)  # type: ignore
+    except Exception:
+        return value
 
 
 @runtime_checkable
@@ -729,13 +956,23 @@ def set_pydantic_config(typ: Any, config: pydantic.ConfigDict) -> None:
     setattr(typ, "__pydantic_config__", config)  # noqa: B010
 
 
-def add_request_id(obj: BaseModel, request_id: str | None) -> None:
+class RawDict(Dict[str, object]):
+    """The decoded JSON object for a response, returned instead of a model when the
+    client is configured with `response_mode="raw"`.
+
+    This is a plain `dict` that additionally carries the `_request_id` of the response.
+    """
+
+    _request_id: Optional[str] = None
+
+
+def add_request_id(obj: BaseModel | RawDict, request_id: str | None) -> None:
     obj._request_id = request_id
 
     # in Pydantic v1, using setattr like we do above causes the attribute
     # to be included when serializing the model which we don't want in this
     # case so we need to explicitly exclude it
-    if not PYDANTIC_V2:
+    if not PYDANTIC_V2 and isinstance(obj, BaseModel):
         try:
             exclude_fields = obj.__exclude_fields__  # type: ignore
         except AttributeError:
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import re
+import time
+import logging
+import threading
+from typing import Dict, List, Tuple, Optional, NamedTuple
+from weakref import WeakKeyDictionary
+
+import anyio
+import httpx
+
+from ._utils import is_dict, is_list, is_mapping
+
+__all__ = ["RateLimiter", "RateLimitStatus"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+# the parts of a request body that count towards the input tokens
+_PROMPT_KEYS = ("messages", "input", "instructions", "prompt", "tools", "functions")
+_MAX_OUTPUT_KEYS = ("max_completion_tokens", "max_output_tokens", "max_tokens")
+
+# roughly how many characters of english text or JSON make up one token
+_CHARS_PER_TOKEN = 4
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Parses the durations used by the `x-ratelimit-reset-*` headers, e.g. `1s`, `6m0s` or `20ms`, into seconds."""
+    if not value:
+        return None
+
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(amount + unit for amount, unit in parts) != value.strip():
+        return None
+
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class RateLimitStatus(NamedTuple):
+    endpoint: str
+    """The path of the endpoint, e.g. `/chat/completions`"""
+
+    model: Optional[str]
+    """The model the requests were made for, if any"""
+
+    remaining_requests: Optional[float]
+    """The number of requests that can currently be sent without waiting, `None` if the API doesn't limit them"""
+
+    remaining_tokens: Optional[float]
+    """The number of tokens that can currently be used without waiting, `None` if the API doesn't limit them"""
+
+    queued: int
+    """The number of requests that are currently waiting for budget"""
+
+
+class _Bucket:
+    """A token bucket whose state is synced with the `limit`, `remaining` & `reset` rate limit headers.
+
+    Reservations are allowed to overdraw the bucket, the caller then has to wait until the
+    debt has been refilled which means that waiting requests are released in order.
+    """
+
+    capacity: float
+    available: float
+    refill_rate: float
+    updated_at: float
+    waiting: float
+    """The amount reserved by requests that are still waiting and so can't have been counted by the API yet"""
+
+    def __init__(self, *, now: float) -> None:
+        self.capacity = 0.0
+        self.available = 0.0
+        self.refill_rate = 0.0
+        self.updated_at = now
+        self.waiting = 0.0
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.available = min(self.capacity, self.available + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Takes the given amount from the bucket and returns how long to wait before using it."""
+        self.refill(now)
+
+        # requests larger than the bucket could otherwise never be sent
+        amount = min(amount, self.capacity)
+        self.available -= amount
+        if self.available >= 0 or self.refill_rate <= 0:
+            return 0.0
+
+        return -self.available / self.refill_rate
+
+    def sync(self, *, limit: float, remaining: float, reset: float | None, window: float, now: float) -> None:
+        self.capacity = limit
+        self.available = remaining - self.waiting
+        self.updated_at = now
+
+        if reset is not None and reset > 0 and remaining < limit:
+            # the API resets the budget to its limit in `reset` seconds
+            self.refill_rate = (limit - remaining) / reset
+        else:
+            self.refill_rate = limit / window
+
+
+class _Limits:
+    requests: _Bucket | None
+    tokens: _Bucket | None
+    queued: int
+    token_ratio: float
+    """How many tokens the API reported per estimated prompt token"""
+
+    def __init__(self) -> None:
+        self.requests = None
+        self.tokens = None
+        self.queued = 0
+        self.token_ratio = 1.0
+
+
+class _Reservation(NamedTuple):
+    key: Tuple[str, Optional[str]]
+    prompt_tokens: int
+    """The estimated number of input tokens, before it is corrected using the usage reported by the API"""
+
+    max_output_tokens: int
+
+
+class RateLimiter:
+    """Delays requests on the client so that the rate limits of your account are not exceeded.
+
+    The limiter tracks the `x-ratelimit-*` headers of every response and, once a
+    budget has been used up, holds back further requests to the same endpoint & model
+    until the API has replenished it instead of sending them only to receive a 429.
+
+    The tokens a request will use are estimated from its body before it is sent, and the
+    estimates are corrected over time using the `usage` that the API reports.
+
+    The same limiter can be shared by multiple sync & async clients, e.g.
+
+    ```py
+    from openai import OpenAI, RateLimiter
+
+    client = OpenAI(rate_limiter=RateLimiter())
+    ```
+    """
+
+    def __init__(self, *, window: float = 60.0) -> None:
+        """
+        Args:
+            window: The period, in seconds, that the limits returned by the API apply to. This is used to
+                estimate how quickly the budget is replenished when the API doesn't tell us.
+        """
+        self._window = window
+        self._lock = threading.Lock()
+        self._limits: Dict[Tuple[str, Optional[str]], _Limits] = {}
+        self._reservations: WeakKeyDictionary[httpx.Request, _Reservation] = WeakKeyDictionary()
+
+    def status(self) -> List[RateLimitStatus]:
+        """Returns the current budget & queue depth for every endpoint & model that requests have been made to."""
+        now = time.monotonic()
+        result: List[RateLimitStatus] = []
+        with self._lock:
+            for (endpoint, model), limits in self._limits.items():
+                remaining: List[Optional[float]] = []
+                for bucket in (limits.requests, limits.tokens):
+                    if bucket is None:
+                        remaining.append(None)
+                    else:
+                        bucket.refill(now)
+                        remaining.append(bucket.available)
+
+                result.append(
+                    RateLimitStatus(
+                        endpoint=endpoint,
+                        model=model,
+                        remaining_requests=remaining[0],
+                        remaining_tokens=remaining[1],
+                        queued=limits.queued,
+                    )
+                )
+        return result
+
+    def prepare(self, request: httpx.Request, *, endpoint: str, json_data: object) -> None:
+        """Estimates the tokens that the given request will use, this is called for every request that is built."""
+        model = json_data.get("model") if is_mapping(json_data) else None
+        prompt_tokens, max_output_tokens = estimate_tokens(json_data)
+        with self._lock:
+            self._reservations[request] = _Reservation(
+                key=(endpoint, model if isinstance(model, str) else None),
+                prompt_tokens=prompt_tokens,
+                max_output_tokens=max_output_tokens,
+            )
+
+    def prepare_retry(self, request: httpx.Request, *, previous: httpx.Request) -> None:
+        """Re-uses the estimate made for the previous attempt of a request that is retried."""
+        with self._lock:
+            reservation = self._reservations.get(previous)
+            if reservation is not None:
+                self._reservations[request] = reservation
+
+    def acquire(self, request: httpx.Request) -> None:
+        """Blocks the current thread until the request can be sent."""
+        key, tokens, delay = self._reserve(request)
+        if delay <= 0:
+            return
+
+        log.info("Rate limit budget for %s exhausted, delaying request by %f seconds", request.url, delay)
+        try:
+            time.sleep(delay)
+        finally:
+            self._release(key, tokens)
+
+    async def async_acquire(self, request: httpx.Request) -> None:
+        """Waits until the request can be sent."""
+        key, tokens, delay = self._reserve(request)
+        if delay <= 0:
+            return
+
+        log.info("Rate limit budget for %s exhausted, delaying request by %f seconds", request.url, delay)
+        try:
+            await anyio.sleep(delay)
+        finally:
+            self._release(key, tokens)
+
+    def update(self, response: httpx.Response) -> None:
+        """Syncs the budget with the rate limit headers of the given response."""
+        headers = response.headers
+        now = time.monotonic()
+        with self._lock:
+            reservation = self._reservations.get(response.request)
+            if reservation is None:
+                return
+
+            limits = None
+            for name in ("requests", "tokens"):
+                limit = _parse_number(headers.get(f"x-ratelimit-limit-{name}"))
+                remaining = _parse_number(headers.get(f"x-ratelimit-remaining-{name}"))
+                if limit is None or remaining is None or limit <= 0:
+                    continue
+
+                if limits is None:
+                    limits = self._limits.setdefault(reservation.key, _Limits())
+
+                bucket = getattr(limits, name)
+                if bucket is None:
+                    bucket = _Bucket(now=now)
+                    setattr(limits, name, bucket)
+
+                bucket.sync(
+                    limit=limit,
+                    remaining=remaining,
+                    reset=parse_reset_duration(headers.get(f"x-ratelimit-reset-{name}")),
+                    window=self._window,
+                    now=now,
+                )
+
+    def record_usage(self, response: httpx.Response, data: object) -> None:
+        """Corrects future token estimates using the `usage` the API reported for the given response."""
+        usage = data.get("usage") if is_dict(data) else None
+        if not is_dict(usage):
+            return
+
+        prompt_tokens = usage.get("prompt_tokens", usage.get("input_tokens"))
+        if not isinstance(prompt_tokens, int) or prompt_tokens <= 0:
+            return
+
+        with self._lock:
+            reservation = self._reservations.get(response.request)
+            if reservation is None or reservation.prompt_tokens <= 0:
+                return
+
+            limits = self._limits.setdefault(reservation.key, _Limits())
+            ratio = min(max(prompt_tokens / reservation.prompt_tokens, 0.25), 4.0)
+            limits.token_ratio += (ratio - limits.token_ratio) * 0.2
+
+    def _reserve(self, request: httpx.Request) -> Tuple[Tuple[str, Optional[str]], float, float]:
+        """Returns the key & the tokens that were reserved for the request, and how long it has to wait."""
+        with self._lock:
+            reservation = self._reservations.get(request)
+            if reservation is None:
+                return ("", None), 0.0, 0.0
+
+            limits = self._limits.get(reservation.key)
+            if limits is None:
+                # we haven't seen any rate limit headers for this endpoint yet
+                return reservation.key, 0.0, 0.0
+
+            tokens = reservation.prompt_tokens * limits.token_ratio + reservation.max_output_tokens
+
+            now = time.monotonic()
+            delay = 0.0
+            for bucket, amount in ((limits.requests, 1), (limits.tokens, tokens)):
+                if bucket is not None:
+                    delay = max(delay, bucket.reserve(amount, now))
+
+            if delay <= 0:
+                return reservation.key, tokens, 0.0
+
+            limits.queued += 1
+            for bucket, amount in ((limits.requests, 1), (limits.tokens, tokens)):
+                if bucket is not None:
+                    bucket.waiting += amount
+
+            return reservation.key, tokens, delay
+
+    def _release(self, key: Tuple[str, Optional[str]], tokens: float) -> None:
+        with self._lock:
+            limits = self._limits[key]
+            limits.queued -= 1
+            for bucket, amount in ((limits.requests, 1), (limits.tokens, tokens)):
+                if bucket is not None:
+                    bucket.waiting = max(bucket.waiting - amount, 0)
+
+
+def estimate_tokens(json_data: object) -> Tuple[int, int]:
+    """Cheaply estimates the number of input tokens of the given request body and returns it together
+    with the maximum number of output tokens that were requested.
+
+    The API counts both towards the tokens per minute limit when a request is admitted.
+    """
+    if not is_mapping(json_data):
+        return 0, 0
+
+    chars = 0
+    tokens = 0
+    stack: List[object] = [json_data[key] for key in _PROMPT_KEYS if key in json_data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            # base64 encoded files & images are not billed by their size
+            if not value.startswith("data:"):
+                chars += len(value)
+        elif is_mapping(value):
+            for key, item in value.items():
+                chars += len(key)
+                stack.append(item)
+        elif is_list(value):
+            stack.extend(value)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            # embeddings inputs can be given as token ids
+            tokens += 1
+
+    max_output_tokens = 0
+    for key in _MAX_OUTPUT_KEYS:
+        value = json_data.get(key)
+        if isinstance(value, int):
+            max_output_tokens = value
+            break
+
+    return tokens + -(-chars // _CHARS_PER_TOKEN), max_output_tokens
+
+
+def _parse_number(value: str | None) -> float | None:
+    if value is None:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
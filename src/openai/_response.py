@@ -26,7 +26,7 @@ import pydantic
 
 from ._types import NoneType
 from ._utils import is_given, extract_type_arg, is_annotated_type, is_type_alias_type, extract_type_var_from_base
-from ._models import BaseModel, is_basemodel, add_request_id
+from ._models import RawDict, BaseModel, is_basemodel, add_request_id
 from ._constants import RAW_RESPONSE_HEADER, OVERRIDE_CAST_TO_HEADER
 from ._streaming import Stream, AsyncStream, is_stream_class_type, extract_stream_chunk_type
 from ._exceptions import OpenAIError, APIResponseValidationError
@@ -227,6 +227,7 @@ class BaseAPIResponse(Generic[R]):
             cast_to is not object
             and not origin is list
             and not origin is dict
+            and not origin is RawDict
             and not origin is Union
             and not issubclass(origin, BaseModel)
         ):
@@ -240,7 +241,7 @@ class BaseAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = self._client._json_loads(response.content)
                 except Exception as exc:
                     log.debug("Could not read JSON from response data due to %s - %s", type(exc), exc)
                 else:
@@ -262,7 +263,7 @@ class BaseAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = self._client._json_loads(response.content)
 
         return self._client._process_response_data(
             data=data,
@@ -324,7 +325,7 @@ class APIResponse(BaseAPIResponse[R]):
         if is_given(self._options.post_parser):
             parsed = self._options.post_parser(parsed)
 
-        if isinstance(parsed, BaseModel):
+        if isinstance(parsed, (BaseModel, RawDict)):
             add_request_id(parsed, self.request_id)
 
         self._parsed_by_type[cache_key] = parsed
@@ -348,7 +349,7 @@ class APIResponse(BaseAPIResponse[R]):
     def json(self) -> object:
         """Read and decode the JSON response content."""
         self.read()
-        return self.http_response.json()
+        return self._client._json_loads(self.http_response.content)
 
     def close(self) -> None:
         """Close the response and release the connection.
@@ -431,7 +432,7 @@ class AsyncAPIResponse(BaseAPIResponse[R]):
         if is_given(self._options.post_parser):
             parsed = self._options.post_parser(parsed)
 
-        if isinstance(parsed, BaseModel):
+        if isinstance(parsed, (BaseModel, RawDict)):
             add_request_id(parsed, self.request_id)
 
         self._parsed_by_type[cache_key] = parsed
@@ -455,7 +456,7 @@ class AsyncAPIResponse(BaseAPIResponse[R]):
     async def json(self) -> object:
         """Read and decode the JSON response content."""
         await self.read()
-        return self.http_response.json()
+        return self._client._json_loads(self.http_response.content)
 
     async def close(self) -> None:
         """Close the response and release the connection.
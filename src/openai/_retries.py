@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import re
+import time
+import random
+import logging
+import threading
+from typing import List, Tuple, Mapping, Optional, NamedTuple
+from collections import OrderedDict
+from typing_extensions import Literal
+
+import httpx
+
+from ._constants import MAX_RETRY_DELAY, INITIAL_RETRY_DELAY
+from ._exceptions import CircuitBreakerOpenError
+
+__all__ = ["RetryPolicy", "RetryBudget", "RetryBudgetStatus", "CircuitBreaker", "CircuitStatus"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+
+class RetryPolicy:
+    """Controls how long a client waits between retries and when it stops retrying.
+
+    The default backoff only applies a little jitter, so when many clients fail at the same
+    time they also retry at roughly the same time. The strategies here spread them out:
+
+    - `"full_jitter"`: waits a random time between zero and the exponential backoff,
+      `min(max_delay, initial_delay * 2 ** retries)`.
+    - `"decorrelated_jitter"`: waits a random time between `initial_delay` and three times
+      the previous wait, capped at `max_delay`.
+    - `"server_hint_first"`: waits exactly as long as the `retry-after` response header asks
+      for, falling back to full jitter when the header is missing.
+
+    With the jitter strategies a `retry-after` header is used as the minimum wait. Headers
+    asking for more than `max_retry_after` seconds are ignored.
+
+    ```py
+    from openai import OpenAI, RetryPolicy
+
+    client = OpenAI(
+        max_retries=5,
+        retry_policy=RetryPolicy(
+            strategy="decorrelated_jitter",
+            # don't retry server errors more than once
+            max_retries_by_status={500: 1, 503: 1},
+            max_elapsed=30,
+        ),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        strategy: Literal["full_jitter", "decorrelated_jitter", "server_hint_first"] = "full_jitter",
+        initial_delay: float = INITIAL_RETRY_DELAY,
+        max_delay: float = MAX_RETRY_DELAY,
+        max_retry_after: float = 60.0,
+        max_retries_by_status: Optional[Mapping[int, int]] = None,
+        max_elapsed: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            strategy: How the wait before each retry is computed.
+            initial_delay: The wait, in seconds, before the first retry.
+            max_delay: The maximum wait, in seconds, between two attempts.
+            max_retry_after: The longest wait, in seconds, requested by a `retry-after` header that is obeyed.
+            max_retries_by_status: How often responses with the given status codes are retried at most,
+                `0` disables retries for a status code. `max_retries` still applies to every request.
+            max_elapsed: The time, in seconds, after which a request isn't retried anymore, counted from
+                when the first attempt was sent.
+        """
+        self.strategy = strategy
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.max_retries_by_status = dict(max_retries_by_status or {})
+        self.max_elapsed = max_elapsed
+
+    def allows_retry(self, *, retries_taken: int, status_code: Optional[int], elapsed: float) -> bool:
+        """Returns whether the attempt that failed with the given status code, if any, may be retried."""
+        if self.max_elapsed is not None and elapsed >= self.max_elapsed:
+            log.debug("Not retrying as the request has been retried for %f seconds", elapsed)
+            return False
+
+        limit = self.max_retries_by_status.get(status_code) if status_code is not None else None
+        if limit is not None and retries_taken >= limit:
+            log.debug("Not retrying as responses with status code %i are retried at most %i times", status_code, limit)
+            return False
+
+        return True
+
+    def compute_timeout(
+        self,
+        *,
+        retries_taken: int,
+        retry_after: Optional[float],
+        previous_timeout: Optional[float],
+        elapsed: float,
+    ) -> float:
+        """Returns how long to wait, in seconds, before the next attempt."""
+        if retry_after is not None and not 0 < retry_after <= self.max_retry_after:
+            retry_after = None
+
+        if self.strategy == "server_hint_first" and retry_after is not None:
+            timeout = retry_after
+        else:
+            if self.strategy == "decorrelated_jitter":
+                upper = (previous_timeout or self.initial_delay) * 3
+                timeout = min(self.max_delay, random.uniform(self.initial_delay, max(upper, self.initial_delay)))
+            else:
+                # cap the exponent to avoid any potential overflows with `pow`
+                backoff = min(self.initial_delay * pow(2.0, min(retries_taken, 1000)), self.max_delay)
+                timeout = random.uniform(0, backoff)
+
+            if retry_after is not None:
+                timeout = max(timeout, retry_after)
+
+        if self.max_elapsed is not None:
+            timeout = min(timeout, max(self.max_elapsed - elapsed, 0))
+
+        return timeout
+
+
+class RetryState:
+    """Tracks the retries of a single request."""
+
+    started_at: float
+    previous_timeout: Optional[float]
+
+    def __init__(self) -> None:
+        self.started_at = time.monotonic()
+        self.previous_timeout = None
+
+
+class RetryBudgetStatus(NamedTuple):
+    available: float
+    """The number of retries that can currently be made"""
+
+    retried: int
+    """The total number of retries that were allowed"""
+
+    denied: int
+    """The total number of retries that were skipped because the budget was used up"""
+
+
+class RetryBudget:
+    """Limits the retries made by a client to a fraction of its successful requests.
+
+    Without a budget every failing request is retried up to `max_retries` times, so during
+    an outage the load sent to the API is multiplied exactly when it is struggling.
+
+    Every successful request adds `ratio` to the budget and every retry takes one from it.
+    Up to `burst` retries can be saved up so that occasional errors are still retried
+    when there is little traffic.
+
+    ```py
+    from openai import OpenAI, RetryBudget
+
+    # retry at most 1 in 10 requests
+    client = OpenAI(retry_budget=RetryBudget(ratio=0.1))
+    ```
+    """
+
+    def __init__(self, *, ratio: float = 0.2, burst: int = 10) -> None:
+        self._ratio = ratio
+        self._burst = burst
+        self._lock = threading.Lock()
+        self._available = float(burst)
+        self._retried = 0
+        self._denied = 0
+
+    def status(self) -> RetryBudgetStatus:
+        with self._lock:
+            return RetryBudgetStatus(available=self._available, retried=self._retried, denied=self._denied)
+
+    def acquire(self) -> bool:
+        """Takes a retry from the budget, returns `False` if there is none left."""
+        with self._lock:
+            if self._available < 1:
+                self._denied += 1
+                return False
+
+            self._available -= 1
+            self._retried += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._available = min(self._available + self._ratio, self._burst)
+
+
+# the most circuits that are kept, the least recently used ones are dropped first
+_MAX_CIRCUITS = 1000
+
+# the segments of a path that are part of the endpoint, any other segment is an ID
+_ENDPOINT_SEGMENT = re.compile(r"^(?:[a-z_]+|v[0-9]+)$")
+
+
+class CircuitStatus(NamedTuple):
+    host: str
+    path: str
+
+    state: Literal["closed", "open", "half_open"]
+    """`open` while requests are failed without being sent, `half_open` while a single trial request is allowed"""
+
+    consecutive_failures: int
+    """The number of connection errors & 5xx responses since the last successful request"""
+
+    rejected: int
+    """The total number of requests that were failed without being sent"""
+
+
+class _Circuit:
+    state: Literal["closed", "open", "half_open"]
+    consecutive_failures: int
+    opened_at: float
+    rejected: int
+
+    def __init__(self) -> None:
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """Fails requests to an endpoint without sending them after repeated connection errors or 5xx responses.
+
+    Once `failure_threshold` consecutive requests to the same host & endpoint have failed, the
+    circuit is opened and further requests raise `CircuitBreakerOpenError` immediately,
+    without being retried. After `recovery_time` seconds a single trial request is let
+    through, which closes the circuit again if it succeeds. Endpoints are identified by their
+    path with the IDs replaced by `{id}`, e.g. `/v1/files/{id}`, and only the state of the
+    most recently used endpoints is kept.
+
+    ```py
+    from openai import OpenAI, CircuitBreaker
+
+    client = OpenAI(circuit_breaker=CircuitBreaker(failure_threshold=5, recovery_time=30))
+    ```
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_time: float = 30.0) -> None:
+        self._failure_threshold = failure_threshold
+        self._recovery_time = recovery_time
+        self._lock = threading.Lock()
+        self._circuits: OrderedDict[Tuple[str, str], _Circuit] = OrderedDict()
+
+    def status(self) -> List[CircuitStatus]:
+        """Returns the state of every host & endpoint that requests have failed for."""
+        with self._lock:
+            return [
+                CircuitStatus(
+                    host=host,
+                    path=path,
+                    state=circuit.state,
+                    consecutive_failures=circuit.consecutive_failures,
+                    rejected=circuit.rejected,
+                )
+                for (host, path), circuit in self._circuits.items()
+            ]
+
+    def acquire(self, request: httpx.Request) -> None:
+        """Raises `CircuitBreakerOpenError` if the given request should not be sent."""
+        with self._lock:
+            circuit = self._circuits.get(_circuit_key(request))
+            if circuit is None or circuit.state == "closed":
+                return
+
+            now = time.monotonic()
+            if now - circuit.opened_at >= self._recovery_time:
+                # let a single trial request through, if it never reports back another
+                # one is allowed once `recovery_time` has passed again
+                circuit.state = "half_open"
+                circuit.opened_at = now
+                return
+
+            circuit.rejected += 1
+
+        log.debug("Not sending request as the circuit breaker for %s is open", request.url)
+        raise CircuitBreakerOpenError(request=request)
+
+    def record(self, request: httpx.Request, response: httpx.Response | None) -> None:
+        """Records the outcome of a request, a `None` response means that it failed with a connection error."""
+        failed = response is None or response.status_code >= 500
+        with self._lock:
+            key = _circuit_key(request)
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                if not failed:
+                    return
+                if len(self._circuits) >= _MAX_CIRCUITS:
+                    self._circuits.popitem(last=False)
+                circuit = self._circuits[key] = _Circuit()
+            else:
+                self._circuits.move_to_end(key)
+
+            if not failed:
+                circuit.state = "closed"
+                circuit.consecutive_failures = 0
+                return
+
+            circuit.consecutive_failures += 1
+            if circuit.state == "half_open" or circuit.consecutive_failures >= self._failure_threshold:
+                if circuit.state != "open":
+                    log.info("Opening circuit breaker for %s", request.url)
+                circuit.state = "open"
+                circuit.opened_at = time.monotonic()
+
+
+def _circuit_key(request: httpx.Request) -> Tuple[str, str]:
+    # e.g. `/v1/files/file-abc123/content` -> `/v1/files/{id}/content`, so that
+    # requests for different objects share the circuit of their endpoint
+    path = "/".join(
+        segment if not segment or _ENDPOINT_SEGMENT.match(segment) else "{id}"
+        for segment in request.url.path.split("/")
+    )
+    return request.url.host, path
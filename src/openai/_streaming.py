@@ -3,13 +3,15 @@ from __future__ import annotations
 
 import json
 import inspect
+import threading
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, AsyncIterator, cast
+from typing import TYPE_CHECKING, Any, Deque, Generic, TypeVar, Iterator, AsyncIterator, cast
+from collections import deque
 from typing_extensions import Self, Protocol, TypeGuard, override, get_origin, runtime_checkable
 
 import httpx
 
-from ._utils import is_mapping, extract_type_var_from_base
+from ._utils import is_list, is_mapping, extract_type_var_from_base
 from ._exceptions import APIError
 
 if TYPE_CHECKING:
@@ -17,10 +19,20 @@ if TYPE_CHECKING:
 
 
 _T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# how long `Stream.close()` waits for a prefetching thread to finish its current read
+_PREFETCH_STOP_TIMEOUT = 0.1
 
 
 class Stream(Generic[_T]):
-    """Provides the core interface to iterate over a synchronous stream response."""
+    """Provides the core interface to iterate over a synchronous stream response.
+
+    With `prefetch=N`, or the `stream_prefetch` client option, the response is read, decoded &
+    constructed on a background thread, up to `N` events ahead of the code iterating over the
+    stream, so that slow work done for every event doesn't hold up reading the next ones.
+    Errors are raised by the iteration after the events received before them.
+    """
 
     response: httpx.Response
 
@@ -32,12 +44,20 @@ class Stream(Generic[_T]):
         cast_to: type[_T],
         response: httpx.Response,
         client: OpenAI,
+        prefetch: int | None = None,
     ) -> None:
         self.response = response
         self._cast_to = cast_to
         self._client = client
         self._decoder = client._make_sse_decoder()
-        self._iterator = self.__stream__()
+        if prefetch is None:
+            # only the sync client has the option, but `response.parse(to=Stream[...])` can be given any client
+            prefetch = getattr(client, "_stream_prefetch", None)
+        if prefetch is not None and prefetch < 0:
+            raise ValueError(f"Expected `prefetch` to be at least 0 but got {prefetch}")
+        self._prefetch = prefetch
+        self._reader: _PrefetchReader[Any] | None = None
+        self._iterator = self._read(self.__stream__())
 
     def __next__(self) -> _T:
         return self._iterator.__next__()
@@ -53,6 +73,47 @@ class Stream(Generic[_T]):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+
+        for data in self._iter_data():
+            yield process_data(data=data, cast_to=cast_to, response=response)
+
+    def text_deltas(self) -> Iterator[str]:
+        """Iterates over just the text deltas in the stream, without constructing the events.
+
+        The text is read straight from the decoded JSON of every event: the content of chat
+        completion chunks & completions, `response.output_text.delta` & `transcript.text.delta`
+        events and the text of Assistants `thread.message.delta` events. Other events are skipped.
+        For chat completions & completions requested with `n > 1`, only the first choice is read.
+
+        This reads the stream, so it can't be combined with iterating over the stream itself.
+
+        ```py
+        for text in stream.text_deltas():
+            print(text, end="", flush=True)
+        ```
+        """
+        for data in self._read(self._iter_data()):
+            yield from iter_text_deltas(data)
+
+    def _read(self, iterator: Iterator[_R]) -> Iterator[_R]:
+        """Returns the given iterator, which is read on a background thread if prefetching is enabled."""
+        if not self._prefetch:
+            return iterator
+        return self._prefetched(iterator, self._prefetch)
+
+    def _prefetched(self, iterator: Iterator[_R], size: int) -> Iterator[_R]:
+        # the thread is only started once the iteration starts
+        reader = _PrefetchReader(iterator, size=size, response=self.response)
+        self._reader = reader
+        try:
+            yield from reader
+        finally:
+            # e.g. when the iterator is garbage collected before it's exhausted
+            reader.stop()
+
+    def _iter_data(self) -> Iterator[object]:
+        """Yields the decoded JSON of every event, raising an `APIError` for error events."""
+        json_loads = self._client._json_loads
         iterator = self._iter_events()
 
         for sse in iterator:
@@ -61,7 +122,7 @@ class Stream(Generic[_T]):
 
             # we have to special case the Assistants `thread.` events since we won't have an "event" key in the data
             if sse.event and sse.event.startswith("thread."):
-                data = sse.json()
+                data = json_loads(sse.data)
 
                 if sse.event == "error" and is_mapping(data) and data.get("error"):
                     message = None
@@ -77,9 +138,9 @@ class Stream(Generic[_T]):
                         body=data["error"],
                     )
 
-                yield process_data(data={"data": data, "event": sse.event}, cast_to=cast_to, response=response)
+                yield {"data": data, "event": sse.event}
             else:
-                data = sse.json()
+                data = json_loads(sse.data)
                 if is_mapping(data) and data.get("error"):
                     message = None
                     error = data.get("error")
@@ -94,7 +155,7 @@ class Stream(Generic[_T]):
                         body=data["error"],
                     )
 
-                yield process_data(data=data, cast_to=cast_to, response=response)
+                yield data
 
         # Ensure the entire stream is consumed
         for _sse in iterator:
@@ -116,7 +177,12 @@ class Stream(Generic[_T]):
         Close the response and release the connection.
 
         Automatically called if the response body is read to completion.
+
+        When the stream is prefetched, the background thread is stopped & the events it has
+        read are discarded, the response is closed even if the thread is still waiting for a read.
         """
+        if self._reader is not None:
+            self._reader.stop(timeout=_PREFETCH_STOP_TIMEOUT)
         self.response.close()
 
 
@@ -155,6 +221,32 @@ class AsyncStream(Generic[_T]):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+
+        async for data in self._iter_data():
+            yield process_data(data=data, cast_to=cast_to, response=response)
+
+    async def text_deltas(self) -> AsyncIterator[str]:
+        """Iterates over just the text deltas in the stream, without constructing the events.
+
+        The text is read straight from the decoded JSON of every event: the content of chat
+        completion chunks & completions, `response.output_text.delta` & `transcript.text.delta`
+        events and the text of Assistants `thread.message.delta` events. Other events are skipped.
+        For chat completions & completions requested with `n > 1`, only the first choice is read.
+
+        This reads the stream, so it can't be combined with iterating over the stream itself.
+
+        ```py
+        async for text in stream.text_deltas():
+            print(text, end="", flush=True)
+        ```
+        """
+        async for data in self._iter_data():
+            for text in iter_text_deltas(data):
+                yield text
+
+    async def _iter_data(self) -> AsyncIterator[object]:
+        """Yields the decoded JSON of every event, raising an `APIError` for error events."""
+        json_loads = self._client._json_loads
         iterator = self._iter_events()
 
         async for sse in iterator:
@@ -163,7 +255,7 @@ class AsyncStream(Generic[_T]):
 
             # we have to special case the Assistants `thread.` events since we won't have an "event" key in the data
             if sse.event and sse.event.startswith("thread."):
-                data = sse.json()
+                data = json_loads(sse.data)
 
                 if sse.event == "error" and is_mapping(data) and data.get("error"):
                     message = None
@@ -179,9 +271,9 @@ class AsyncStream(Generic[_T]):
                         body=data["error"],
                     )
 
-                yield process_data(data={"data": data, "event": sse.event}, cast_to=cast_to, response=response)
+                yield {"data": data, "event": sse.event}
             else:
-                data = sse.json()
+                data = json_loads(sse.data)
                 if is_mapping(data) and data.get("error"):
                     message = None
                     error = data.get("error")
@@ -196,7 +288,7 @@ class AsyncStream(Generic[_T]):
                         body=data["error"],
                     )
 
-                yield process_data(data=data, cast_to=cast_to, response=response)
+                yield data
 
         # Ensure the entire stream is consumed
         async for _sse in iterator:
@@ -222,6 +314,120 @@ class AsyncStream(Generic[_T]):
         await self.response.aclose()
 
 
+class _PrefetchReader(Generic[_T]):
+    """Reads an iterator on a background thread into a queue of at most `size` items.
+
+    The thread closes the response itself when it's stopped, `Stream.close()` closes it
+    too in case the thread is blocked in a read that doesn't return.
+    """
+
+    def __init__(self, iterator: Iterator[_T], *, size: int, response: httpx.Response) -> None:
+        self._iterator = iterator
+        self._size = size
+        self._response = response
+        self._items: Deque[_T] = deque()
+        self._condition = threading.Condition()
+        self._error: BaseException | None = None
+        self._done = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="openai-stream-prefetch", daemon=True)
+        self._thread.start()
+
+    def __iter__(self) -> Iterator[_T]:
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._items and not self._done and not self._stopped:
+                    condition.wait()
+
+                if self._stopped:
+                    return
+                if not self._items:
+                    if self._error is not None:
+                        raise self._error
+                    return
+
+                item = self._items.popleft()
+                condition.notify_all()
+            yield item
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        """Stops reading, waiting at most `timeout` seconds for the thread to finish its current read.
+
+        The thread closes the response once it's done, if it's blocked in a read, e.g. because
+        the server went idle, it's left running & finishes when the read returns or fails.
+        """
+        with self._condition:
+            self._stopped = True
+            self._items.clear()
+            self._condition.notify_all()
+        if timeout is not None and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        condition = self._condition
+        try:
+            for item in self._iterator:
+                with condition:
+                    while len(self._items) >= self._size and not self._stopped:
+                        condition.wait()
+                    if self._stopped:
+                        break
+                    self._items.append(item)
+                    condition.notify_all()
+        except BaseException as err:
+            with condition:
+                self._error = err
+        finally:
+            with condition:
+                self._done = True
+                stopped = self._stopped
+                condition.notify_all()
+            if stopped:
+                self._response.close()
+
+
+def iter_text_deltas(data: object) -> Iterator[str]:
+    """Yields the text deltas in the decoded JSON of a stream event."""
+    if not is_mapping(data):
+        return
+
+    event = data.get("event")
+    if event is not None:
+        # Assistants events, see `Stream._iter_data()`
+        if event == "thread.message.delta":
+            message = data.get("data")
+            delta = message.get("delta") if is_mapping(message) else None
+            content = delta.get("content") if is_mapping(delta) else None
+            for block in content if is_list(content) else ():
+                if is_mapping(block) and block.get("type") == "text":
+                    text = block.get("text")
+                    value = text.get("value") if is_mapping(text) else None
+                    if isinstance(value, str) and value:
+                        yield value
+        return
+
+    type_ = data.get("type")
+    if type_ is not None:
+        if type_ == "response.output_text.delta" or type_ == "transcript.text.delta":
+            delta = data.get("delta")
+            if isinstance(delta, str) and delta:
+                yield delta
+        return
+
+    choices = data.get("choices")
+    for choice in choices if is_list(choices) else ():
+        # the choices of requests with `n > 1` are interleaved, so only the first one is read
+        if not is_mapping(choice) or choice.get("index", 0) != 0:
+            continue
+
+        delta = choice.get("delta")
+        # chat completion chunks have a `delta`, completions have the `text` itself
+        text = delta.get("content") if is_mapping(delta) else choice.get("text")
+        if isinstance(text, str) and text:
+            yield text
+
+
 class ServerSentEvent:
     def __init__(
         self,
@@ -368,6 +574,121 @@ class SSEDecoder:
         return None
 
 
+class BufferedSSEDecoder(SSEDecoder):
+    """An `SSEBytesDecoder` that decodes every chunk in a single pass.
+
+    Unlike `SSEDecoder`, incoming data is never re-joined line by line: all of the
+    complete lines in a chunk are decoded at once and only a trailing partial line
+    is ever copied into a reusable `bytearray` until the rest of it arrives.
+    """
+
+    _buffer: bytearray
+    _pending_lf: bool
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+        # a trailing `\r` may be the first half of a `\r\n` pair split across chunks
+        self._pending_lf = False
+
+    @override
+    def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
+        """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
+        feed = self._feed
+        for chunk in iterator:
+            yield from feed(chunk)
+        yield from self._flush()
+
+    @override
+    async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
+        """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
+        feed = self._feed
+        async for chunk in iterator:
+            for sse in feed(chunk):
+                yield sse
+        for sse in self._flush():
+            yield sse
+
+    def _feed(self, chunk: bytes) -> list[ServerSentEvent]:
+        if b"\r" in chunk or self._pending_lf:
+            return self._decode_lines(self._split_lines(chunk))
+
+        buffer = self._buffer
+
+        # only the new chunk has to be scanned, everything already buffered is known to be an incomplete line
+        end = chunk.rfind(b"\n") + 1
+        if not end:
+            buffer += chunk
+            return []
+
+        # `\n` can never be part of a multi-byte UTF-8 sequence so all of the
+        # complete lines can be decoded at once and split afterwards
+        if buffer:
+            buffer += chunk[:end]
+            text = buffer.decode("utf-8")
+            buffer.clear()
+        else:
+            text = chunk.decode("utf-8") if end == len(chunk) else chunk[:end].decode("utf-8")
+
+        if end < len(chunk):
+            buffer += chunk[end:]
+
+        lines = text.split("\n")
+        lines.pop()
+        return self._decode_lines(lines)
+
+    def _split_lines(self, chunk: bytes) -> list[str]:
+        """Slower path for chunks that may contain `\r` line endings"""
+        buffer = self._buffer
+
+        start = 0
+        if self._pending_lf:
+            self._pending_lf = False
+            if chunk[:1] == b"\n":
+                start = 1
+
+        end = max(chunk.rfind(b"\n"), chunk.rfind(b"\r")) + 1
+        if end <= start:
+            buffer += chunk[start:]
+            return []
+
+        if chunk[end - 1] == 0x0D and end == len(chunk):
+            self._pending_lf = True
+
+        buffer += chunk[start:end]
+        # `bytes.splitlines()` only splits on `\r`, `\n` and `\r\n` which is exactly what the SSE spec requires
+        lines = [raw_line.decode("utf-8") for raw_line in buffer.splitlines()]
+        buffer.clear()
+        buffer += chunk[end:]
+        return lines
+
+    def _decode_lines(self, lines: list[str]) -> list[ServerSentEvent]:
+        events: list[ServerSentEvent] = []
+        data = self._data
+        for line in lines:
+            # fast path for the overwhelmingly common case, a `data: ...` line
+            if line.startswith("data: "):
+                data.append(line[6:])
+                continue
+
+            sse = self.decode(line)
+            if sse is not None:
+                events.append(sse)
+                data = self._data
+
+        return events
+
+    def _flush(self) -> list[ServerSentEvent]:
+        # as per the SSE spec, an event that isn't terminated by a blank line is not dispatched
+        # but we still feed the trailing line through so that the decoder state stays consistent
+        if not self._buffer:
+            return []
+
+        line = self._buffer.decode("utf-8")
+        self._buffer.clear()
+        return self._decode_lines([line])
+
+
 @runtime_checkable
 class SSEBytesDecoder(Protocol):
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
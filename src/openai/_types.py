@@ -166,6 +166,21 @@ class ModelBuilderProtocol(Protocol):
     ) -> _T: ...
 
 
+class JSONBackend(Protocol):
+    """Any object that can encode & decode JSON, e.g. the `json` or `orjson` modules.
+
+    ```py
+    import orjson
+
+    client = OpenAI(json_backend=orjson)
+    ```
+    """
+
+    def loads(self, __obj: str | bytes) -> Any: ...
+
+    def dumps(self, __obj: Any) -> str | bytes: ...
+
+
 Headers = Mapping[str, Union[str, Omit]]
 
 
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+from typing import List, Iterator, AsyncIterator, cast
+
+# the size, in characters, of the chunks that the encoded body is sent in
+CHUNK_SIZE = 64 * 1024
+
+_encode_str = json.encoder.encode_basestring
+
+
+def iter_json(value: object, *, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Encodes the given value as JSON in chunks of roughly `chunk_size` characters.
+
+    The chunks join to the same bytes as `json.dumps(value, ensure_ascii=False, separators=(",", ":"))`,
+    which is how httpx encodes `json=` bodies, without the encoded value ever being held in
+    memory as a whole. Strings longer than `chunk_size` are split across chunks.
+    """
+    parts: List[str] = []
+    size = 0
+    for part in _iter_parts(value, chunk_size):
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(parts).encode("utf-8")
+            parts.clear()
+            size = 0
+
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+def _iter_parts(value: object, chunk_size: int) -> Iterator[str]:
+    if isinstance(value, str):
+        if len(value) <= chunk_size:
+            yield _encode_str(value)
+            return
+
+        yield '"'
+        for start in range(0, len(value), chunk_size):
+            # escaping is done per character so the string can be split anywhere
+            yield _encode_str(value[start : start + chunk_size])[1:-1]
+        yield '"'
+    elif isinstance(value, dict):
+        yield "{"
+        for index, (key, item) in enumerate(cast("dict[object, object]", value).items()):
+            yield f"{',' if index else ''}{_encode_str(_encode_key(key))}:"
+            yield from _iter_parts(item, chunk_size)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for index, item in enumerate(cast("list[object]", value)):
+            if index:
+                yield ","
+            yield from _iter_parts(item, chunk_size)
+        yield "]"
+    else:
+        yield json.dumps(value, allow_nan=False)
+
+
+def _encode_key(key: object) -> str:
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        # `json.dumps()` converts these keys the same way as values
+        return json.dumps(key, allow_nan=False)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+class JSONBodyStream:
+    """A request body that is encoded while it is being sent, every time it is iterated over.
+
+    Unlike a generator this can be iterated over more than once, so that requests using it can be retried.
+    """
+
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter_json(self._value)
+
+
+class AsyncJSONBodyStream:
+    """The async counterpart of `JSONBodyStream`, for requests sent by an `httpx.AsyncClient`."""
+
+    def __init__(self, value: object) -> None:
+        self._value = value
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in iter_json(self._value):
+            yield chunk
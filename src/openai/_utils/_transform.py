@@ -3,7 +3,8 @@ from __future__ import annotations
 import io
 import base64
 import pathlib
-from typing import Any, Mapping, TypeVar, cast
+import threading
+from typing import Any, Mapping, TypeVar, Iterable, Iterator, cast
 from datetime import date, datetime
 from typing_extensions import Literal, get_args, override, get_type_hints as _get_type_hints
 
@@ -106,7 +107,7 @@ def transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = _transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = _get_transform_plan(cast(type, expected_type)).transform(data)
     return cast(_T, transformed)
 
 
@@ -149,84 +150,6 @@ def _no_transform_needed(annotation: type) -> bool:
     return annotation == float or annotation == int
 
 
-def _transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
-
-    Args:
-        annotation: The direct type annotation given to the particular piece of data.
-            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
-
-        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
-            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
-            the list can be transformed using the metadata from the container type.
-
-            Defaults to the same value as the `annotation` argument.
-    """
-    if inner_type is None:
-        inner_type = annotation
-
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return _transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = _transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
-
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json", exclude=getattr(data, "__api_exclude__", None))
-
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
-
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return _format_data(data, annotation.format, annotation.format_template)
-
-    return data
-
-
 def _format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
     if isinstance(data, (date, datetime)):
         if format_ == "iso8601":
@@ -254,27 +177,6 @@ def _format_data(data: object, format_: PropertyFormat, format_template: str | N
     return data
 
 
-def _transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include `NotGiven` values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = _transform_recursive(value, annotation=type_)
-    return result
-
-
 async def async_maybe_transform(
     data: object,
     expected_type: object,
@@ -307,88 +209,10 @@ async def async_transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = await _async_transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = await _get_transform_plan(cast(type, expected_type)).async_transform(data)
     return cast(_T, transformed)
 
 
-async def _async_transform_recursive(
-    data: object,
-    *,
-    annotation: type,
-    inner_type: type | None = None,
-) -> object:
-    """Transform the given data against the expected type.
-
-    Args:
-        annotation: The direct type annotation given to the particular piece of data.
-            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
-
-        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
-            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
-            the list can be transformed using the metadata from the container type.
-
-            Defaults to the same value as the `annotation` argument.
-    """
-    if inner_type is None:
-        inner_type = annotation
-
-    stripped_type = strip_annotated_type(inner_type)
-    origin = get_origin(stripped_type) or stripped_type
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return await _async_transform_typeddict(data, stripped_type)
-
-    if origin == dict and is_mapping(data):
-        items_type = get_args(stripped_type)[1]
-        return {key: _transform_recursive(value, annotation=items_type) for key, value in data.items()}
-
-    if (
-        # List[T]
-        (is_list_type(stripped_type) and is_list(data))
-        # Iterable[T]
-        or (is_iterable_type(stripped_type) and is_iterable(data) and not isinstance(data, str))
-    ):
-        # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
-        # intended as an iterable, so we don't transform it.
-        if isinstance(data, dict):
-            return cast(object, data)
-
-        inner_type = extract_type_arg(stripped_type, 0)
-        if _no_transform_needed(inner_type):
-            # for some types there is no need to transform anything, so we can get a small
-            # perf boost from skipping that work.
-            #
-            # but we still need to convert to a list to ensure the data is json-serializable
-            if is_list(data):
-                return data
-            return list(data)
-
-        return [await _async_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
-
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = await _async_transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
-
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True, mode="json")
-
-    annotated_type = _get_annotated_type(annotation)
-    if annotated_type is None:
-        return data
-
-    # ignore the first argument as it is the actual type
-    annotations = get_args(annotated_type)[1:]
-    for annotation in annotations:
-        if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return await _async_format_data(data, annotation.format, annotation.format_template)
-
-    return data
-
-
 async def _async_format_data(data: object, format_: PropertyFormat, format_template: str | None) -> object:
     if isinstance(data, (date, datetime)):
         if format_ == "iso8601":
@@ -416,25 +240,291 @@ async def _async_format_data(data: object, format_: PropertyFormat, format_templ
     return data
 
 
-async def _async_transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        if not is_given(value):
-            # we don't need to include `NotGiven` values here as they'll
-            # be stripped out before the request is sent anyway
-            continue
-
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = await _async_transform_recursive(value, annotation=type_)
-    return result
+_TransformKind = Literal["typeddict", "dict", "list", "iterable", "union", "other"]
+
+
+class _TransformPlan:
+    """Describes how to transform data for a given type, everything that only depends on the type,
+    e.g. which keys need to be aliased, is determined once when the plan is built.
+
+    Plans for types that don't require any transformation are marked as `passthrough`, in which case
+    data that is already JSON-serializable is returned as-is without copying.
+    """
+
+    kind: _TransformKind
+
+    fields: dict[str, tuple[str, _TransformPlan]]
+    """For TypedDicts, the key in the output & the plan for each annotated key"""
+
+    items: _TransformPlan | None
+    """For dicts & lists, the plan for each value, `None` if the values don't need to be transformed"""
+
+    variants: list[_TransformPlan]
+    """For unions, the plan for each variant; the data is transformed against every variant"""
+
+    format: PropertyInfo | None
+    """The `PropertyInfo` used to format leaf values, if any"""
+
+    passthrough: bool
+
+    def __init__(self) -> None:
+        self.kind = "other"
+        self.fields = {}
+        self.items = None
+        self.variants = []
+        self.format = None
+        self.passthrough = False
+
+    def children(self) -> Iterator[_TransformPlan]:
+        for _, plan in self.fields.values():
+            yield plan
+        if self.items is not None:
+            yield self.items
+        yield from self.variants
+
+    def transform(self, data: object) -> object:
+        if self.passthrough and _is_json_data(data):
+            return data
+
+        kind = self.kind
+        if kind == "typeddict" and is_mapping(data):
+            result: dict[str, object] = {}
+            fields = self.fields
+            for key, value in data.items():
+                if not is_given(value):
+                    # we don't need to include `NotGiven` values here as they'll
+                    # be stripped out before the request is sent anyway
+                    continue
+
+                field = fields.get(key)
+                if field is None:
+                    # we do not have a type annotation for this field, leave it as is
+                    result[key] = value
+                else:
+                    result[field[0]] = field[1].transform(value)
+            return result
+
+        if kind == "dict" and is_mapping(data):
+            items = cast(_TransformPlan, self.items)
+            return {key: items.transform(value) for key, value in data.items()}
+
+        if (kind == "list" and is_list(data)) or (
+            kind == "iterable" and is_iterable(data) and not isinstance(data, str)
+        ):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            entries = self.items
+            if entries is None:
+                # we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(data)
+
+            return [entries.transform(entry) for entry in data]
+
+        if kind == "union":
+            # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+            #
+            # TODO: there may be edge cases where the same normalized field name will transform to two different names
+            # in different subtypes.
+            for variant in self.variants:
+                data = variant.transform(data)
+            return data
+
+        if isinstance(data, pydantic.BaseModel):
+            return model_dump(data, exclude_unset=True, mode="json", exclude=getattr(data, "__api_exclude__", None))
+
+        if self.format is not None:
+            return _format_data(data, cast(PropertyFormat, self.format.format), self.format.format_template)
+
+        return data
+
+    async def async_transform(self, data: object) -> object:
+        if self.passthrough and _is_json_data(data):
+            return data
+
+        kind = self.kind
+        if kind == "typeddict" and is_mapping(data):
+            result: dict[str, object] = {}
+            fields = self.fields
+            for key, value in data.items():
+                if not is_given(value):
+                    # we don't need to include `NotGiven` values here as they'll
+                    # be stripped out before the request is sent anyway
+                    continue
+
+                field = fields.get(key)
+                if field is None:
+                    # we do not have a type annotation for this field, leave it as is
+                    result[key] = value
+                else:
+                    result[field[0]] = await field[1].async_transform(value)
+            return result
+
+        if kind == "dict" and is_mapping(data):
+            items = cast(_TransformPlan, self.items)
+            return {key: await items.async_transform(value) for key, value in data.items()}
+
+        if (kind == "list" and is_list(data)) or (
+            kind == "iterable" and is_iterable(data) and not isinstance(data, str)
+        ):
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            entries = self.items
+            if entries is None:
+                # we still need to convert to a list to ensure the data is json-serializable
+                if is_list(data):
+                    return data
+                return list(data)
+
+            return [await entries.async_transform(entry) for entry in data]
+
+        if kind == "union":
+            # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+            #
+            # TODO: there may be edge cases where the same normalized field name will transform to two different names
+            # in different subtypes.
+            for variant in self.variants:
+                data = await variant.async_transform(data)
+            return data
+
+        if isinstance(data, pydantic.BaseModel):
+            return model_dump(data, exclude_unset=True, mode="json")
+
+        if self.format is not None:
+            return await _async_format_data(data, cast(PropertyFormat, self.format.format), self.format.format_template)
+
+        return data
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_json_data(data: object) -> bool:
+    """Whether or not the given data only consists of plain dicts, lists & JSON scalars, which all
+    pass through a transformation unchanged if their type doesn't define any aliases or formats.
+    """
+    # this is iterative instead of recursive as it is called for entire request bodies
+    pending = [data]
+    while pending:
+        data = pending.pop()
+        type_ = type(data)
+        if type_ is dict:
+            pending.extend(cast("dict[str, object]", data).values())
+        elif type_ is list:
+            pending.extend(cast("list[object]", data))
+        elif type_ not in _JSON_SCALAR_TYPES:
+            return False
+
+    return True
+
+
+_transform_plans: dict[tuple[type, type | None], _TransformPlan] = {}
+_transform_plans_lock = threading.Lock()
+
+
+def _get_transform_plan(annotation: type, inner_type: type | None = None) -> _TransformPlan:
+    """Returns the cached plan for transforming data against the given type, building it on first use.
+
+    Args:
+        annotation: The direct type annotation given to the particular piece of data.
+            This may or may not be wrapped in metadata types, e.g. `Required[T]`, `Annotated[T, ...]` etc
+
+        inner_type: If applicable, this is the "inside" type. This is useful in certain cases where the outside type
+            is a container type such as `List[T]`. In that case `inner_type` should be set to `T` so that each entry in
+            the list can be transformed using the metadata from the container type.
+
+            Defaults to the same value as the `annotation` argument.
+    """
+    key = (annotation, inner_type)
+    plan = _transform_plans.get(key)
+    if plan is not None:
+        return plan
+
+    with _transform_plans_lock:
+        plan = _transform_plans.get(key)
+        if plan is not None:
+            return plan
+
+        # plans are only published once every plan they depend on has been built
+        # so that other threads never see a partially built plan
+        building: dict[tuple[type, type | None], _TransformPlan] = {}
+        plan = _build_transform_plan(annotation, inner_type, building)
+        _resolve_passthrough(building.values())
+        _transform_plans.update(building)
+        return plan
+
+
+def _build_transform_plan(
+    annotation: type,
+    inner_type: type | None,
+    building: dict[tuple[type, type | None], _TransformPlan],
+) -> _TransformPlan:
+    key = (annotation, inner_type)
+    plan = _transform_plans.get(key) or building.get(key)
+    if plan is not None:
+        return plan
+
+    # the plan is registered before its dependencies are built to support recursive types
+    plan = building[key] = _TransformPlan()
+
+    if inner_type is None:
+        inner_type = annotation
+
+    stripped_type = strip_annotated_type(inner_type)
+    origin = get_origin(stripped_type) or stripped_type
+    args = get_args(stripped_type)
+
+    if is_typeddict(stripped_type):
+        plan.kind = "typeddict"
+        for field_name, type_ in get_type_hints(stripped_type, include_extras=True).items():
+            plan.fields[field_name] = (
+                _maybe_transform_key(field_name, type_),
+                _build_transform_plan(type_, None, building),
+            )
+    elif origin == dict and len(args) == 2:
+        plan.kind = "dict"
+        plan.items = _build_transform_plan(args[1], None, building)
+    elif (is_list_type(stripped_type) or is_iterable_type(stripped_type)) and args:
+        plan.kind = "list" if is_list_type(stripped_type) else "iterable"
+        item_type = extract_type_arg(stripped_type, 0)
+        if not _no_transform_needed(item_type):
+            plan.items = _build_transform_plan(annotation, item_type, building)
+    elif is_union_type(stripped_type):
+        plan.kind = "union"
+        plan.variants = [_build_transform_plan(annotation, variant, building) for variant in args]
+
+    annotated_type = _get_annotated_type(annotation)
+    if annotated_type is not None:
+        # ignore the first argument as it is the actual type
+        for property_info in get_args(annotated_type)[1:]:
+            if isinstance(property_info, PropertyInfo) and property_info.format is not None:
+                plan.format = property_info
+                break
+
+    return plan
+
+
+def _resolve_passthrough(plans: Iterable[_TransformPlan]) -> None:
+    """A plan can pass data through as-is if neither it, nor any plan it depends on, aliases keys or formats values."""
+    pending = list(plans)
+    for plan in pending:
+        plan.passthrough = plan.format is None and all(api_key == key for key, (api_key, _) in plan.fields.items())
+
+    # recursive types can depend on themselves so we have to iterate until nothing changes
+    changed = True
+    while changed:
+        changed = False
+        for plan in pending:
+            if plan.passthrough and not all(child.passthrough for child in plan.children()):
+                plan.passthrough = False
+                changed = True
 
 
 @lru_cache(maxsize=8096)
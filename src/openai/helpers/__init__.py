@@ -1,4 +1,14 @@
 from .microphone import Microphone
+from .embedding_cache import EmbeddingCache, AsyncEmbeddingCache, EmbeddingCacheStats
+from .embedding_batcher import AsyncEmbeddingBatcher, EmbeddingBatcherStats
 from .local_audio_player import LocalAudioPlayer
 
-__all__ = ["Microphone", "LocalAudioPlayer"]
+__all__ = [
+    "Microphone",
+    "LocalAudioPlayer",
+    "EmbeddingCache",
+    "AsyncEmbeddingCache",
+    "EmbeddingCacheStats",
+    "AsyncEmbeddingBatcher",
+    "EmbeddingBatcherStats",
+]
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, List, Tuple, Union, Iterable, Optional, NamedTuple, cast
+from typing_extensions import Literal
+
+import anyio
+import httpx
+
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._utils import is_given
+from .._models import add_request_id
+from .._rate_limits import estimate_tokens
+from .embedding_cache import MAX_BATCH_SIZE
+from ..types.embedding import Embedding
+from ..types.create_embedding_response import Usage, CreateEmbeddingResponse
+
+if TYPE_CHECKING:
+    from .._client import AsyncOpenAI
+
+__all__ = ["AsyncEmbeddingBatcher", "EmbeddingBatcherStats"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+# the maximum number of tokens the API embeds in a single request
+MAX_BATCH_TOKENS = 300_000
+
+_Input = Union[str, List[int]]
+
+# calls are only batched together when they would have sent the same request with different inputs
+_BatchKey = Tuple[str, Optional[int], Optional[Literal["float", "base64"]], Optional[str], bool]
+
+
+class EmbeddingBatcherStats(NamedTuple):
+    calls: int
+    """The number of calls to `create()`"""
+
+    requests: int
+    """The number of requests that were sent to the API for them"""
+
+    @property
+    def calls_per_request(self) -> float:
+        return self.calls / self.requests if self.requests else 0.0
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.inputs: List[_Input] = []
+        self.tokens = 0
+        # the number of inputs & estimated tokens of every call in the batch
+        self.counts: List[int] = []
+        self.weights: List[int] = []
+        # signals the first caller, who sends the batch, that it is full
+        self.full = anyio.Event()
+        self.done = anyio.Event()
+        self.response: Optional[CreateEmbeddingResponse] = None
+        self.data: List[Embedding] = []
+        # the share of the usage of every call
+        self.prompt_tokens: List[int] = []
+        self.total_tokens: List[int] = []
+        self.error: Optional[Exception] = None
+        # whether the batch was never sent because its sender was cancelled
+        self.abandoned = False
+
+    def add(self, inputs: List[_Input], tokens: int) -> int:
+        self.inputs.extend(inputs)
+        self.tokens += tokens
+        self.counts.append(len(inputs))
+        self.weights.append(tokens)
+        return len(self.counts) - 1
+
+    def set_response(self, response: CreateEmbeddingResponse) -> None:
+        self.response = response
+        # the order of the data isn't guaranteed
+        self.data = sorted(response.data, key=lambda embedding: embedding.index)
+        # without any tokens to weigh the usage by, every input counts the same
+        weights = self.weights if self.tokens else self.counts
+        self.prompt_tokens = _split_tokens(response.usage.prompt_tokens, weights)
+        self.total_tokens = _split_tokens(response.usage.total_tokens, weights)
+
+    def result(self, call: int) -> CreateEmbeddingResponse:
+        assert self.response is not None
+        offset = sum(self.counts[:call])
+        data = self.data[offset : offset + self.counts[call]]
+        result = CreateEmbeddingResponse.construct(
+            data=[
+                Embedding.construct(embedding=embedding.embedding, index=index, object=embedding.object)
+                for index, embedding in enumerate(data)
+            ],
+            model=self.response.model,
+            object=self.response.object,
+            usage=Usage.construct(prompt_tokens=self.prompt_tokens[call], total_tokens=self.total_tokens[call]),
+        )
+        add_request_id(result, self.response._request_id)
+        return result
+
+
+def _normalize_input(input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]]) -> Tuple[List[_Input], bool]:
+    """Returns the inputs of a single call as a list & whether they are token arrays."""
+    if isinstance(input, str):
+        return [input], False
+
+    items: List[object] = list(input)
+    if items and all(isinstance(item, int) for item in items):
+        # a single token array
+        return [cast(List[int], items)], True
+
+    if items and not isinstance(items[0], str):
+        return [list(cast(Iterable[int], item)) for item in items], True
+
+    return cast(List[_Input], items), False
+
+
+def _split_tokens(total: int, weights: List[int]) -> List[int]:
+    """Splits `total` in proportion to the given weights, so that the parts add up to `total`."""
+    if not weights:
+        return []
+
+    weight = sum(weights)
+    if weight == 0:
+        weights = [1] * len(weights)
+        weight = len(weights)
+
+    parts = [total * w // weight for w in weights]
+    # hand out what's left after rounding down to the largest remainders
+    by_remainder = sorted(range(len(weights)), key=lambda index: total * weights[index] % weight, reverse=True)
+    for index in by_remainder[: total - sum(parts)]:
+        parts[index] += 1
+    return parts
+
+
+class AsyncEmbeddingBatcher:
+    """Gathers concurrent calls to `embeddings.create()` into a single request.
+
+    Every call waits at most `max_wait` seconds for other calls with the same model, dimensions,
+    encoding format & user to join its batch, which is sent as soon as it holds `max_inputs`
+    inputs or an estimated `max_tokens` tokens. Each caller gets a `CreateEmbeddingResponse`
+    with just the embeddings of its own inputs, indexed from `0`, and its share of the
+    batch's `usage`: exact for token arrays, in proportion to the length of the text otherwise.
+
+    ```py
+    from openai import AsyncOpenAI
+    from openai.helpers import AsyncEmbeddingBatcher
+
+    batcher = AsyncEmbeddingBatcher(AsyncOpenAI())
+    responses = await asyncio.gather(*(batcher.create(input=chunk, model="text-embedding-3-small") for chunk in chunks))
+    print(batcher.stats().calls_per_request)
+    ```
+
+    Calls that pass `extra_headers`, `extra_query`, `extra_body` or `timeout` are sent on
+    their own. A batcher must only be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        *,
+        max_wait: float = 0.01,
+        max_inputs: int = MAX_BATCH_SIZE,
+        max_tokens: int = MAX_BATCH_TOKENS,
+    ) -> None:
+        """
+        Args:
+            client: The client used to send the batched requests.
+            max_wait: How long, in seconds, a batch waits for more calls before it is sent.
+            max_inputs: The maximum number of inputs that are sent in a single request.
+            max_tokens: The maximum number of tokens, estimated from the length of the
+                inputs, that are sent in a single request.
+        """
+        # the responses are split into models, so they can't be returned as raw dicts
+        self._client = client if client._response_mode == "model" else client.with_options(response_mode="model")
+        self._max_wait = max_wait
+        self._max_inputs = max_inputs
+        self._max_tokens = max_tokens
+        self._batches: Dict[_BatchKey, _Batch] = {}
+        self._calls = 0
+        self._requests = 0
+
+    def stats(self) -> EmbeddingBatcherStats:
+        """Returns the number of calls to `create()` & the number of requests sent for them."""
+        return EmbeddingBatcherStats(calls=self._calls, requests=self._requests)
+
+    async def create(
+        self,
+        *,
+        input: Union[str, List[str], Iterable[int], Iterable[Iterable[int]]],
+        model: str,
+        dimensions: int | NotGiven = NOT_GIVEN,
+        encoding_format: Literal["float", "base64"] | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> CreateEmbeddingResponse:
+        """Embeds the given input, together with the inputs of concurrent calls.
+
+        Takes the same arguments as `AsyncOpenAI().embeddings.create()`.
+        """
+        self._calls += 1
+        if extra_headers is not None or extra_query is not None or extra_body is not None or is_given(timeout):
+            self._requests += 1
+            return await self._client.embeddings.create(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+
+        inputs, is_tokens = _normalize_input(input)
+        tokens = sum(len(item) if is_tokens else estimate_tokens({"input": item})[0] for item in inputs)
+        key: _BatchKey = (
+            model,
+            dimensions if is_given(dimensions) else None,
+            encoding_format if not isinstance(encoding_format, NotGiven) else None,
+            user if is_given(user) else None,
+            is_tokens,
+        )
+
+        while True:
+            batch = self._batches.get(key)
+            sender = False
+            if (
+                batch is None
+                or len(batch.inputs) + len(inputs) > self._max_inputs
+                or batch.tokens + tokens > self._max_tokens
+            ):
+                if batch is not None:
+                    # the pending batch can't take these inputs, so send it right away
+                    batch.full.set()
+                batch = self._batches[key] = _Batch()
+                sender = True
+
+            call = batch.add(inputs, tokens)
+            if len(batch.inputs) >= self._max_inputs or batch.tokens >= self._max_tokens:
+                batch.full.set()
+
+            if sender:
+                await self._send(key, batch)
+            else:
+                await batch.done.wait()
+
+            # the caller that would have sent the batch was cancelled, try again with a new one
+            if not batch.abandoned:
+                break
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.result(call)
+
+    async def _send(self, key: _BatchKey, batch: _Batch) -> None:
+        try:
+            with anyio.move_on_after(self._max_wait):
+                await batch.full.wait()
+
+            # calls from now on start a new batch
+            if self._batches.get(key) is batch:
+                del self._batches[key]
+
+            model, dimensions, encoding_format, user, _ = key
+            log.debug("Embedding batcher: sending %i inputs", len(batch.inputs))
+            self._requests += 1
+            try:
+                response = await self._client.embeddings.create(
+                    input=cast(Union[List[str], List[List[int]]], batch.inputs),
+                    model=model,
+                    dimensions=dimensions if dimensions is not None else NOT_GIVEN,
+                    encoding_format=encoding_format if encoding_format is not None else NOT_GIVEN,
+                    user=user if user is not None else NOT_GIVEN,
+                )
+                batch.set_response(response)
+            except Exception as err:
+                batch.error = err
+        except BaseException:
+            if self._batches.get(key) is batch:
+                del self._batches[key]
+            batch.abandoned = batch.response is None and batch.error is None
+            raise
+        finally:
+            batch.done.set()
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import os
+import json
+import base64
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Optional, NamedTuple
+
+import httpx
+
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._extras import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from .._client import OpenAI, AsyncOpenAI
+
+__all__ = ["EmbeddingCache", "AsyncEmbeddingCache", "EmbeddingCacheStats"]
+
+log: logging.Logger = logging.getLogger("openai")
+
+# the maximum number of inputs the API embeds in a single request
+MAX_BATCH_SIZE = 2048
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+class EmbeddingCacheStats(NamedTuple):
+    hits: int
+    """The number of inputs whose embedding was read from the cache"""
+
+    misses: int
+    """The number of inputs that had to be embedded by the API"""
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _VectorFile:
+    """The embeddings of a single model & number of dimensions.
+
+    The vectors are appended as float32 rows to a `.f32` file which is memory-mapped for
+    reading, and the hashes of their inputs are appended, in the same order, to a `.keys` file.
+    """
+
+    def __init__(self, path: str, dims: int) -> None:
+        self.dims = dims
+        self._vectors_path = path + ".f32"
+        self._keys_path = path + ".keys"
+        self._rows: Dict[bytes, int] = {}
+        self._mapped: Optional[npt.NDArray[np.float32]] = None
+
+        if os.path.exists(self._keys_path):
+            with open(self._keys_path, "rb") as file:
+                keys = file.read()
+            for row in range(len(keys) // _DIGEST_SIZE):
+                self._rows[keys[row * _DIGEST_SIZE : (row + 1) * _DIGEST_SIZE]] = row
+
+        # vectors are written before their keys, so an interrupted write can leave vectors without keys
+        with open(self._vectors_path, "ab") as file:
+            file.truncate(len(self._rows) * dims * 4)
+
+    def row(self, digest: bytes) -> Optional[int]:
+        return self._rows.get(digest)
+
+    def vector(self, row: int) -> npt.NDArray[np.float32]:
+        if self._mapped is None or row >= len(self._mapped):
+            # vectors that were added after the file was mapped require a new, larger, map, views
+            # into the previous one stay valid as they keep a reference to it
+            self._mapped = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(len(self._rows), self.dims))
+        vector: npt.NDArray[np.float32] = self._mapped[row]
+        return vector
+
+    def add(self, digests: List[bytes], vectors: npt.NDArray[np.float32]) -> None:
+        with open(self._vectors_path, "ab") as file:
+            file.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        with open(self._keys_path, "ab") as file:
+            file.write(b"".join(digests))
+
+        for digest in digests:
+            self._rows[digest] = len(self._rows)
+
+
+class _Lookup(NamedTuple):
+    namespace: str
+    digests: List[bytes]
+    # the inputs that aren't cached yet, without duplicates
+    missing: Dict[bytes, str]
+
+
+class _EmbeddingStore:
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        self._directory = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._files: Dict[str, _VectorFile] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            return EmbeddingCacheStats(hits=self._hits, misses=self._misses)
+
+    def lookup(self, texts: List[str], *, model: str, dimensions: Optional[int]) -> _Lookup:
+        namespace = hashlib.sha256(json.dumps([model, dimensions]).encode()).hexdigest()[:16]
+        digests = [hashlib.sha256(json.dumps([model, dimensions, text]).encode()).digest() for text in texts]
+
+        with self._lock:
+            vectors = self._file(namespace)
+            missing: Dict[bytes, str] = {}
+            for digest, text in zip(digests, texts):
+                if vectors is None or vectors.row(digest) is None:
+                    missing[digest] = text
+
+            misses = sum(1 for digest in digests if digest in missing)
+            self._misses += misses
+            self._hits += len(digests) - misses
+
+        return _Lookup(namespace=namespace, digests=digests, missing=missing)
+
+    def add(
+        self,
+        lookup: _Lookup,
+        digests: List[bytes],
+        vectors: npt.NDArray[np.float32],
+        *,
+        model: str,
+        dimensions: Optional[int],
+    ) -> None:
+        with self._lock:
+            file = self._file(lookup.namespace)
+            if file is None:
+                with open(self._path(lookup.namespace) + ".json", "w") as meta:
+                    json.dump({"model": model, "dimensions": dimensions, "dims": vectors.shape[1]}, meta)
+                file = self._files[lookup.namespace] = _VectorFile(self._path(lookup.namespace), vectors.shape[1])
+
+            # another call may have embedded the same inputs in the meantime
+            new = [index for index, digest in enumerate(digests) if file.row(digest) is None]
+            file.add([digests[index] for index in new], vectors[new])
+
+    def vectors(self, lookup: _Lookup) -> List[npt.NDArray[np.float32]]:
+        if not lookup.digests:
+            return []
+
+        with self._lock:
+            file = self._file(lookup.namespace)
+            assert file is not None
+
+            vectors: List[npt.NDArray[np.float32]] = []
+            for digest in lookup.digests:
+                row = file.row(digest)
+                assert row is not None, "every input should have been embedded"
+                vectors.append(file.vector(row))
+            return vectors
+
+    def _file(self, namespace: str) -> Optional[_VectorFile]:
+        file = self._files.get(namespace)
+        if file is None and os.path.exists(self._path(namespace) + ".json"):
+            with open(self._path(namespace) + ".json") as meta:
+                dims = json.load(meta)["dims"]
+            file = self._files[namespace] = _VectorFile(self._path(namespace), dims)
+        return file
+
+    def _path(self, namespace: str) -> str:
+        return os.path.join(self._directory, namespace)
+
+
+def _batches(lookup: _Lookup, batch_size: int) -> List[Tuple[List[bytes], List[str]]]:
+    missing = list(lookup.missing.items())
+    return [
+        ([digest for digest, _ in batch], [text for _, text in batch])
+        for batch in (missing[start : start + batch_size] for start in range(0, len(missing), batch_size))
+    ]
+
+
+def _decode_vectors(body: Any) -> npt.NDArray[np.float32]:
+    data = sorted(body["data"], key=lambda item: item["index"])
+    return np.stack(
+        [
+            np.frombuffer(base64.b64decode(item["embedding"]), dtype=np.float32)
+            if isinstance(item["embedding"], str)
+            else np.asarray(item["embedding"], dtype=np.float32)
+            for item in data
+        ]
+    )
+
+
+class EmbeddingCache:
+    """Embeds text with `client.embeddings.create()`, only sending inputs that haven't been embedded before to the API.
+
+    Embeddings are stored in the given `directory` per model & number of dimensions, as rows of a
+    float32 file which is memory-mapped, so the returned vectors are read-only `numpy` views into
+    the file that don't have to be copied or decoded. Inputs are identified by a hash of their
+    text, model & dimensions. The directory must not be shared by multiple processes at once.
+
+    ```py
+    from openai import OpenAI
+    from openai.helpers import EmbeddingCache
+
+    cache = EmbeddingCache(OpenAI(), ".embeddings")
+    vectors = cache.create(input=chunks, model="text-embedding-3-small")
+    print(cache.stats().hit_rate)
+    ```
+
+    Requires the `numpy` package.
+    """
+
+    def __init__(
+        self,
+        client: OpenAI,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Args:
+            client: The client used to embed the inputs that aren't cached.
+            directory: Where the embeddings are stored, created if it doesn't exist.
+            batch_size: The maximum number of inputs that are sent in a single request.
+        """
+        self._client = client
+        self._store = _EmbeddingStore(directory)
+        self._batch_size = batch_size
+
+    def stats(self) -> EmbeddingCacheStats:
+        """Returns the number of inputs that were & weren't cached across all calls to `create()`."""
+        return self._store.stats()
+
+    def create(
+        self,
+        *,
+        input: Union[str, List[str]],
+        model: str,
+        dimensions: int | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> List[npt.NDArray[np.float32]]:
+        """Returns the embedding of every input, in order, embedding the inputs that aren't cached yet.
+
+        The inputs that aren't cached are sent in batches of at most `batch_size` inputs.
+        """
+        texts = [input] if isinstance(input, str) else list(input)
+        dims = dimensions if isinstance(dimensions, int) else None
+        lookup = self._store.lookup(texts, model=model, dimensions=dims)
+        log.debug("Embedding cache: %i of %i inputs cached", len(texts) - len(lookup.missing), len(texts))
+
+        for digests, batch in _batches(lookup, self._batch_size):
+            response = self._client.embeddings.with_raw_response.create(
+                input=batch,
+                model=model,
+                dimensions=dimensions,
+                encoding_format="base64",
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+            vectors = _decode_vectors(response.http_response.json())
+            self._store.add(lookup, digests, vectors, model=model, dimensions=dims)
+
+        return self._store.vectors(lookup)
+
+
+class AsyncEmbeddingCache:
+    """The async counterpart of `EmbeddingCache`, for use with `AsyncOpenAI`."""
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        directory: Union[str, "os.PathLike[str]"],
+        *,
+        batch_size: int = MAX_BATCH_SIZE,
+    ) -> None:
+        self._client = client
+        self._store = _EmbeddingStore(directory)
+        self._batch_size = batch_size
+
+    def stats(self) -> EmbeddingCacheStats:
+        """Returns the number of inputs that were & weren't cached across all calls to `create()`."""
+        return self._store.stats()
+
+    async def create(
+        self,
+        *,
+        input: Union[str, List[str]],
+        model: str,
+        dimensions: int | NotGiven = NOT_GIVEN,
+        user: str | NotGiven = NOT_GIVEN,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> List[npt.NDArray[np.float32]]:
+        """Returns the embedding of every input, in order, embedding the inputs that aren't cached yet."""
+        texts = [input] if isinstance(input, str) else list(input)
+        dims = dimensions if isinstance(dimensions, int) else None
+        lookup = self._store.lookup(texts, model=model, dimensions=dims)
+        log.debug("Embedding cache: %i of %i inputs cached", len(texts) - len(lookup.missing), len(texts))
+
+        for digests, batch in _batches(lookup, self._batch_size):
+            response = await self._client.embeddings.with_raw_response.create(
+                input=batch,
+                model=model,
+                dimensions=dimensions,
+                encoding_format="base64",
+                user=user,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+            vectors = _decode_vectors(response.http_response.json())
+            self._store.add(lookup, digests, vectors, model=model, dimensions=dims)
+
+        return self._store.vectors(lookup)
@@ -3,18 +3,23 @@ from __future__ import annotations
 import os
 import inspect
 from typing import Any, Union, Mapping, TypeVar, Callable, Awaitable, cast, overload
-from typing_extensions import Self, override
+from typing_extensions import Self, Literal, override
 
 import httpx
 
-from .._types import NOT_GIVEN, Omit, Query, Timeout, NotGiven
+from .._types import NOT_GIVEN, Omit, Query, Timeout, NotGiven, JSONBackend
 from .._utils import is_given, is_mapping
 from .._client import OpenAI, AsyncOpenAI
 from .._compat import model_copy
 from .._models import FinalRequestOptions
+from .._caching import ResponseCache, CompletionCache
+from .._hedging import HedgingPolicy
+from .._retries import RetryBudget, RetryPolicy, CircuitBreaker
 from .._streaming import Stream, AsyncStream
 from .._exceptions import OpenAIError
 from .._base_client import DEFAULT_MAX_RETRIES, BaseClient
+from .._connections import KeepalivePolicy, TransportRegistry
+from .._rate_limits import RateLimiter
 
 _deployments_endpoints = set(
     [
@@ -105,6 +110,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -125,6 +144,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -145,6 +178,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -167,6 +214,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.Client | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new synchronous azure openai client instance.
@@ -245,7 +306,21 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
             default_headers=default_headers,
             default_query=default_query,
             http_client=http_client,
+            http2=http2,
+            keepalive=keepalive,
+            transport_registry=transport_registry,
             websocket_base_url=websocket_base_url,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
+            stream_prefetch=stream_prefetch,
             _strict_response_validation=_strict_response_validation,
         )
         self._api_version = api_version
@@ -269,6 +344,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
+        http2: bool | Literal["auto"] | None = None,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool | None = None,
+        response_mode: Literal["model", "raw"] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        coalesce_requests: bool | None = None,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
+        stream_prefetch: int | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -288,6 +377,20 @@ class AzureOpenAI(BaseAzureClient[httpx.Client, Stream[Any]], OpenAI):
             base_url=base_url,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
+            keepalive=keepalive,
+            transport_registry=transport_registry,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
+            stream_prefetch=stream_prefetch,
             max_retries=max_retries,
             default_headers=default_headers,
             set_default_headers=set_default_headers,
@@ -384,6 +487,20 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -405,6 +522,20 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -426,6 +557,20 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
         _strict_response_validation: bool = False,
     ) -> None: ...
 
@@ -448,6 +593,20 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | Literal["auto"] = False,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool = False,
+        response_mode: Literal["model", "raw"] = "model",
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        coalesce_requests: bool = False,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
         _strict_response_validation: bool = False,
     ) -> None:
         """Construct a new asynchronous azure openai client instance.
@@ -526,7 +685,21 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
             default_headers=default_headers,
             default_query=default_query,
             http_client=http_client,
+            http2=http2,
+            keepalive=keepalive,
+            transport_registry=transport_registry,
             websocket_base_url=websocket_base_url,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
             _strict_response_validation=_strict_response_validation,
         )
         self._api_version = api_version
@@ -550,6 +723,20 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | Literal["auto"] | None = None,
+        keepalive: KeepalivePolicy | None = None,
+        transport_registry: TransportRegistry | None = None,
+        json_backend: JSONBackend | None = None,
+        stream_request_body: bool | None = None,
+        response_mode: Literal["model", "raw"] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgingPolicy | None = None,
+        coalesce_requests: bool | None = None,
+        response_cache: ResponseCache | None = None,
+        completion_cache: CompletionCache | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -569,6 +756,20 @@ class AsyncAzureOpenAI(BaseAzureClient[httpx.AsyncClient, AsyncStream[Any]], Asy
             base_url=base_url,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
+            keepalive=keepalive,
+            transport_registry=transport_registry,
+            json_backend=json_backend,
+            stream_request_body=stream_request_body,
+            response_mode=response_mode,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            hedging=hedging,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            completion_cache=completion_cache,
             max_retries=max_retries,
             default_headers=default_headers,
             set_default_headers=set_default_headers,
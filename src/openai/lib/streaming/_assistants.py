@@ -7,9 +7,10 @@ from typing_extensions import Awaitable, AsyncIterable, AsyncIterator, assert_ne
 
 import httpx
 
-from ..._utils import is_dict, is_list, consume_sync_iterator, consume_async_iterator
+from ._deltas import DeltaAccumulator
+from ..._utils import consume_sync_iterator, consume_async_iterator
 from ..._compat import model_dump
-from ..._models import construct_type
+from ..._models import BaseModel, construct_type
 from ..._streaming import Stream, AsyncStream
 from ...types.beta import AssistantStreamEvent
 from ...types.beta.threads import (
@@ -24,6 +25,9 @@ from ...types.beta.threads import (
 )
 from ...types.beta.threads.runs import RunStep, ToolCall, RunStepDelta, ToolCallDelta
 
+_KeyT = TypeVar("_KeyT")
+_SnapshotT = TypeVar("_SnapshotT", bound=BaseModel)
+
 
 class AssistantEventHandler:
     text_deltas: Iterable[str]
@@ -50,6 +54,8 @@ class AssistantEventHandler:
         self.__run_step_snapshots: dict[str, RunStep] = {}
         self.__message_snapshots: dict[str, Message] = {}
         self.__current_message_snapshot: Message | None = None
+        self.__content_accumulators: dict[int, tuple[MessageContent, DeltaAccumulator]] = {}
+        self.__run_step_accumulators: dict[str, tuple[RunStep, DeltaAccumulator]] = {}
 
         self.text_deltas = self.__text_deltas__()
         self._iterator = self.__stream__()
@@ -259,6 +265,7 @@ class AssistantEventHandler:
         self.__current_message_snapshot, new_content = accumulate_event(
             event=event,
             current_message_snapshot=self.__current_message_snapshot,
+            accumulators=self.__content_accumulators,
         )
         if self.__current_message_snapshot is not None:
             self.__message_snapshots[self.__current_message_snapshot.id] = self.__current_message_snapshot
@@ -266,6 +273,7 @@ class AssistantEventHandler:
         accumulate_run_step(
             event=event,
             run_step_snapshots=self.__run_step_snapshots,
+            accumulators=self.__run_step_accumulators,
         )
 
         for content_delta in new_content:
@@ -482,6 +490,8 @@ class AsyncAssistantEventHandler:
         self.__run_step_snapshots: dict[str, RunStep] = {}
         self.__message_snapshots: dict[str, Message] = {}
         self.__current_message_snapshot: Message | None = None
+        self.__content_accumulators: dict[int, tuple[MessageContent, DeltaAccumulator]] = {}
+        self.__run_step_accumulators: dict[str, tuple[RunStep, DeltaAccumulator]] = {}
 
         self.text_deltas = self.__text_deltas__()
         self._iterator = self.__stream__()
@@ -691,6 +701,7 @@ class AsyncAssistantEventHandler:
         self.__current_message_snapshot, new_content = accumulate_event(
             event=event,
             current_message_snapshot=self.__current_message_snapshot,
+            accumulators=self.__content_accumulators,
         )
         if self.__current_message_snapshot is not None:
             self.__message_snapshots[self.__current_message_snapshot.id] = self.__current_message_snapshot
@@ -698,6 +709,7 @@ class AsyncAssistantEventHandler:
         accumulate_run_step(
             event=event,
             run_step_snapshots=self.__run_step_snapshots,
+            accumulators=self.__run_step_accumulators,
         )
 
         for content_delta in new_content:
@@ -894,7 +906,13 @@ def accumulate_run_step(
     *,
     event: AssistantStreamEvent,
     run_step_snapshots: dict[str, RunStep],
+    accumulators: dict[str, tuple[RunStep, DeltaAccumulator]] | None = None,
 ) -> None:
+    """Merges run step deltas into the snapshots.
+
+    `accumulators` holds the state of the snapshots that were built from deltas, so the
+    snapshots don't have to be dumped for every delta.
+    """
     if event.event == "thread.run.step.created":
         run_step_snapshots[event.data.id] = event.data
         return
@@ -904,17 +922,13 @@ def accumulate_run_step(
         snapshot = run_step_snapshots[data.id]
 
         if data.delta:
-            merged = accumulate_delta(
-                cast(
-                    "dict[object, object]",
-                    model_dump(snapshot, exclude_unset=True, warnings=False),
-                ),
-                cast(
-                    "dict[object, object]",
-                    model_dump(data.delta, exclude_unset=True, warnings=False),
-                ),
-            )
-            run_step_snapshots[snapshot.id] = cast(RunStep, construct_type(type_=RunStep, value=merged))
+            accumulator = _get_accumulator(accumulators, snapshot.id, snapshot)
+            accumulator.add(cast("dict[object, object]", model_dump(data.delta, exclude_unset=True, warnings=False)))
+
+            new_snapshot = accumulator.finalize_model(RunStep, snapshot)
+            run_step_snapshots[snapshot.id] = new_snapshot
+            if accumulators is not None:
+                accumulators[snapshot.id] = (new_snapshot, accumulator)
 
     return None
 
@@ -923,8 +937,13 @@ def accumulate_event(
     *,
     event: AssistantStreamEvent,
     current_message_snapshot: Message | None,
+    accumulators: dict[int, tuple[MessageContent, DeltaAccumulator]] | None = None,
 ) -> tuple[Message | None, list[MessageContentDelta]]:
-    """Returns a tuple of message snapshot and newly created text message deltas"""
+    """Returns a tuple of message snapshot and newly created text message deltas
+
+    `accumulators` holds the state of the content blocks that were built from deltas, by
+    their index, so the blocks don't have to be dumped for every delta.
+    """
     if event.event == "thread.message.created":
         return event.data, []
 
@@ -955,84 +974,35 @@ def accumulate_event(
                 )
                 new_content.append(content_delta)
             else:
-                merged = accumulate_delta(
-                    cast(
-                        "dict[object, object]",
-                        model_dump(block, exclude_unset=True, warnings=False),
-                    ),
-                    cast(
-                        "dict[object, object]",
-                        model_dump(content_delta, exclude_unset=True, warnings=False),
-                    ),
+                accumulator = _get_accumulator(accumulators, content_delta.index, block)
+                accumulator.add(
+                    cast("dict[object, object]", model_dump(content_delta, exclude_unset=True, warnings=False))
                 )
-                current_message_snapshot.content[content_delta.index] = cast(
+
+                new_block = cast(
                     MessageContent,
-                    construct_type(
+                    accumulator.finalize_model(
                         # mypy doesn't allow Content for some reason
-                        type_=cast(Any, MessageContent),
-                        value=merged,
+                        cast(Any, MessageContent),
+                        block,
                     ),
                 )
+                current_message_snapshot.content[content_delta.index] = new_block
+                if accumulators is not None:
+                    accumulators[content_delta.index] = (new_block, accumulator)
 
     return current_message_snapshot, new_content
 
 
-def accumulate_delta(acc: dict[object, object], delta: dict[object, object]) -> dict[object, object]:
-    for key, delta_value in delta.items():
-        if key not in acc:
-            acc[key] = delta_value
-            continue
-
-        acc_value = acc[key]
-        if acc_value is None:
-            acc[key] = delta_value
-            continue
-
-        # the `index` property is used in arrays of objects so it should
-        # not be accumulated like other values e.g.
-        # [{'foo': 'bar', 'index': 0}]
-        #
-        # the same applies to `type` properties as they're used for
-        # discriminated unions
-        if key == "index" or key == "type":
-            acc[key] = delta_value
-            continue
-
-        if isinstance(acc_value, str) and isinstance(delta_value, str):
-            acc_value += delta_value
-        elif isinstance(acc_value, (int, float)) and isinstance(delta_value, (int, float)):
-            acc_value += delta_value
-        elif is_dict(acc_value) and is_dict(delta_value):
-            acc_value = accumulate_delta(acc_value, delta_value)
-        elif is_list(acc_value) and is_list(delta_value):
-            # for lists of non-dictionary items we'll only ever get new entries
-            # in the array, existing entries will never be changed
-            if all(isinstance(x, (str, int, float)) for x in acc_value):
-                acc_value.extend(delta_value)
-                continue
-
-            for delta_entry in delta_value:
-                if not is_dict(delta_entry):
-                    raise TypeError(f"Unexpected list delta entry is not a dictionary: {delta_entry}")
-
-                try:
-                    index = delta_entry["index"]
-                except KeyError as exc:
-                    raise RuntimeError(f"Expected list delta entry to have an `index` key; {delta_entry}") from exc
-
-                if not isinstance(index, int):
-                    raise TypeError(f"Unexpected, list delta entry `index` value is not an integer; {index}")
-
-                try:
-                    acc_entry = acc_value[index]
-                except IndexError:
-                    acc_value.insert(index, delta_entry)
-                else:
-                    if not is_dict(acc_entry):
-                        raise TypeError("not handled yet")
-
-                    acc_value[index] = accumulate_delta(acc_entry, delta_entry)
-
-        acc[key] = acc_value
+def _get_accumulator(
+    accumulators: dict[_KeyT, tuple[_SnapshotT, DeltaAccumulator]] | None,
+    key: _KeyT,
+    snapshot: _SnapshotT,
+) -> DeltaAccumulator:
+    """Returns the accumulator that built the given snapshot, or a new one starting from it."""
+    if accumulators is not None:
+        built = accumulators.get(key)
+        if built is not None and built[0] is snapshot:
+            return built[1]
 
-    return acc
+    return DeltaAccumulator(cast("dict[object, object]", model_dump(snapshot, exclude_unset=True, warnings=False)))
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from ..._utils import is_dict, is_list
+from typing import TypeVar, cast
+
+import pydantic
+
+from ..._utils import is_dict, is_list, lru_cache
+from ..._compat import get_model_fields
+from ..._models import construct_type, construct_update
+
+_T = TypeVar("_T")
 
 
 def accumulate_delta(acc: dict[object, object], delta: dict[object, object]) -> dict[object, object]:
@@ -62,3 +70,258 @@ def accumulate_delta(acc: dict[object, object], delta: dict[object, object]) ->
         acc[key] = acc_value
 
     return acc
+
+
+class DeltaAccumulator:
+    """Merges a stream of deltas into a snapshot the same way `accumulate_delta()` does, in time
+    proportional to the size of each delta instead of the size of the snapshot.
+
+    Strings are collected as lists of fragments that are only joined when the snapshot is built,
+    entries of lists of objects are merged by their `index` without scanning the list, and
+    `finalize()` & `finalize_model()` only rebuild the parts of the snapshot that changed since they
+    were last called, so they can be called after every delta.
+
+    ```py
+    accumulator = DeltaAccumulator(model_dump(snapshot, exclude_unset=True))
+    for delta in deltas:
+        accumulator.add(model_dump(delta, exclude_unset=True))
+        snapshot = accumulator.finalize_model(type(snapshot), snapshot)
+    ```
+    """
+
+    def __init__(self, snapshot: dict[object, object] | None = None) -> None:
+        self._root = _Object()
+        if snapshot:
+            self._root.merge(snapshot)
+            # the snapshot is what `finalize_model()` is given first
+            self._root.changes.clear()
+
+    def add(self, delta: dict[object, object]) -> None:
+        self._root.merge(delta)
+
+    def finalize(self) -> dict[object, object]:
+        """Returns the snapshot as plain dicts & lists, which are shared between calls and must not be changed."""
+        return self._root.finalize()
+
+    def finalize_model(self, type_: type[_T], previous: object = None) -> _T:
+        """Returns the snapshot as the given type, like `construct_type(type_=type_, value=self.finalize())`.
+
+        `previous` must be the model returned by the previous call, or the model the accumulator was
+        created from. Only the fields that changed since then are constructed again, the others are
+        shared with it.
+        """
+        if isinstance(previous, pydantic.BaseModel):
+            try:
+                return cast(_T, _update_model(previous, self._root))
+            except _Rebuild:
+                pass
+
+        _clear_changes(self._root)
+        return cast(_T, construct_type(type_=type_, value=self.finalize()))
+
+
+class _Rebuild(Exception):
+    """Raised when a model can't be updated in place, e.g. because its `type` changed."""
+
+
+class _Text:
+    __slots__ = ("value", "fragments")
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+        self.fragments: list[str] = []
+
+    def finalize(self) -> str:
+        if self.fragments:
+            self.value += "".join(self.fragments)
+            self.fragments.clear()
+        return self.value
+
+
+class _Object:
+    __slots__ = ("values", "cache", "changes")
+
+    def __init__(self) -> None:
+        self.values: dict[object, object] = {}
+        self.cache: dict[object, object] | None = None
+        # the keys that changed since the last model was built & whether their value was replaced
+        self.changes: dict[object, bool] = {}
+
+    def merge(self, delta: dict[object, object]) -> None:
+        self.cache = None
+        values = self.values
+        changes = self.changes
+        for key, delta_value in delta.items():
+            acc_value = values.get(key)
+            # see `accumulate_delta()` for how every kind of value is accumulated
+            if acc_value is None or key == "index" or key == "type":
+                if _is_same_scalar(acc_value, delta_value):
+                    # e.g. the `type` & `index` that are repeated in every delta
+                    continue
+                values[key] = _to_node(delta_value)
+                changes[key] = True
+            elif isinstance(acc_value, _Text):
+                if isinstance(delta_value, str):
+                    acc_value.fragments.append(delta_value)
+                    changes[key] = True
+            elif isinstance(acc_value, (int, float)) and isinstance(delta_value, (int, float)):
+                values[key] = acc_value + delta_value
+                changes[key] = True
+            elif isinstance(acc_value, _Object):
+                if is_dict(delta_value) and delta_value:
+                    acc_value.merge(delta_value)
+                    changes.setdefault(key, False)
+            elif isinstance(acc_value, _Array):
+                if is_list(delta_value) and delta_value:
+                    acc_value.merge(delta_value)
+                    changes.setdefault(key, False)
+
+    def finalize(self) -> dict[object, object]:
+        if self.cache is None:
+            self.cache = {key: _finalize(value) for key, value in self.values.items()}
+        return self.cache
+
+
+class _Array:
+    __slots__ = ("items", "non_scalars", "cache", "changes", "resized")
+
+    def __init__(self) -> None:
+        self.items: list[object] = []
+        # the number of entries that aren't strings or numbers, so the list doesn't have to be scanned
+        self.non_scalars = 0
+        self.cache: list[object] | None = None
+        # the indices of the entries that changed since the last model was built
+        self.changes: set[int] = set()
+        self.resized = False
+
+    def extend(self, values: list[object]) -> None:
+        if values:
+            self.resized = True
+        for value in values:
+            if not isinstance(value, (str, int, float)):
+                self.non_scalars += 1
+            self.items.append(_to_node(value))
+
+    def merge(self, delta: list[object]) -> None:
+        self.cache = None
+        # for lists of non-dictionary items we'll only ever get new entries
+        # in the array, existing entries will never be changed
+        if not self.non_scalars:
+            self.extend(delta)
+            return
+
+        items = self.items
+        for delta_entry in delta:
+            if not is_dict(delta_entry):
+                raise TypeError(f"Unexpected list delta entry is not a dictionary: {delta_entry}")
+
+            try:
+                index = delta_entry["index"]
+            except KeyError as exc:
+                raise RuntimeError(f"Expected list delta entry to have an `index` key; {delta_entry}") from exc
+
+            if not isinstance(index, int):
+                raise TypeError(f"Unexpected, list delta entry `index` value is not an integer; {index}")
+
+            try:
+                acc_entry = items[index]
+            except IndexError:
+                self.non_scalars += 1
+                self.resized = True
+                items.insert(index, _to_node(delta_entry))
+            else:
+                if not isinstance(acc_entry, _Object):
+                    raise TypeError("not handled yet")
+
+                acc_entry.merge(delta_entry)
+                self.changes.add(index)
+
+    def finalize(self) -> list[object]:
+        if self.cache is None:
+            self.cache = [_finalize(item) for item in self.items]
+        return self.cache
+
+
+def _to_node(value: object) -> object:
+    if isinstance(value, str):
+        return _Text(value)
+    if is_dict(value):
+        node = _Object()
+        node.merge(value)
+        node.changes.clear()
+        return node
+    if is_list(value):
+        array = _Array()
+        array.extend(value)
+        array.resized = False
+        return array
+    return value
+
+
+def _is_same_scalar(node: object, value: object) -> bool:
+    if isinstance(node, _Text):
+        return isinstance(value, str) and not node.fragments and node.value == value
+    return isinstance(node, (int, float)) and type(node) is type(value) and node == value
+
+
+def _finalize(value: object) -> object:
+    if isinstance(value, (_Text, _Object, _Array)):
+        return value.finalize()
+    return value
+
+
+def _clear_changes(node: object) -> None:
+    if isinstance(node, _Object):
+        for key in node.changes:
+            _clear_changes(node.values[key])
+        node.changes.clear()
+    elif isinstance(node, _Array):
+        for item in node.items if node.resized else [node.items[index] for index in node.changes]:
+            _clear_changes(item)
+        node.changes.clear()
+        node.resized = False
+
+
+@lru_cache(maxsize=None)
+def _model_fields(type_: type[pydantic.BaseModel]) -> tuple[frozenset[str], frozenset[str]]:
+    """Returns the names of the fields of the model & of those that have an alias."""
+    fields = get_model_fields(type_)
+    return frozenset(fields), frozenset(name for name, field in fields.items() if field.alias not in (None, name))
+
+
+def _update_model(model: pydantic.BaseModel, node: _Object) -> pydantic.BaseModel:
+    """Returns a copy of the model with the changes of the node, only constructing the values that changed."""
+    fields, aliased = _model_fields(type(model))
+    if "type" in node.changes and _finalize(node.values["type"]) != getattr(model, "type", None):
+        # the model may be a different variant of a union now
+        raise _Rebuild()
+
+    values: dict[str, object] = {}
+    built: dict[str, object] = {}
+    for key, replaced in node.changes.items():
+        if not isinstance(key, str):
+            raise _Rebuild()
+
+        if key in aliased:
+            raise _Rebuild()
+
+        value = node.values[key]
+        old = getattr(model, key, None) if key in fields else None
+        if not replaced and isinstance(value, _Object) and isinstance(old, pydantic.BaseModel):
+            built[key] = _update_model(old, value)
+        elif not replaced and isinstance(value, _Array) and isinstance(old, list) and not value.resized:
+            entries = list(cast("list[object]", old))
+            for index in value.changes:
+                entry = entries[index]
+                item = value.items[index]
+                if not isinstance(entry, pydantic.BaseModel) or not isinstance(item, _Object):
+                    raise _Rebuild()
+                entries[index] = _update_model(entry, item)
+            value.changes.clear()
+            built[key] = entries
+        else:
+            _clear_changes(value)
+            values[key] = _finalize(value)
+
+    node.changes.clear()
+    return construct_update(model, values, built=built)
@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Union, Optional
+
+from jiter import from_json
+
+__all__ = ["PartialJSONParser"]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# the characters that can appear in a string as they are
+_STRING_CHARS = re.compile(r'[^"\\\x00-\x1f]*')
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]*")
+_LITERAL_CHARS = re.compile(r"[a-z]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_LITERALS: Dict[str, object] = {"true": True, "false": False, "null": None}
+
+# what a container expects next
+_VALUE = 0  # a value, after `:` or `,`
+_FIRST_VALUE = 1  # a value or `]`, after `[`
+_KEY = 2  # a key, after `,`
+_FIRST_KEY = 3  # a key or `}`, after `{`
+_COLON = 4
+_NEXT = 5  # a `,` or the end of the container
+
+# the scalar that is being read
+_NONE = 0
+_STRING = 1
+_NUMBER_TOKEN = 2
+_LITERAL = 3
+
+_Container = Union[Dict[str, object], List[object]]
+
+
+class _Fallback(Exception):
+    """Raised for input that isn't parsed incrementally, which is then parsed as a whole by `jiter`."""
+
+
+class _Frame:
+    __slots__ = ("container", "expect", "key", "parent_key", "published")
+
+    def __init__(self, container: _Container, parent_key: Union[str, int, None]) -> None:
+        self.container = container
+        self.expect = _FIRST_KEY if isinstance(container, dict) else _FIRST_VALUE
+        # the key of the value that is being read, for objects
+        self.key = ""
+        # where the container is stored in its parent
+        self.parent_key = parent_key
+        # whether the container is part of a value that was returned, so it must be copied before it is changed
+        self.published = False
+
+
+class PartialJSONParser:
+    """Parses JSON that is streamed in chunks, only reading the new text for every chunk.
+
+    `parse()` returns the same value as `jiter.from_json(text, partial_mode=True)`: incomplete
+    strings, keys, numbers & literals are left out while incomplete objects & arrays are included.
+    The returned values are never changed afterwards, objects & arrays that are complete are shared
+    between them.
+
+    Text that isn't an object or an array, or that isn't valid JSON, is parsed as a whole by `jiter`
+    from then on, so results & errors are always the same as `jiter`'s.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._length = 0
+        self._fallback = False
+        self._root: Optional[_Container] = None
+        self._done = False
+        self._stack: List[_Frame] = []
+        self._token = _NONE
+        self._fragments: List[str] = []
+        self._escape = ""
+        self._scalar = ""
+        # whether a number that may still continue has been added to the innermost container
+        self._provisional = False
+
+    def parse(self, text: str) -> object:
+        """Parses the given text, which must start with the text given to the previous call."""
+        if len(text) < self._length:
+            self._reset()
+
+        if not self._fallback:
+            try:
+                if len(text) > self._length:
+                    self._feed(text, self._length)
+                if self._root is not None:
+                    self._length = len(text)
+                    return self._snapshot()
+            except _Fallback:
+                self._fallback = True
+
+        self._length = len(text)
+        return from_json(bytes(text, "utf-8"), partial_mode=True)
+
+    def _feed(self, text: str, i: int) -> None:
+        if self._provisional:
+            self._remove_provisional()
+
+        n = len(text)
+        stack = self._stack
+        while i < n:
+            token = self._token
+            if token == _STRING:
+                i = self._feed_string(text, i)
+                continue
+
+            if token == _NUMBER_TOKEN:
+                end = _skip(_NUMBER_CHARS, text, i)
+                self._scalar += text[i:end]
+                i = end
+                if i < n:
+                    self._end_number()
+                continue
+
+            if token == _LITERAL:
+                end = _skip(_LITERAL_CHARS, text, i)
+                self._scalar += text[i:end]
+                i = end
+                self._check_literal()
+                if self._token == _LITERAL and i < n:
+                    raise _Fallback()
+                continue
+
+            i = _skip(_WHITESPACE, text, i)
+            if i == n:
+                break
+
+            char = text[i]
+            i += 1
+
+            if not stack:
+                if self._done or char not in "{[":
+                    raise _Fallback()
+                self._open(char)
+                continue
+
+            frame = stack[-1]
+            expect = frame.expect
+            if expect == _NEXT:
+                if char == ",":
+                    frame.expect = _KEY if isinstance(frame.container, dict) else _VALUE
+                elif char == ("}" if isinstance(frame.container, dict) else "]"):
+                    self._close()
+                else:
+                    raise _Fallback()
+            elif expect == _COLON:
+                if char != ":":
+                    raise _Fallback()
+                frame.expect = _VALUE
+            elif expect == _KEY or expect == _FIRST_KEY:
+                if char == '"':
+                    self._token = _STRING
+                elif char == "}" and expect == _FIRST_KEY:
+                    self._close()
+                else:
+                    raise _Fallback()
+            elif char == "]" and expect == _FIRST_VALUE:
+                self._close()
+            elif char == '"':
+                self._token = _STRING
+            elif char == "{" or char == "[":
+                self._open(char)
+            elif char == "-" or "0" <= char <= "9":
+                self._token = _NUMBER_TOKEN
+                self._scalar = char
+            elif char == "t" or char == "f" or char == "n":
+                self._token = _LITERAL
+                self._scalar = char
+            else:
+                raise _Fallback()
+
+    def _feed_string(self, text: str, i: int) -> int:
+        if self._escape:
+            i = self._feed_escape(text, i)
+            if self._escape:
+                return i
+
+        end = _skip(_STRING_CHARS, text, i)
+        if end > i:
+            self._fragments.append(text[i:end])
+        if end == len(text):
+            return end
+
+        char = text[end]
+        if char == '"':
+            self._end_string()
+        elif char == "\\":
+            self._escape = char
+            return self._feed_escape(text, end + 1)
+        else:
+            # control characters must be escaped
+            raise _Fallback()
+        return end + 1
+
+    def _feed_escape(self, text: str, i: int) -> int:
+        n = len(text)
+        while i < n and self._escape:
+            char = text[i]
+            i += 1
+            escape = self._escape + char
+            length = len(escape)
+
+            if length == 2:
+                if char == "u":
+                    self._escape = escape
+                    continue
+                if char not in _ESCAPES:
+                    raise _Fallback()
+                self._fragments.append(_ESCAPES[char])
+                self._escape = ""
+            elif length == 7 or length == 8:
+                # a high surrogate must be followed by the `\u` escape of a low surrogate
+                if char != ("\\" if length == 7 else "u"):
+                    raise _Fallback()
+                self._escape = escape
+            else:
+                if char not in _HEX_DIGITS:
+                    raise _Fallback()
+                self._escape = escape
+
+                if length == 6:
+                    code = int(escape[2:], 16)
+                    if 0xDC00 <= code <= 0xDFFF:
+                        raise _Fallback()
+                    if not 0xD800 <= code <= 0xDBFF:
+                        self._fragments.append(chr(code))
+                        self._escape = ""
+                elif length == 12:
+                    low = int(escape[8:], 16)
+                    if not 0xDC00 <= low <= 0xDFFF:
+                        raise _Fallback()
+                    high = int(escape[2:6], 16)
+                    self._fragments.append(chr(0x10000 + ((high - 0xD800) << 10) + (low - 0xDC00)))
+                    self._escape = ""
+        return i
+
+    def _end_string(self) -> None:
+        value = "".join(self._fragments)
+        self._fragments = []
+        self._token = _NONE
+
+        frame = self._stack[-1]
+        if frame.expect == _KEY or frame.expect == _FIRST_KEY:
+            assert isinstance(frame.container, dict)
+            if value in frame.container:
+                # `jiter` keeps the previous value of a duplicate key while its new value is incomplete
+                raise _Fallback()
+            frame.key = value
+            frame.expect = _COLON
+        else:
+            self._add(value)
+
+    def _end_number(self) -> None:
+        self._token = _NONE
+        if _NUMBER.fullmatch(self._scalar) is None:
+            raise _Fallback()
+        self._add(_to_number(self._scalar))
+
+    def _check_literal(self) -> None:
+        if self._scalar in _LITERALS:
+            self._token = _NONE
+            self._add(_LITERALS[self._scalar])
+        elif not any(literal.startswith(self._scalar) for literal in _LITERALS):
+            raise _Fallback()
+
+    def _open(self, char: str) -> None:
+        container: _Container = {} if char == "{" else []
+        if not self._stack:
+            self._root = container
+            self._stack.append(_Frame(container, None))
+            return
+
+        parent = self._stack[-1]
+        self._add(container)
+        parent_key = parent.key if isinstance(parent.container, dict) else len(parent.container) - 1
+        self._stack.append(_Frame(container, parent_key))
+
+    def _close(self) -> None:
+        self._stack.pop()
+        if not self._stack:
+            self._done = True
+
+    def _add(self, value: object) -> None:
+        frame = self._stack[-1]
+        container = self._writable(len(self._stack) - 1)
+        if isinstance(container, dict):
+            container[frame.key] = value
+        else:
+            container.append(value)
+        frame.expect = _NEXT
+
+    def _writable(self, depth: int) -> _Container:
+        """Returns the container at the given depth, copying it & its parents if they were returned before."""
+        frame = self._stack[depth]
+        if frame.published:
+            frame.container = frame.container.copy()
+            frame.published = False
+
+            if depth == 0:
+                self._root = frame.container
+            else:
+                parent = self._writable(depth - 1)
+                parent[frame.parent_key] = frame.container  # type: ignore[index]
+
+        return frame.container
+
+    def _snapshot(self) -> object:
+        if self._token == _NUMBER_TOKEN and not self._provisional:
+            if _NUMBER.fullmatch(self._scalar) is not None:
+                # the number is complete as far as the text goes, but may still continue
+                frame = self._stack[-1]
+                container = self._writable(len(self._stack) - 1)
+                if isinstance(container, dict):
+                    container[frame.key] = _to_number(self._scalar)
+                else:
+                    container.append(_to_number(self._scalar))
+                self._provisional = True
+            elif _NUMBER.fullmatch(self._scalar + "0") is None:
+                raise _Fallback()
+
+        for frame in self._stack:
+            frame.published = True
+        return self._root
+
+    def _remove_provisional(self) -> None:
+        frame = self._stack[-1]
+        container = self._writable(len(self._stack) - 1)
+        if isinstance(container, dict):
+            del container[frame.key]
+        else:
+            container.pop()
+        self._provisional = False
+
+
+def _skip(pattern: re.Pattern[str], text: str, pos: int) -> int:
+    """Returns the position after the characters at `pos` that match the pattern, which may be none."""
+    match = pattern.match(text, pos)
+    assert match is not None
+    return match.end()
+
+
+def _to_number(text: str) -> Any:
+    try:
+        if "." in text or "e" in text or "E" in text:
+            return float(text)
+        return int(text)
+    except ValueError as exc:
+        # e.g. integers that exceed the limit of digits for converting strings
+        raise _Fallback() from exc
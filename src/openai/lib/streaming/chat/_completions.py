@@ -5,8 +5,6 @@ from types import TracebackType
 from typing import TYPE_CHECKING, Any, Generic, Callable, Iterable, Awaitable, AsyncIterator, cast
 from typing_extensions import Self, Iterator, assert_never
 
-from jiter import from_json
-
 from ._types import ParsedChoiceSnapshot, ParsedChatCompletionSnapshot, ParsedChatCompletionMessageSnapshot
 from ._events import (
     ChunkEvent,
@@ -24,9 +22,9 @@ from ._events import (
 )
 from .._deltas import accumulate_delta
 from ...._types import NOT_GIVEN, IncEx, NotGiven
-from ...._utils import is_given, consume_sync_iterator, consume_async_iterator
-from ...._compat import model_dump
-from ...._models import build, construct_type
+from ...._utils import is_given, lru_cache, consume_sync_iterator, consume_async_iterator
+from ...._compat import PYDANTIC_V2, model_dump, get_model_fields
+from ...._models import BaseModel, build, construct_type
 from ..._parsing import (
     ResponseFormatT,
     has_parseable_input,
@@ -39,9 +37,11 @@ from ..._parsing import (
 from ...._streaming import Stream, AsyncStream
 from ....types.chat import ChatCompletionChunk, ParsedChatCompletion, ChatCompletionToolUnionParam
 from ...._exceptions import LengthFinishReasonError, ContentFilterFinishReasonError
+from .._partial_json import PartialJSONParser
 from ....types.chat.chat_completion import ChoiceLogprobs
-from ....types.chat.chat_completion_chunk import Choice as ChoiceChunk
+from ....types.chat.chat_completion_chunk import Choice as ChoiceChunk, ChoiceDelta
 from ....types.chat.completion_create_params import ResponseFormat as ResponseFormatParam
+from ....types.chat.parsed_function_tool_call import ParsedFunction, ParsedFunctionToolCall
 
 
 class ChatCompletionStream(Generic[ResponseFormatT]):
@@ -111,6 +111,19 @@ class ChatCompletionStream(Generic[ResponseFormatT]):
     def current_completion_snapshot(self) -> ParsedChatCompletionSnapshot:
         return self._state.current_completion_snapshot
 
+    def text_deltas(self) -> Iterator[str]:
+        """Iterates over just the content deltas of the first choice, read straight from the raw chunks.
+
+        This skips building events & the completion snapshot, so it can't be combined with
+        iterating over the stream and `get_final_completion()` can't be used afterwards.
+
+        ```py
+        for text in stream.text_deltas():
+            print(text, end="", flush=True)
+        ```
+        """
+        yield from self._raw_stream.text_deltas()
+
     def __stream__(self) -> Iterator[ChatCompletionStreamEvent[ResponseFormatT]]:
         for sse_event in self._raw_stream:
             if not _is_valid_chat_completion_chunk_weak(sse_event):
@@ -234,6 +247,20 @@ class AsyncChatCompletionStream(Generic[ResponseFormatT]):
     def current_completion_snapshot(self) -> ParsedChatCompletionSnapshot:
         return self._state.current_completion_snapshot
 
+    async def text_deltas(self) -> AsyncIterator[str]:
+        """Iterates over just the content deltas of the first choice, read straight from the raw chunks.
+
+        This skips building events & the completion snapshot, so it can't be combined with
+        iterating over the stream and `get_final_completion()` can't be used afterwards.
+
+        ```py
+        async for text in stream.text_deltas():
+            print(text, end="", flush=True)
+        ```
+        """
+        async for text in self._raw_stream.text_deltas():
+            yield text
+
     async def __stream__(self) -> AsyncIterator[ChatCompletionStreamEvent[ResponseFormatT]]:
         async for sse_event in self._raw_stream:
             if not _is_valid_chat_completion_chunk_weak(sse_event):
@@ -319,6 +346,9 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
     ) -> None:
         self.__current_completion_snapshot: ParsedChatCompletionSnapshot | None = None
         self.__choice_event_states: list[ChoiceEventState] = []
+        # partially parses the content, for `(choice_index, None)`, and tool call arguments,
+        # for `(choice_index, tool_index)`, only reading the new text of every chunk
+        self.__json_parsers: dict[tuple[int, int | None], PartialJSONParser] = {}
 
         self._input_tools = [tool for tool in input_tools] if is_given(input_tools) else []
         self._response_format = response_format
@@ -358,6 +388,12 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
             self.__choice_event_states.append(choice_state)
             return choice_state
 
+    def _get_json_parser(self, choice_index: int, tool_index: int | None = None) -> PartialJSONParser:
+        parser = self.__json_parsers.get((choice_index, tool_index))
+        if parser is None:
+            parser = self.__json_parsers[(choice_index, tool_index)] = PartialJSONParser()
+        return parser
+
     def _accumulate_chunk(self, chunk: ChatCompletionChunk) -> ParsedChatCompletionSnapshot:
         completion_snapshot = self.__current_completion_snapshot
 
@@ -367,48 +403,9 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
         for choice in chunk.choices:
             try:
                 choice_snapshot = completion_snapshot.choices[choice.index]
-                previous_tool_calls = choice_snapshot.message.tool_calls or []
 
-                choice_snapshot.message = cast(
-                    ParsedChatCompletionMessageSnapshot,
-                    construct_type(
-                        type_=ParsedChatCompletionMessageSnapshot,
-                        value=accumulate_delta(
-                            cast(
-                                "dict[object, object]",
-                                model_dump(
-                                    choice_snapshot.message,
-                                    # we don't want to serialise / deserialise our custom properties
-                                    # as they won't appear in the delta and we don't want to have to
-                                    # continuosly reparse the content
-                                    exclude=cast(
-                                        # cast required as mypy isn't smart enough to infer `True` here to `Literal[True]`
-                                        IncEx,
-                                        {
-                                            "parsed": True,
-                                            "tool_calls": {
-                                                idx: {"function": {"parsed_arguments": True}}
-                                                for idx, _ in enumerate(choice_snapshot.message.tool_calls or [])
-                                            },
-                                        },
-                                    ),
-                                ),
-                            ),
-                            cast("dict[object, object]", choice.delta.to_dict()),
-                        ),
-                    ),
-                )
-
-                # ensure tools that have already been parsed are added back into the newly
-                # constructed message snapshot
-                for tool_index, prev_tool in enumerate(previous_tool_calls):
-                    new_tool = (choice_snapshot.message.tool_calls or [])[tool_index]
-
-                    if prev_tool.type == "function":
-                        assert new_tool.type == "function"
-                        new_tool.function.parsed_arguments = prev_tool.function.parsed_arguments
-                    elif TYPE_CHECKING:  # type: ignore[unreachable]
-                        assert_never(prev_tool)
+                if not _accumulate_message_delta(choice_snapshot.message, choice.delta):
+                    choice_snapshot.message = _rebuild_message_snapshot(choice_snapshot.message, choice.delta)
             except IndexError:
                 choice_snapshot = cast(
                     ParsedChoiceSnapshot,
@@ -441,9 +438,8 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                 # partial parsing fails on white-space
                 and choice_snapshot.message.content.lstrip()
             ):
-                choice_snapshot.message.parsed = from_json(
-                    bytes(choice_snapshot.message.content, "utf-8"),
-                    partial_mode=True,
+                choice_snapshot.message.parsed = self._get_json_parser(choice.index).parse(
+                    choice_snapshot.message.content
                 )
 
             for tool_call_chunk in choice.delta.tool_calls or []:
@@ -459,10 +455,9 @@ class ChatCompletionStreamState(Generic[ResponseFormatT]):
                         and input_tool.get("function", {}).get("strict")
                         and tool_call_snapshot.function.arguments
                     ):
-                        tool_call_snapshot.function.parsed_arguments = from_json(
-                            bytes(tool_call_snapshot.function.arguments, "utf-8"),
-                            partial_mode=True,
-                        )
+                        tool_call_snapshot.function.parsed_arguments = self._get_json_parser(
+                            choice.index, tool_call_chunk.index
+                        ).parse(tool_call_snapshot.function.arguments)
                 elif TYPE_CHECKING:  # type: ignore[unreachable]
                     assert_never(tool_call_snapshot)
 
@@ -768,3 +763,164 @@ def _is_valid_chat_completion_chunk_weak(sse_event: ChatCompletionChunk) -> bool
     # - should be "chat.completion.chunk" for a ChatCompletionChunk;
     # - is an empty string for Asynchronous Filter events.
     return sse_event.object == "chat.completion.chunk"  # type: ignore # pylance reports this as a useless check
+
+
+def _rebuild_message_snapshot(
+    message: ParsedChatCompletionMessageSnapshot, delta: ChoiceDelta
+) -> ParsedChatCompletionMessageSnapshot:
+    """Merges the delta into a new message snapshot by dumping the snapshot, accumulating the delta
+    and constructing the snapshot again, which handles any delta.
+    """
+    new_message = cast(
+        ParsedChatCompletionMessageSnapshot,
+        construct_type(
+            type_=ParsedChatCompletionMessageSnapshot,
+            value=accumulate_delta(
+                cast(
+                    "dict[object, object]",
+                    model_dump(
+                        message,
+                        # we don't want to serialise / deserialise our custom properties
+                        # as they won't appear in the delta and we don't want to have to
+                        # continuosly reparse the content
+                        exclude=cast(
+                            # cast required as mypy isn't smart enough to infer `True` here to `Literal[True]`
+                            IncEx,
+                            {
+                                "parsed": True,
+                                "tool_calls": {
+                                    idx: {"function": {"parsed_arguments": True}}
+                                    for idx, _ in enumerate(message.tool_calls or [])
+                                },
+                            },
+                        ),
+                    ),
+                ),
+                cast("dict[object, object]", delta.to_dict()),
+            ),
+        ),
+    )
+
+    # ensure tools that have already been parsed are added back into the newly
+    # constructed message snapshot
+    for tool_index, prev_tool in enumerate(message.tool_calls or []):
+        new_tool = (new_message.tool_calls or [])[tool_index]
+
+        if prev_tool.type == "function":
+            assert new_tool.type == "function"
+            new_tool.function.parsed_arguments = prev_tool.function.parsed_arguments
+        elif TYPE_CHECKING:  # type: ignore[unreachable]
+            assert_never(prev_tool)
+
+    return new_message
+
+
+_MESSAGE_DELTA_FIELDS = frozenset({"content", "refusal", "role", "tool_calls"})
+_TOOL_CALL_DELTA_FIELDS = frozenset({"index", "id", "type", "function"})
+_FUNCTION_DELTA_FIELDS = frozenset({"name", "arguments"})
+
+
+@lru_cache(maxsize=None)
+def _model_fields(type_: type[BaseModel]) -> frozenset[str]:
+    return frozenset(get_model_fields(type_))
+
+
+def _sets_only(model: BaseModel, fields: frozenset[str]) -> bool:
+    """Whether `fields` are the only properties of the given model that are set to something other than `None`."""
+    if PYDANTIC_V2 and model.model_extra:
+        return False
+
+    declared = _model_fields(type(model))
+    return all(name in fields or (name in declared and getattr(model, name) is None) for name in model.model_fields_set)
+
+
+def _accumulate_string(acc: str | None, delta: str | None) -> str | None:
+    # strings are accumulated the same way `accumulate_delta()` does
+    if acc is None:
+        return delta
+    if delta is None:
+        return acc
+    return acc + delta
+
+
+def _accumulate_message_delta(message: ParsedChatCompletionMessageSnapshot, delta: ChoiceDelta) -> bool:
+    """Merges the delta into the message snapshot in place, which results in the same snapshot as
+    `_rebuild_message_snapshot()` but only costs as much as the delta itself.
+
+    Returns `False`, without changing the snapshot, for uncommon deltas, e.g. ones with a `function_call`
+    or with properties that aren't part of the schema, which must be merged by rebuilding the snapshot.
+    """
+    if not _sets_only(delta, _MESSAGE_DELTA_FIELDS):
+        return False
+
+    tool_calls = message.tool_calls
+    previous_tool_calls = len(tool_calls or [])
+    if delta.tool_calls is not None:
+        indexes: set[int] = set()
+        for tool_call_delta in delta.tool_calls:
+            if tool_call_delta.index in indexes or not _sets_only(tool_call_delta, _TOOL_CALL_DELTA_FIELDS):
+                return False
+            indexes.add(tool_call_delta.index)
+
+            if tool_call_delta.function is not None and not _sets_only(
+                tool_call_delta.function, _FUNCTION_DELTA_FIELDS
+            ):
+                return False
+
+            if tool_calls is not None and tool_call_delta.index < len(tool_calls):
+                tool_call = tool_calls[tool_call_delta.index]
+                if (
+                    tool_call.type != "function"
+                    or not isinstance(getattr(tool_call, "function", None), ParsedFunction)
+                    or getattr(tool_call, "index", None) != tool_call_delta.index
+                    or ("type" in tool_call_delta.model_fields_set and tool_call_delta.type != "function")
+                ):
+                    return False
+
+    fields = delta.model_fields_set
+    if "content" in fields:
+        message.content = _accumulate_string(message.content, delta.content)
+    if "refusal" in fields:
+        message.refusal = _accumulate_string(message.refusal, delta.refusal)
+    if "role" in fields:
+        message.role = cast(Any, _accumulate_string(message.role, delta.role))
+
+    if delta.tool_calls is not None:
+        if tool_calls is None:
+            tool_calls = message.tool_calls = []
+
+        for tool_call_delta in delta.tool_calls:
+            if tool_call_delta.index >= len(tool_calls):
+                tool_calls.insert(
+                    tool_call_delta.index,
+                    cast(
+                        ParsedFunctionToolCall,
+                        construct_type(type_=ParsedFunctionToolCall, value=tool_call_delta.to_dict()),
+                    ),
+                )
+                continue
+
+            tool_call = tool_calls[tool_call_delta.index]
+            if "id" in tool_call_delta.model_fields_set:
+                tool_call.id = cast(str, _accumulate_string(tool_call.id, tool_call_delta.id))
+
+            function_delta = tool_call_delta.function
+            if function_delta is not None:
+                if "name" in function_delta.model_fields_set:
+                    tool_call.function.name = cast(
+                        str, _accumulate_string(tool_call.function.name, function_delta.name)
+                    )
+                if "arguments" in function_delta.model_fields_set:
+                    tool_call.function.arguments = cast(
+                        str, _accumulate_string(tool_call.function.arguments, function_delta.arguments)
+                    )
+
+    # a rebuilt snapshot has every property set, except for the `parsed` content which is dropped
+    message.model_fields_set.update(_model_fields(type(message)))
+    message.parsed = None
+    message.model_fields_set.discard("parsed")
+    for tool_call in (tool_calls or [])[:previous_tool_calls]:
+        tool_call.model_fields_set.update(_model_fields(type(tool_call)))
+        tool_call.function.model_fields_set.update(_model_fields(type(tool_call.function)))
+
+    return True
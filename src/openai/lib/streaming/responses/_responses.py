@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import inspect
 from types import TracebackType
-from typing import Any, List, Generic, Iterable, Awaitable, cast
+from typing import Any, Dict, List, Tuple, Generic, Iterable, Optional, Awaitable, cast
 from typing_extensions import Self, Callable, Iterator, AsyncIterator
 
 from ._types import ParsedResponseSnapshot
@@ -14,11 +14,12 @@ from ._events import (
     ResponseFunctionCallArgumentsDeltaEvent,
 )
 from ...._types import NOT_GIVEN, NotGiven
-from ...._utils import is_given, consume_sync_iterator, consume_async_iterator
+from ...._utils import is_given, is_mapping, consume_sync_iterator, consume_async_iterator
 from ...._models import build, construct_type_unchecked
-from ...._streaming import Stream, AsyncStream
+from ...._streaming import Stream, AsyncStream, iter_text_deltas
+from .._partial_json import PartialJSONParser
 from ....types.responses import ParsedResponse, ResponseStreamEvent as RawResponseStreamEvent
-from ..._parsing._responses import TextFormatT, parse_text, parse_response
+from ..._parsing._responses import TextFormatT, parse_text, parse_response, get_input_tool_by_name
 from ....types.responses.tool_param import ToolParam
 from ....types.responses.parsed_response import (
     ParsedContent,
@@ -59,6 +60,22 @@ class ResponseStream(Generic[TextFormatT]):
                 if self._starting_after is None or event.sequence_number > self._starting_after:
                     yield event
 
+    def text_deltas(self) -> Iterator[str]:
+        """Iterates over just the `response.output_text.delta` text, read straight from the raw events.
+
+        This skips building events & the response snapshot, so it can't be combined with
+        iterating over the stream and `get_final_response()` can't be used afterwards.
+
+        ```py
+        for text in stream.text_deltas():
+            print(text, end="", flush=True)
+        ```
+        """
+        raw_stream = self._raw_stream
+        for data in raw_stream._read(raw_stream._iter_data()):
+            if not _is_before_start(data, self._starting_after):
+                yield from iter_text_deltas(data)
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -158,6 +175,22 @@ class AsyncResponseStream(Generic[TextFormatT]):
                 if self._starting_after is None or event.sequence_number > self._starting_after:
                     yield event
 
+    async def text_deltas(self) -> AsyncIterator[str]:
+        """Iterates over just the `response.output_text.delta` text, read straight from the raw events.
+
+        This skips building events & the response snapshot, so it can't be combined with
+        iterating over the stream and `get_final_response()` can't be used afterwards.
+
+        ```py
+        async for text in stream.text_deltas():
+            print(text, end="", flush=True)
+        ```
+        """
+        async for data in self._raw_stream._iter_data():
+            if not _is_before_start(data, self._starting_after):
+                for text in iter_text_deltas(data):
+                    yield text
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -231,6 +264,15 @@ class AsyncResponseStreamManager(Generic[TextFormatT]):
             await self.__stream.close()
 
 
+def _is_before_start(data: object, starting_after: int | None) -> bool:
+    """Whether the decoded event is one of the events that are skipped because of `starting_after`."""
+    if starting_after is None or not is_mapping(data):
+        return False
+
+    sequence_number = data.get("sequence_number")
+    return isinstance(sequence_number, int) and sequence_number <= starting_after
+
+
 class ResponseStreamState(Generic[TextFormatT]):
     def __init__(
         self,
@@ -243,6 +285,9 @@ class ResponseStreamState(Generic[TextFormatT]):
         self._input_tools = [tool for tool in input_tools] if is_given(input_tools) else []
         self._text_format = text_format
         self._rich_text_format: type | NotGiven = text_format if inspect.isclass(text_format) else NOT_GIVEN
+        # partially parses the text of `(output_index, content_index)` & the arguments of `(output_index, None)`,
+        # only reading the new text of every delta
+        self.__json_parsers: Dict[Tuple[int, Optional[int]], PartialJSONParser] = {}
 
     def handle_event(self, event: RawResponseStreamEvent) -> List[ResponseStreamEvent[TextFormatT]]:
         self.__current_snapshot = snapshot = self.accumulate_event(event)
@@ -276,6 +321,11 @@ class ResponseStreamState(Generic[TextFormatT]):
             content = output.content[event.content_index]
             assert content.type == "output_text"
 
+            parsed = parse_text(event.text, text_format=self._text_format)
+            if is_given(self._rich_text_format):
+                # the text is complete, so the partially parsed JSON can be replaced with the `text_format` instance
+                content.parsed = parsed
+
             events.append(
                 build(
                     ResponseTextDoneEvent[TextFormatT],
@@ -286,7 +336,7 @@ class ResponseStreamState(Generic[TextFormatT]):
                     logprobs=event.logprobs,
                     type="response.output_text.done",
                     text=event.text,
-                    parsed=parse_text(event.text, text_format=self._text_format),
+                    parsed=parsed,
                 )
             )
         elif event.type == "response.function_call_arguments.delta":
@@ -322,6 +372,12 @@ class ResponseStreamState(Generic[TextFormatT]):
 
         return events
 
+    def _get_json_parser(self, output_index: int, content_index: Optional[int] = None) -> PartialJSONParser:
+        parser = self.__json_parsers.get((output_index, content_index))
+        if parser is None:
+            parser = self.__json_parsers[(output_index, content_index)] = PartialJSONParser()
+        return parser
+
     def accumulate_event(self, event: RawResponseStreamEvent) -> ParsedResponseSnapshot:
         snapshot = self.__current_snapshot
         if snapshot is None:
@@ -352,10 +408,18 @@ class ResponseStreamState(Generic[TextFormatT]):
                 content = output.content[event.content_index]
                 assert content.type == "output_text"
                 content.text += event.delta
+
+                # partial parsing fails on white-space
+                if is_given(self._rich_text_format) and content.text.lstrip():
+                    content.parsed = self._get_json_parser(event.output_index, event.content_index).parse(content.text)
         elif event.type == "response.function_call_arguments.delta":
             output = snapshot.output[event.output_index]
             if output.type == "function_call":
                 output.arguments += event.delta
+
+                input_tool = get_input_tool_by_name(input_tools=self._input_tools, name=output.name)
+                if input_tool and input_tool.get("strict") and output.arguments:
+                    output.parsed_arguments = self._get_json_parser(event.output_index).parse(output.arguments)
         elif event.type == "response.completed":
             self._completed_response = parse_response(
                 text_format=self._text_format,
@@ -24,6 +24,7 @@ from ...._utils import required_args, maybe_transform, async_maybe_transform
 from ...._compat import cached_property
 from ...._resource import SyncAPIResource, AsyncAPIResource
 from ...._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
+from ...._constants import RESPONSE_MODE_HEADER
 from ...._streaming import Stream, AsyncStream
 from ....pagination import SyncCursorPage, AsyncCursorPage
 from ....types.chat import (
@@ -1147,6 +1148,8 @@ class Completions(SyncAPIResource):
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> ChatCompletion | Stream[ChatCompletionChunk]:
         validate_response_format(response_format)
+        if self._client._response_mode == "raw":
+            extra_headers = {RESPONSE_MODE_HEADER: "raw", **(extra_headers or {})}
         return self._post(
             "/chat/completions",
             body=maybe_transform(
@@ -1446,6 +1449,8 @@ class Completions(SyncAPIResource):
         extra_headers = {
             "X-Stainless-Helper-Method": "chat.completions.stream",
             **(extra_headers or {}),
+            # the stream helper reads the chunks as models, whatever the client's response mode
+            RESPONSE_MODE_HEADER: "model",
         }
 
         api_request: partial[Stream[ChatCompletionChunk]] = partial(
@@ -2586,6 +2591,8 @@ class AsyncCompletions(AsyncAPIResource):
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> ChatCompletion | AsyncStream[ChatCompletionChunk]:
         validate_response_format(response_format)
+        if self._client._response_mode == "raw":
+            extra_headers = {RESPONSE_MODE_HEADER: "raw", **(extra_headers or {})}
         return await self._post(
             "/chat/completions",
             body=await async_maybe_transform(
@@ -2887,6 +2894,8 @@ class AsyncCompletions(AsyncAPIResource):
         extra_headers = {
             "X-Stainless-Helper-Method": "chat.completions.stream",
             **(extra_headers or {}),
+            # the stream helper reads the chunks as models, whatever the client's response mode
+            RESPONSE_MODE_HEADER: "model",
         }
 
         api_request = self.create(
@@ -15,8 +15,10 @@ from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
 from .._utils import is_given, maybe_transform
 from .._compat import cached_property
 from .._extras import numpy as np, has_numpy
+from .._models import RawDict
 from .._resource import SyncAPIResource, AsyncAPIResource
 from .._response import to_streamed_response_wrapper, async_to_streamed_response_wrapper
+from .._constants import RESPONSE_MODE_HEADER
 from .._base_client import make_request_options
 from ..types.embedding_model import EmbeddingModel
 from ..types.create_embedding_response import CreateEmbeddingResponse
@@ -24,6 +26,15 @@ from ..types.create_embedding_response import CreateEmbeddingResponse
 __all__ = ["Embeddings", "AsyncEmbeddings"]
 
 
+def _decode_embedding(data: object) -> object:
+    if not isinstance(data, str):
+        return data
+    if not has_numpy():
+        # use array for base64 optimisation
+        return array.array("f", base64.b64decode(data)).tolist()
+    return np.frombuffer(base64.b64decode(data), dtype="float32").tolist()  # type: ignore[no-untyped-call]
+
+
 class Embeddings(SyncAPIResource):
     @cached_property
     def with_raw_response(self) -> EmbeddingsWithRawResponse:
@@ -112,23 +123,29 @@ class Embeddings(SyncAPIResource):
                 # don't modify the response object if a user explicitly asked for a format
                 return obj
 
+            # the parser is typed for models, but receives plain dicts in the `"raw"` response mode
+            raw: object = obj
+            if isinstance(raw, RawDict):
+                # so we have to decode the embeddings in the dicts themselves
+                raw_data = cast("list[dict[str, object]]", raw.get("data"))
+                if not raw_data:
+                    raise ValueError("No embedding data received")
+
+                for raw_embedding in raw_data:
+                    raw_embedding["embedding"] = _decode_embedding(raw_embedding.get("embedding"))
+
+                return obj
+
             if not obj.data:
                 raise ValueError("No embedding data received")
 
             for embedding in obj.data:
-                data = cast(object, embedding.embedding)
-                if not isinstance(data, str):
-                    continue
-                if not has_numpy():
-                    # use array for base64 optimisation
-                    embedding.embedding = array.array("f", base64.b64decode(data)).tolist()
-                else:
-                    embedding.embedding = np.frombuffer(  # type: ignore[no-untyped-call]
-                        base64.b64decode(data), dtype="float32"
-                    ).tolist()
+                embedding.embedding = cast("list[float]", _decode_embedding(embedding.embedding))
 
             return obj
 
+        if self._client._response_mode == "raw":
+            extra_headers = {RESPONSE_MODE_HEADER: "raw", **(extra_headers or {})}
         return self._post(
             "/embeddings",
             body=maybe_transform(params, embedding_create_params.EmbeddingCreateParams),
@@ -231,23 +248,29 @@ class AsyncEmbeddings(AsyncAPIResource):
                 # don't modify the response object if a user explicitly asked for a format
                 return obj
 
+            # the parser is typed for models, but receives plain dicts in the `"raw"` response mode
+            raw: object = obj
+            if isinstance(raw, RawDict):
+                # so we have to decode the embeddings in the dicts themselves
+                raw_data = cast("list[dict[str, object]]", raw.get("data"))
+                if not raw_data:
+                    raise ValueError("No embedding data received")
+
+                for raw_embedding in raw_data:
+                    raw_embedding["embedding"] = _decode_embedding(raw_embedding.get("embedding"))
+
+                return obj
+
             if not obj.data:
                 raise ValueError("No embedding data received")
 
             for embedding in obj.data:
-                data = cast(object, embedding.embedding)
-                if not isinstance(data, str):
-                    continue
-                if not has_numpy():
-                    # use array for base64 optimisation
-                    embedding.embedding = array.array("f", base64.b64decode(data)).tolist()
-                else:
-                    embedding.embedding = np.frombuffer(  # type: ignore[no-untyped-call]
-                        base64.b64decode(data), dtype="float32"
-                    ).tolist()
+                embedding.embedding = cast("list[float]", _decode_embedding(embedding.embedding))
 
             return obj
 
+        if self._client._response_mode == "raw":
+            extra_headers = {RESPONSE_MODE_HEADER: "raw", **(extra_headers or {})}
         return await self._post(
             "/embeddings",
             body=maybe_transform(params, embedding_create_params.EmbeddingCreateParams),
@@ -22,6 +22,7 @@ from .input_items import (
     InputItemsWithStreamingResponse,
     AsyncInputItemsWithStreamingResponse,
 )
+from ..._constants import RESPONSE_MODE_HEADER
 from ..._streaming import Stream, AsyncStream
 from ...lib._tools import PydanticFunctionTool, ResponsesPydanticFunctionTool
 from ..._base_client import make_request_options
@@ -792,6 +793,8 @@ class Responses(SyncAPIResource):
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> Response | Stream[ResponseStreamEvent]:
+        if self._client._response_mode == "raw":
+            extra_headers = {RESPONSE_MODE_HEADER: "raw", **(extra_headers or {})}
         return self._post(
             "/responses",
             body=maybe_transform(
@@ -942,6 +945,8 @@ class Responses(SyncAPIResource):
                 + ", ".join(new_response_args_names)
             )
         tools = _make_tools(tools)
+        # the stream helper reads the events as models, whatever the client's response mode
+        extra_headers = {**(extra_headers or {}), RESPONSE_MODE_HEADER: "model"}
         if len(new_response_args_names) > 0:
             if not is_given(input):
                 raise ValueError("input must be provided when creating a new response")
@@ -2158,6 +2163,8 @@ class AsyncResponses(AsyncAPIResource):
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
     ) -> Response | AsyncStream[ResponseStreamEvent]:
+        if self._client._response_mode == "raw":
+            extra_headers = {RESPONSE_MODE_HEADER: "raw", **(extra_headers or {})}
         return await self._post(
             "/responses",
             body=await async_maybe_transform(
@@ -2309,6 +2316,8 @@ class AsyncResponses(AsyncAPIResource):
             )
 
         tools = _make_tools(tools)
+        # the stream helper reads the events as models, whatever the client's response mode
+        extra_headers = {**(extra_headers or {}), RESPONSE_MODE_HEADER: "model"}
         if len(new_response_args_names) > 0:
             if isinstance(input, NotGiven):
                 raise ValueError("input must be provided when creating a new response")
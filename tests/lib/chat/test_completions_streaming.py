@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+import json
 from typing import Any, Generic, Callable, Iterator, cast, overload
+from unittest import mock
 from typing_extensions import Literal, TypeVar
 
 import rich
@@ -19,6 +21,7 @@ import openai
 from openai import OpenAI, AsyncOpenAI
 from openai._utils import consume_sync_iterator, assert_signatures_in_sync
 from openai._compat import model_copy
+from openai._models import construct_type
 from openai.types.chat import ChatCompletionChunk
 from openai.lib.streaming.chat import (
     ContentDoneEvent,
@@ -1067,6 +1070,125 @@ recommend checking a reliable weather website or a weather app.",
     )
 
 
+def _chunk(delta: dict[str, Any], *, index: int = 0, **choice: Any) -> ChatCompletionChunk:
+    return cast(
+        ChatCompletionChunk,
+        construct_type(
+            type_=ChatCompletionChunk,
+            value={
+                "id": "chatcmpl-123",
+                "object": "chat.completion.chunk",
+                "created": 1694268190,
+                "model": "gpt-4o-2024-08-06",
+                "choices": [{"index": index, "delta": delta, "finish_reason": None, "logprobs": None, **choice}],
+            },
+        ),
+    )
+
+
+class Location(BaseModel):
+    city: str
+    temperature: float
+
+
+@pytest.mark.parametrize(
+    "chunks,kwargs",
+    [
+        (
+            [
+                _chunk({"role": "assistant", "content": "", "refusal": None}),
+                _chunk({"content": '{"city": "San Francisco", '}),
+                _chunk({"role": "assistant", "content": '{"city": "N'}, index=1),
+                _chunk({"content": '"temperature": 65}', "function_call": None}),
+                _chunk({"content": 'YC", "temperature": 71}'}, index=1),
+                _chunk({}, finish_reason="stop"),
+            ],
+            {"response_format": Location},
+        ),
+        (
+            [
+                _chunk({"role": "assistant", "content": None, "refusal": ""}),
+                _chunk({"refusal": "I'm sorry"}),
+                _chunk({"refusal": ", I can't"}),
+                _chunk({}, finish_reason="stop"),
+            ],
+            {"response_format": Location},
+        ),
+        (
+            [
+                _chunk({"role": "assistant", "content": "Checking"}),
+                _chunk(
+                    {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {"name": "get", "arguments": ""},
+                            }
+                        ]
+                    }
+                ),
+                _chunk({"tool_calls": [{"index": 0, "function": {"arguments": '{"city": '}}]}),
+                _chunk(
+                    {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '"SF"}'}},
+                            {
+                                "index": 1,
+                                "id": "call_2",
+                                "type": "function",
+                                "function": {"name": "get", "arguments": ""},
+                            },
+                        ]
+                    }
+                ),
+                _chunk({"tool_calls": [{"index": 1, "id": None, "function": {"arguments": '{"city": "NYC"}'}}]}),
+                # uncommon deltas that are merged by rebuilding the snapshot
+                _chunk({"function_call": {"name": "legacy", "arguments": "{}"}}),
+                _chunk({"content": "!", "custom": "value"}),
+                _chunk({"tool_calls": [{"index": 1, "function": {"arguments": "", "extra": 1}}]}),
+                _chunk({"content": "!"}),
+                _chunk({}, finish_reason="tool_calls"),
+            ],
+            {
+                "input_tools": [
+                    {
+                        "type": "function",
+                        "function": {"name": "get", "parameters": {"type": "object"}, "strict": True},
+                    }
+                ]
+            },
+        ),
+    ],
+    ids=["content", "refusal", "tool_calls"],
+)
+def test_in_place_accumulation_matches_rebuilding_the_snapshot(
+    chunks: list[ChatCompletionChunk], kwargs: dict[str, Any]
+) -> None:
+    def accumulate() -> list[object]:
+        state: ChatCompletionStreamState[Any] = ChatCompletionStreamState(**kwargs)
+        results: list[object] = []
+        for chunk in chunks:
+            events = list(state.handle_chunk(chunk))
+            snapshot = state.current_completion_snapshot
+            results.append(
+                (
+                    repr(snapshot),
+                    snapshot.to_dict(),
+                    [(repr(event), event.to_dict()) for event in events],
+                )
+            )
+        results.append(repr(state.get_final_completion()))
+        return results
+
+    in_place = accumulate()
+    with mock.patch("openai.lib.streaming.chat._completions._accumulate_message_delta", return_value=False):
+        rebuilt = accumulate()
+
+    assert in_place == rebuilt
+
+
 @pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
 def test_stream_method_in_sync(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
     checking_client: OpenAI | AsyncOpenAI = client if sync else async_client
@@ -1186,3 +1308,39 @@ def _make_raw_stream_snapshot_request(
 
     if live:
         client.close()
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_stream_text_deltas(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    chunks = [
+        {"role": "assistant", "content": ""},
+        {"content": "Hello"},
+        {"content": " world"},
+        {},
+    ]
+    respx_mock.post("/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content="".join(
+                "data: "
+                + json.dumps(
+                    {
+                        "id": "chatcmpl-123",
+                        "object": "chat.completion.chunk",
+                        "created": 0,
+                        "model": "gpt-4o",
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+                    }
+                )
+                + "\n\n"
+                for delta in chunks
+            )
+            + "data: [DONE]\n\n",
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    async with async_client.chat.completions.stream(
+        model="gpt-4o", messages=[{"role": "user", "content": "Say hello"}]
+    ) as stream:
+        assert [text async for text in stream.text_deltas()] == ["Hello", " world"]
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import json
+from typing import Any, Dict, List, cast
 from typing_extensions import TypeVar
 
+import httpx
 import pytest
 from respx import MockRouter
 from inline_snapshot import snapshot
 
-from openai import OpenAI
+from openai import OpenAI, BaseModel
+from openai._models import construct_type
+from openai.lib.streaming.responses._responses import ResponseStreamState, RawResponseStreamEvent
 
 from ...conftest import base_url
 from ..snapshots import make_snapshot_request
@@ -38,3 +43,151 @@ def test_output_text(client: OpenAI, respx_mock: MockRouter) -> None:
     assert response.output_text == snapshot(
         "I can't provide real-time updates, but you can easily check the current weather in San Francisco using a weather website or app. Typically, San Francisco has cool, foggy summers and mild winters, so it's good to be prepared for variable weather!"
     )
+
+
+def test_stream_state_parses_partial_json() -> None:
+    class Location(BaseModel):
+        city: str
+        temperature: float
+
+    def event(value: Dict[str, Any]) -> RawResponseStreamEvent:
+        return cast(RawResponseStreamEvent, construct_type(type_=RawResponseStreamEvent, value=value))
+
+    state = ResponseStreamState(
+        text_format=Location,
+        input_tools=[{"type": "function", "name": "get_weather", "parameters": {}, "strict": True}],
+    )
+    state.handle_event(
+        event(
+            {
+                "type": "response.created",
+                "sequence_number": 0,
+                "response": {
+                    "id": "resp_123",
+                    "object": "response",
+                    "created_at": 0,
+                    "model": "gpt-4o",
+                    "output": [],
+                    "parallel_tool_calls": True,
+                    "tool_choice": "auto",
+                    "tools": [],
+                },
+            }
+        )
+    )
+    state.handle_event(
+        event(
+            {
+                "type": "response.output_item.added",
+                "sequence_number": 1,
+                "output_index": 0,
+                "item": {
+                    "type": "message",
+                    "id": "msg_123",
+                    "role": "assistant",
+                    "status": "in_progress",
+                    "content": [],
+                },
+            }
+        )
+    )
+    state.handle_event(
+        event(
+            {
+                "type": "response.content_part.added",
+                "sequence_number": 2,
+                "output_index": 0,
+                "content_index": 0,
+                "item_id": "msg_123",
+                "part": {"type": "output_text", "text": "", "annotations": []},
+            }
+        )
+    )
+
+    current = state.accumulate_event(
+        event(
+            {
+                "type": "response.output_item.added",
+                "sequence_number": 3,
+                "output_index": 1,
+                "item": {"type": "function_call", "call_id": "call_123", "name": "get_weather", "arguments": ""},
+            }
+        )
+    )
+
+    parsed: List[object] = []
+    for sequence_number, delta in enumerate(['{"city": "San ', 'Francisco", "temp', 'erature": 6', "5.5}"]):
+        state.handle_event(
+            event(
+                {
+                    "type": "response.output_text.delta",
+                    "sequence_number": 4 + sequence_number,
+                    "output_index": 0,
+                    "content_index": 0,
+                    "item_id": "msg_123",
+                    "delta": delta,
+                    "logprobs": [],
+                }
+            )
+        )
+        current = state.accumulate_event(
+            event(
+                {
+                    "type": "response.function_call_arguments.delta",
+                    "sequence_number": 8 + sequence_number,
+                    "output_index": 1,
+                    "item_id": "fc_123",
+                    "delta": delta,
+                }
+            )
+        )
+        message = current.output[0]
+        function_call = current.output[1]
+        assert message.type == "message" and message.content[0].type == "output_text"
+        assert function_call.type == "function_call"
+        assert message.content[0].parsed == function_call.parsed_arguments
+        parsed.append(function_call.parsed_arguments)
+
+    assert parsed == [
+        {},
+        {"city": "San Francisco"},
+        {"city": "San Francisco", "temperature": 6},
+        {"city": "San Francisco", "temperature": 65.5},
+    ]
+
+    state.handle_event(
+        event(
+            {
+                "type": "response.output_text.done",
+                "sequence_number": 12,
+                "output_index": 0,
+                "content_index": 0,
+                "item_id": "msg_123",
+                "text": '{"city": "San Francisco", "temperature": 65.5}',
+                "logprobs": [],
+            }
+        )
+    )
+    message = current.output[0]
+    assert message.type == "message" and message.content[0].type == "output_text"
+    assert message.content[0].parsed == Location(city="San Francisco", temperature=65.5)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stream_text_deltas(client: OpenAI, respx_mock: MockRouter) -> None:
+    events = [
+        {"type": "response.output_text.delta", "delta": "skipped", "sequence_number": 1},
+        {"type": "response.output_text.delta", "delta": "Hello", "sequence_number": 2},
+        {"type": "response.function_call_arguments.delta", "delta": "{}", "sequence_number": 3},
+        {"type": "response.output_text.delta", "delta": " world", "sequence_number": 4},
+    ]
+    respx_mock.get("/responses/resp_123").mock(
+        return_value=httpx.Response(
+            200,
+            content="".join(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events),
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    with client.responses.stream(response_id="resp_123", starting_after=1) as stream:
+        assert list(stream.text_deltas()) == ["Hello", " world"]
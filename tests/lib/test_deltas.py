@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, List, cast
+
+import pytest
+
+from openai._compat import model_dump, get_model_fields
+from openai._models import BaseModel, construct_type
+from openai.types.beta import AssistantStreamEvent
+from openai.types.beta.threads import Message
+from openai.lib.streaming._deltas import DeltaAccumulator, accumulate_delta
+from openai.types.beta.threads.runs import RunStep
+from openai.lib.streaming._assistants import AssistantEventHandler
+
+DELTAS: List[Dict[str, Any]] = [
+    {"index": 0, "type": "text", "text": {"value": "Hello", "annotations": []}},
+    {"index": 0, "type": "text", "text": {"value": " world"}},
+    {"count": 1, "tags": ["a"], "items": [{"index": 0, "name": "fo"}]},
+    {"count": 2, "tags": ["b", "c"], "items": [{"index": 0, "name": "o"}, {"index": 1, "name": "bar"}]},
+    {"type": "image_file", "text": None, "items": [{"index": 1, "name": "!"}]},
+]
+
+
+def fields_set(value: object) -> object:
+    """Returns the values of a model together with the declared fields that were set, recursively."""
+    if isinstance(value, BaseModel):
+        names = value.model_fields_set & set(get_model_fields(type(value)))
+        return (type(value), names, fields_set(dict(value)))
+    if isinstance(value, dict):
+        return {key: fields_set(item) for key, item in cast("dict[str, object]", value).items()}
+    if isinstance(value, list):
+        return [fields_set(item) for item in cast("list[object]", value)]
+    return value
+
+
+def test_matches_accumulate_delta() -> None:
+    accumulator = DeltaAccumulator()
+    expected: Dict[object, object] = {}
+    snapshots: List[Any] = []
+    for delta in DELTAS:
+        expected = accumulate_delta(expected, cast("dict[object, object]", copy.deepcopy(delta)))
+        accumulator.add(cast("dict[object, object]", delta))
+
+        snapshot = accumulator.finalize()
+        assert snapshot == expected
+        snapshots.append((snapshot, repr(snapshot)))
+
+    # the snapshots that were returned before weren't changed by later deltas
+    for snapshot, dumped in snapshots:
+        assert repr(snapshot) == dumped
+
+
+def test_errors() -> None:
+    accumulator = DeltaAccumulator({"items": [{"index": 0}]})
+    with pytest.raises(TypeError, match="not a dictionary"):
+        accumulator.add({"items": ["a"]})
+    with pytest.raises(RuntimeError, match="`index` key"):
+        accumulator.add({"items": [{"name": "a"}]})
+
+
+def test_finalize_model_matches_construct_type() -> None:
+    run_step: Dict[str, Any] = {
+        "id": "step_123",
+        "object": "thread.run.step",
+        "created_at": 0,
+        "assistant_id": "asst_123",
+        "thread_id": "thread_123",
+        "run_id": "run_123",
+        "type": "tool_calls",
+        "status": "in_progress",
+        "step_details": {"type": "tool_calls", "tool_calls": []},
+    }
+    deltas: List[Dict[str, Any]] = [
+        {"step_details": {"type": "tool_calls", "tool_calls": [{"index": 0, "type": "function", "id": "call_1"}]}},
+        {
+            "step_details": {
+                "type": "tool_calls",
+                "tool_calls": [{"index": 0, "type": "function", "function": {"name": "f", "arguments": "{"}}],
+            }
+        },
+        {"step_details": {"type": "tool_calls", "tool_calls": [{"index": 1, "type": "code_interpreter", "id": "c"}]}},
+        {"step_details": {"type": "tool_calls", "tool_calls": [{"index": 0, "function": {"arguments": "}"}}]}},
+        {"status": "completed", "usage": {"prompt_tokens": 1, "completion_tokens": 2, "total_tokens": 3}},
+    ]
+
+    snapshot = cast(RunStep, construct_type(type_=RunStep, value=run_step))
+    accumulator = DeltaAccumulator(cast("dict[object, object]", model_dump(snapshot, exclude_unset=True)))
+    snapshots: List[Any] = []
+    for delta in deltas:
+        expected = construct_type(
+            type_=RunStep,
+            value=accumulate_delta(
+                cast("dict[object, object]", model_dump(snapshot, exclude_unset=True)),
+                cast("dict[object, object]", copy.deepcopy(delta)),
+            ),
+        )
+        accumulator.add(cast("dict[object, object]", delta))
+        snapshot = accumulator.finalize_model(RunStep, snapshot)
+
+        assert fields_set(snapshot) == fields_set(expected)
+        snapshots.append((snapshot, repr(snapshot)))
+
+    for snapshot, dumped in snapshots:
+        assert repr(snapshot) == dumped
+
+
+def test_assistant_event_handler() -> None:
+    def event(name: str, data: Dict[str, Any]) -> AssistantStreamEvent:
+        return cast(
+            AssistantStreamEvent,
+            construct_type(type_=cast(Any, AssistantStreamEvent), value={"event": name, "data": data}),
+        )
+
+    def message_delta(content: List[Dict[str, Any]]) -> AssistantStreamEvent:
+        return event(
+            "thread.message.delta",
+            {"id": "msg_123", "object": "thread.message.delta", "delta": {"content": content}},
+        )
+
+    handler = AssistantEventHandler()
+    texts: List[str] = []
+    handler.on_text_delta = lambda _delta, snapshot: texts.append(snapshot.value)  # type: ignore
+
+    handler._emit_sse_event(
+        event(
+            "thread.message.created",
+            {
+                "id": "msg_123",
+                "object": "thread.message",
+                "created_at": 0,
+                "thread_id": "thread_123",
+                "role": "assistant",
+                "status": "in_progress",
+                "content": [],
+            },
+        )
+    )
+    handler._emit_sse_event(message_delta([{"index": 0, "type": "text", "text": {"value": "The", "annotations": []}}]))
+    handler._emit_sse_event(message_delta([{"index": 0, "type": "text", "text": {"value": " answer"}}]))
+    handler._emit_sse_event(
+        message_delta(
+            [
+                {
+                    "index": 0,
+                    "type": "text",
+                    "text": {
+                        "value": " [1]",
+                        "annotations": [
+                            {
+                                "index": 0,
+                                "type": "file_citation",
+                                "text": "[1]",
+                                "start_index": 10,
+                                "end_index": 13,
+                                "file_citation": {"file_id": "file_123"},
+                            }
+                        ],
+                    },
+                },
+                {"index": 1, "type": "text", "text": {"value": "Second", "annotations": []}},
+            ]
+        )
+    )
+
+    assert texts == ["The", "The answer", "The answer [1]", "Second"]
+    message = handler.current_message_snapshot
+    assert isinstance(message, Message)
+    assert [block.text.value for block in message.content if block.type == "text"] == ["The answer [1]", "Second"]
+    block = message.content[0]
+    assert block.type == "text"
+    assert [annotation.type for annotation in block.text.annotations] == ["file_citation"]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import json
+import asyncio
+from typing import Any, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import AsyncOpenAI, InternalServerError
+from openai.helpers import AsyncEmbeddingBatcher
+from openai.helpers.embedding_batcher import _split_tokens
+
+from ..conftest import base_url
+
+
+def mock_embeddings(respx_mock: MockRouter, *, status_code: int = 200) -> List[Any]:
+    requests: List[Any] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body: Any = json.loads(request.content)
+        requests.append(body)
+        await asyncio.sleep(0.01)
+        if status_code != 200:
+            return httpx.Response(status_code, json={"error": {"message": "oops"}})
+
+        data = [
+            {"object": "embedding", "index": index, "embedding": [float(len(item))]}
+            for index, item in enumerate(body["input"])
+        ]
+        tokens = sum(len(item) for item in body["input"])
+        return httpx.Response(
+            200,
+            headers={"x-request-id": "req_123"},
+            # the order of the data isn't guaranteed
+            json={
+                "object": "list",
+                "data": data[::-1],
+                "model": body["model"],
+                "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+            },
+        )
+
+    respx_mock.post("/embeddings").mock(side_effect=handler)
+    return requests
+
+
+def test_split_tokens() -> None:
+    assert _split_tokens(10, [1, 1, 1]) == [4, 3, 3]
+    assert _split_tokens(7, [2, 0, 5]) == [2, 0, 5]
+    assert _split_tokens(5, [0, 0]) == [3, 2]
+    assert sum(_split_tokens(1001, [3, 7, 11, 13])) == 1001
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_embedding_batcher(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    requests = mock_embeddings(respx_mock)
+    batcher = AsyncEmbeddingBatcher(async_client, max_wait=0.05)
+
+    inputs: List[Any] = ["a", ["bb", "ccc"], "dddd", [1, 2, 3], [[1], [1, 2]]]
+    responses = await asyncio.gather(
+        *(batcher.create(input=input, model="text-embedding-3-small", encoding_format="float") for input in inputs)
+    )
+
+    # text & token arrays can't be sent in the same request
+    assert [request["input"] for request in requests] == [["a", "bb", "ccc", "dddd"], [[1, 2, 3], [1], [1, 2]]]
+    assert batcher.stats() == (5, 2)
+
+    assert [[embedding.embedding for embedding in response.data] for response in responses] == [
+        [[1.0]],
+        [[2.0], [3.0]],
+        [[4.0]],
+        [[3.0]],
+        [[1.0], [2.0]],
+    ]
+    assert [[embedding.index for embedding in response.data] for response in responses[:2]] == [[0], [0, 1]]
+    assert responses[0]._request_id == "req_123"
+
+    # the usage of token arrays is exact
+    assert [response.usage.prompt_tokens for response in responses[3:]] == [3, 3]
+    # & the usage of text is split in proportion to its length, adding up to the usage of the request
+    assert sum(response.usage.prompt_tokens for response in responses[:3]) == 10
+    assert sum(response.usage.total_tokens for response in responses[:3]) == 10
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_embedding_batcher_limits(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    requests = mock_embeddings(respx_mock)
+    batcher = AsyncEmbeddingBatcher(async_client, max_wait=10, max_inputs=3)
+
+    # a full batch is sent without waiting
+    responses = await asyncio.wait_for(
+        asyncio.gather(*(batcher.create(input=str(i), model="text-embedding-3-small") for i in range(6))), timeout=5
+    )
+    assert [request["input"] for request in requests] == [["0", "1", "2"], ["3", "4", "5"]]
+    assert [response.data[0].embedding for response in responses] == [[1.0]] * 6
+
+    # calls are batched per model
+    batcher = AsyncEmbeddingBatcher(async_client, max_wait=0.01)
+    await asyncio.gather(
+        batcher.create(input="a", model="text-embedding-3-small"),
+        batcher.create(input="b", model="text-embedding-3-large"),
+    )
+    assert len(requests) == 4
+
+    # calls with extra options are sent on their own
+    await asyncio.gather(
+        batcher.create(input="a", model="text-embedding-3-small"),
+        batcher.create(input="b", model="text-embedding-3-small", extra_headers={"x-foo": "bar"}),
+    )
+    assert len(requests) == 6
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_embedding_batcher_errors(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    mock_embeddings(respx_mock, status_code=500)
+    batcher = AsyncEmbeddingBatcher(async_client.with_options(max_retries=0))
+
+    results = await asyncio.gather(
+        *(batcher.create(input=text, model="text-embedding-3-small") for text in ["a", "b"]), return_exceptions=True
+    )
+    assert all(isinstance(result, InternalServerError) for result in results)
+    assert batcher.stats() == (2, 1)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_embedding_batcher_cancelled_sender(async_client: AsyncOpenAI, respx_mock: MockRouter) -> None:
+    requests = mock_embeddings(respx_mock)
+    batcher = AsyncEmbeddingBatcher(async_client, max_wait=0.05)
+
+    sender = asyncio.ensure_future(batcher.create(input="a", model="text-embedding-3-small"))
+    await asyncio.sleep(0)
+    waiter = asyncio.ensure_future(batcher.create(input="bb", model="text-embedding-3-small"))
+    await asyncio.sleep(0)
+    sender.cancel()
+
+    response = await waiter
+    # the other call sends its input on its own
+    assert [request["input"] for request in requests] == [["bb"]]
+    assert response.data[0].embedding == [2.0]
+    assert response.usage.prompt_tokens == 2
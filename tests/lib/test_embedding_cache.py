@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import base64
+from typing import Any, List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from openai import OpenAI, AsyncOpenAI
+from openai._extras import numpy as np, has_numpy
+from openai.helpers import EmbeddingCache, AsyncEmbeddingCache
+
+from ..conftest import base_url
+
+pytestmark = pytest.mark.skipif(not has_numpy(), reason="numpy is not installed")
+
+
+def embed(text: str) -> List[float]:
+    return [float(len(text)), float(ord(text[0]))]
+
+
+def mock_embeddings(respx_mock: MockRouter) -> List[List[str]]:
+    requests: List[List[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body: Any = json.loads(request.content)
+        assert body["encoding_format"] == "base64"
+        requests.append(body["input"])
+        data = [
+            {
+                "object": "embedding",
+                "index": index,
+                "embedding": base64.b64encode(np.array(embed(text), dtype=np.float32).tobytes()).decode(),
+            }
+            for index, text in enumerate(body["input"])
+        ]
+        # the order of the data isn't guaranteed
+        return httpx.Response(200, json={"object": "list", "data": data[::-1], "model": body["model"]})
+
+    respx_mock.post("/embeddings").mock(side_effect=handler)
+    return requests
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_embedding_cache(client: OpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requests = mock_embeddings(respx_mock)
+    cache = EmbeddingCache(client, tmp_path, batch_size=2)
+
+    vectors = cache.create(input=["a", "bb", "a", "ccc"], model="text-embedding-3-small")
+    # only unique inputs are sent, in batches
+    assert requests == [["a", "bb"], ["ccc"]]
+    assert [vector.tolist() for vector in vectors] == [embed(text) for text in ["a", "bb", "a", "ccc"]]
+    assert vectors[0].dtype == np.float32
+    assert isinstance(vectors[0].base, np.memmap)
+    assert cache.stats() == (0, 4)
+
+    vectors = cache.create(input=["dddd", "bb", "a"], model="text-embedding-3-small")
+    assert requests[2:] == [["dddd"]]
+    assert [vector.tolist() for vector in vectors] == [embed(text) for text in ["dddd", "bb", "a"]]
+    assert cache.stats() == (2, 5)
+    assert cache.stats().hit_rate == 2 / 7
+
+    # embeddings are cached per model & number of dimensions
+    cache.create(input="a", model="text-embedding-3-small", dimensions=2)
+    assert requests[3:] == [["a"]]
+
+    # and persisted
+    cache = EmbeddingCache(client, tmp_path)
+    vector = cache.create(input="bb", model="text-embedding-3-small")
+    assert [v.tolist() for v in vector] == [embed("bb")]
+    assert len(requests) == 4
+    assert cache.stats().hit_rate == 1.0
+
+    assert cache.create(input=[], model="text-embedding-3-small") == []
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_embedding_cache(async_client: AsyncOpenAI, respx_mock: MockRouter, tmp_path: Path) -> None:
+    requests = mock_embeddings(respx_mock)
+    cache = AsyncEmbeddingCache(async_client, tmp_path)
+
+    vectors = await cache.create(input=["a", "bb"], model="text-embedding-3-small")
+    vectors = await cache.create(input=["bb", "ccc", "a"], model="text-embedding-3-small")
+    assert requests == [["a", "bb"], ["ccc"]]
+    assert [vector.tolist() for vector in vectors] == [embed(text) for text in ["bb", "ccc", "a"]]
+    assert cache.stats() == (2, 3)
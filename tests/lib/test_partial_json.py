@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+from typing import Any, List, Tuple
+
+import pytest
+from jiter import from_json
+
+from openai.lib.streaming._partial_json import PartialJSONParser
+
+
+def parse_with_jiter(text: str) -> Tuple[str, Any]:
+    try:
+        return "ok", from_json(bytes(text, "utf-8"), partial_mode=True)
+    except ValueError as exc:
+        return "error", str(exc)
+
+
+def parse_with_parser(parser: PartialJSONParser, text: str) -> Tuple[str, Any]:
+    try:
+        return "ok", parser.parse(text)
+    except ValueError as exc:
+        return "error", str(exc)
+
+
+def same(a: Any, b: Any) -> bool:
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, float) and math.isnan(a):
+        return math.isnan(b)
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(same(a[key], b[key]) for key in a)  # type: ignore
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))  # type: ignore
+    return bool(a == b)
+
+
+def random_value(rnd: random.Random, depth: int = 0) -> Any:
+    r = rnd.random()
+    if depth > 3 or r < 0.5:
+        return rnd.choice(
+            [0, 1, -12, 3.5, -0.25, 1e21, 1.5e-7, 2**100, True, False, None, "", "héllo", 'a"b\\c/d\n\t\u0001', "😀"]
+        )
+    if r < 0.75:
+        return {
+            rnd.choice(["a", "key", "ké", "😀", ""]) + str(i): random_value(rnd, depth + 1)
+            for i in range(rnd.randint(0, 4))
+        }
+    return [random_value(rnd, depth + 1) for _ in range(rnd.randint(0, 4))]
+
+
+def random_documents() -> List[str]:
+    rnd = random.Random(0)
+    documents: List[str] = []
+    for _ in range(100):
+        value = {"root": random_value(rnd)} if rnd.random() < 0.7 else [random_value(rnd) for _ in range(3)]
+        documents.append(json.dumps(value, ensure_ascii=rnd.random() < 0.5, indent=rnd.choice([None, 2])))
+    return documents
+
+
+INVALID_DOCUMENTS = [
+    '{"a": 01}',
+    '{"a": 1.}',
+    '{"a": 1E+0, "b": 1e-2}',
+    '{"a": NaN, "b": 1}',
+    '{"a": -Infinity}',
+    '{"a": 1, "a": 2}',
+    '{"a": 1} x',
+    '  {"a": [1 2]}',
+    '{"a": "x\ny"}',
+    '{"a": "\\ud83dx"}',
+    '{"a": "\\ude00"}',
+    '{"a": "\\uZZZZ"}',
+    '{"a": "\\q"}',
+    '{"a": [true, false, null, truex]}',
+    '{"a": tru}',
+    "{,}",
+    "[1,]",
+    '"text"',
+    "12",
+    " ",
+]
+
+
+@pytest.mark.parametrize("document", random_documents() + INVALID_DOCUMENTS)
+def test_matches_jiter(document: str) -> None:
+    rnd = random.Random(document)
+    for _ in range(3):
+        parser = PartialJSONParser()
+        results: List[Tuple[Any, str]] = []
+        end = 0
+        while end < len(document):
+            end = min(len(document), end + rnd.randint(1, 7))
+            text = document[:end]
+
+            expected = parse_with_jiter(text)
+            result = parse_with_parser(parser, text)
+            assert result[0] == expected[0], text
+            assert same(result[1], expected[1]), text
+            results.append((result[1], repr(result[1])))
+
+        # the values that were returned before weren't changed by parsing more text
+        for value, dumped in results:
+            assert repr(value) == dumped
+
+
+def test_shares_complete_values() -> None:
+    parser = PartialJSONParser()
+    first: Any = parser.parse('{"done": {"a": [1, 2]}, "items": [{"b": "x')
+    assert first == {"done": {"a": [1, 2]}, "items": [{}]}
+
+    second: Any = parser.parse('{"done": {"a": [1, 2]}, "items": [{"b": "xy"}, 3')
+    assert second == {"done": {"a": [1, 2]}, "items": [{"b": "xy"}, 3]}
+    assert first == {"done": {"a": [1, 2]}, "items": [{}]}
+    assert second["done"] is first["done"]
+
+
+def test_restarts_on_shorter_text() -> None:
+    parser = PartialJSONParser()
+    assert parser.parse('{"a": [1, 2') == {"a": [1, 2]}
+    assert parser.parse('{"b": tr') == {}
+    assert parser.parse('{"b": true}') == {"b": True}
+
+
+def test_errors() -> None:
+    parser = PartialJSONParser()
+    with pytest.raises(ValueError):
+        parser.parse("   ")
+    with pytest.raises(ValueError):
+        parser.parse('   {"a": }')
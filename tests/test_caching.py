@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import gzip
+import time
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+
+from openai import SQLiteCache, InMemoryCache, ResponseCache, CachedResponse, CompletionCache
+from openai._models import FinalRequestOptions
+
+
+def make_response(content: bytes = b"{}", *, expires_in: float = 60) -> CachedResponse:
+    return CachedResponse(
+        status_code=200,
+        headers=[("content-type", "application/json")],
+        content=content,
+        expires_at=time.time() + expires_in,
+    )
+
+
+def test_ttl() -> None:
+    cache = ResponseCache(ttls={"/models": 10, "/models/": 20, "/vector_stores/": 5, "/vector_stores/vs_1/": 1})
+    assert cache.ttl("/models") == 10
+    assert cache.ttl("/models/gpt-4o") == 20
+    assert cache.ttl("/vector_stores/vs_2/files") == 5
+    # the longest matching path is used
+    assert cache.ttl("/vector_stores/vs_1/files") == 1
+    assert cache.ttl("/vector_stores") is None
+    assert cache.ttl("/chat/completions") is None
+
+
+def test_in_memory_cache_evicts_least_recently_used() -> None:
+    backend = InMemoryCache(max_size=300)
+    for key in ("a", "b"):
+        backend.set(key, make_response(b"x" * 100))
+    assert backend.get("a") is not None
+
+    backend.set("c", make_response(b"x" * 100))
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+    assert backend.size <= 300
+
+    # responses that are larger than the cache are not stored
+    backend.set("d", make_response(b"x" * 1000))
+    assert backend.get("d") is None
+    assert backend.get("a") is not None
+
+
+def test_sqlite_cache(tmp_path: Path) -> None:
+    path = str(tmp_path / "cache.sqlite3")
+    backend = SQLiteCache(path, max_size=250)
+    response = make_response(b'{"id": "a"}')
+    backend.set("a", response)
+    assert backend.get("a") == response
+    backend.close()
+
+    # responses are persisted
+    backend = SQLiteCache(path, max_size=250)
+    assert backend.get("a") == response
+
+    with mock.patch("time.time", return_value=time.time() + 1):
+        backend.set("b", make_response(b"x" * 100))
+    with mock.patch("time.time", return_value=time.time() + 2):
+        backend.get("a")
+        backend.set("c", make_response(b"x" * 100))
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+
+    backend.delete("a")
+    assert backend.get("a") is None
+    backend.clear()
+    assert backend.get("c") is None
+    backend.close()
+
+
+@pytest.mark.parametrize("backend", [InMemoryCache(), None], ids=["memory", "sqlite"])
+def test_response_cache(backend: InMemoryCache | None, tmp_path: Path) -> None:
+    cache = ResponseCache(
+        ttls={"/models": 60}, backend=backend if backend is not None else SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    )
+    request = httpx.Request("GET", "https://api.openai.com/v1/models", headers={"Authorization": "Bearer a"})
+    assert cache.get(request, path="/models") is None
+
+    cache.set(
+        request,
+        httpx.Response(
+            200,
+            headers={"x-request-id": "req_123", "content-encoding": "gzip"},
+            content=gzip.compress(b'{"data": []}'),
+            request=request,
+        ),
+        path="/models",
+    )
+    response = cache.get(request, path="/models")
+    assert response is not None
+    assert response.headers["x-request-id"] == "req_123"
+    # the stored body has already been decoded
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"data": []}
+    assert response.request is request
+
+    # responses are not shared between credentials
+    other = httpx.Request("GET", "https://api.openai.com/v1/models", headers={"Authorization": "Bearer b"})
+    assert cache.get(other, path="/models") is None
+
+    no_cache = httpx.Request(
+        "GET", "https://api.openai.com/v1/models", headers={"Authorization": "Bearer a", "Cache-Control": "no-cache"}
+    )
+    assert cache.get(no_cache, path="/models") is None
+
+    with mock.patch("time.time", return_value=time.time() + 61):
+        assert cache.get(request, path="/models") is None
+    assert cache.get(request, path="/models") is None
+
+
+def test_response_cache_only_stores_successful_responses() -> None:
+    cache = ResponseCache(ttls={"/models/": 60})
+    request = httpx.Request("GET", "https://api.openai.com/v1/models/gpt-4o")
+    cache.set(request, httpx.Response(404, json={}, request=request), path="/models/gpt-4o")
+    assert cache.get(request, path="/models/gpt-4o") is None
+
+    post = httpx.Request("POST", "https://api.openai.com/v1/models/gpt-4o")
+    cache.set(post, httpx.Response(200, json={}, request=post), path="/models/gpt-4o")
+    assert cache.get(post, path="/models/gpt-4o") is None
+
+
+def test_response_cache_mutable_objects() -> None:
+    cache = ResponseCache(ttls={"/files/": 60})
+    request = httpx.Request("GET", "https://api.openai.com/v1/files/file-abc")
+
+    # objects that are still being processed change with every request
+    cache.set(request, httpx.Response(200, json={"status": "uploaded"}, request=request), path="/files/file-abc")
+    assert cache.get(request, path="/files/file-abc") is None
+
+    cache.set(request, httpx.Response(200, json={"status": "processed"}, request=request), path="/files/file-abc")
+    assert cache.get(request, path="/files/file-abc") is not None
+
+    # the requests of the polling helpers skip the cache
+    poll = httpx.Request("GET", "https://api.openai.com/v1/files/file-abc", headers={"X-Stainless-Poll-Helper": "true"})
+    assert cache.get(poll, path="/files/file-abc") is None
+
+    # deleting the object removes it from the cache
+    delete = httpx.Request("DELETE", "https://api.openai.com/v1/files/file-abc")
+    cache.set(delete, httpx.Response(200, json={"deleted": True}, request=delete), path="/files/file-abc")
+    assert cache.get(request, path="/files/file-abc") is None
+
+    # only the `/models` endpoints are cached by default
+    assert ResponseCache().ttl("/files/file-abc") is None
+    assert ResponseCache().ttl("/models/gpt-4o") is not None
+
+
+def test_completion_cache_key_is_canonical() -> None:
+    cache = CompletionCache()
+
+    def lookup(body: object) -> httpx.Request:
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        options = FinalRequestOptions.construct(method="post", url="/chat/completions", json_data=body)
+        assert cache.get(request, options, stream=False) is None
+        return request
+
+    def store(request: httpx.Request, content: bytes) -> None:
+        cache.set(request, httpx.Response(200, content=content, request=request), stream=False)
+
+    store(lookup({"model": "gpt-4o", "temperature": 1, "messages": [{"role": "user", "content": "hi"}]}), b"1")
+
+    # the order of the arguments and the type of whole numbers don't matter
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    options = FinalRequestOptions.construct(
+        method="post",
+        url="/chat/completions",
+        json_data={"messages": [{"content": "hi", "role": "user"}], "temperature": 1.0, "model": "gpt-4o"},
+    )
+    response = cache.get(request, options, stream=False)
+    assert response is not None
+    assert response.content == b"1"
+
+    # every other difference does
+    store(lookup({"model": "gpt-4o", "temperature": 0.5, "messages": [{"role": "user", "content": "hi"}]}), b"2")
+    store(
+        lookup({"model": "gpt-4o", "temperature": 1, "messages": [{"role": "user", "content": "hi"}], "seed": 1}), b"3"
+    )
+
+
+@pytest.mark.parametrize("share_across_credentials", [False, True])
+def test_completion_cache_credentials(share_across_credentials: bool) -> None:
+    cache = CompletionCache(share_across_credentials=share_across_credentials)
+    options = FinalRequestOptions.construct(method="post", url="/chat/completions", json_data={"model": "gpt-4o"})
+
+    def request(api_key: str) -> httpx.Request:
+        return httpx.Request(
+            "POST", "https://api.openai.com/v1/chat/completions", headers={"Authorization": f"Bearer {api_key}"}
+        )
+
+    first = request("sk-1")
+    assert cache.get(first, options, stream=False) is None
+    cache.set(first, httpx.Response(200, content=b"1", request=first), stream=False)
+
+    assert cache.get(request("sk-1"), options, stream=False) is not None
+    # responses are only shared between API keys when that's asked for
+    assert (cache.get(request("sk-2"), options, stream=False) is not None) is share_across_credentials
+
+
+def test_completion_cache_keeps_responses_forever(tmp_path: Path) -> None:
+    cache = CompletionCache(backend=SQLiteCache(str(tmp_path / "cache.sqlite3")))
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    options = FinalRequestOptions.construct(method="post", url="/embeddings", json_data={"input": "hi"})
+    assert cache.get(request, options, stream=False) is None
+    cache.set(request, httpx.Response(200, json={"data": []}, request=request), stream=False)
+
+    with mock.patch("time.time", return_value=time.time() + 365 * 24 * 3600):
+        response = cache.get(request, options, stream=False)
+    assert response is not None
+    assert response.json() == {"data": []}
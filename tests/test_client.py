@@ -7,8 +7,11 @@ import os
 import sys
 import json
 import time
+import array
+import base64
 import asyncio
 import inspect
+import threading
 import subprocess
 import tracemalloc
 from typing import Any, Union, cast
@@ -21,19 +24,44 @@ import pytest
 from respx import MockRouter
 from pydantic import ValidationError
 
-from openai import OpenAI, AsyncOpenAI, APIResponseValidationError
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    RateLimiter,
+    RetryBudget,
+    RetryPolicy,
+    HedgingPolicy,
+    ResponseCache,
+    CircuitBreaker,
+    CompletionCache,
+    KeepalivePolicy,
+    RetryBudgetStatus,
+    TransportRegistry,
+    APIConnectionError,
+    ConnectionPoolStatus,
+    CircuitBreakerOpenError,
+    APIResponseValidationError,
+    _connections,
+)
+from openai.types import Model
 from openai._types import Omit
-from openai._models import BaseModel, FinalRequestOptions
+from openai._models import RawDict, BaseModel, FinalRequestOptions
+from openai._constants import RESPONSE_MODE_HEADER
 from openai._streaming import Stream, AsyncStream
+from openai.types.chat import ParsedChatCompletion
+from openai._coalescing import coalescing_key
 from openai._exceptions import OpenAIError, APIStatusError, APITimeoutError, APIResponseValidationError
 from openai._base_client import (
     DEFAULT_TIMEOUT,
     HTTPX_DEFAULT_TIMEOUT,
     BaseClient,
     DefaultHttpxClient,
+    SyncHttpxClientWrapper,
+    AsyncHttpxClientWrapper,
     DefaultAsyncHttpxClient,
     make_request_options,
 )
+from openai._connections import SharedTransport, AsyncSharedTransport
 
 from .utils import update_env
 
@@ -51,6 +79,26 @@ def _low_retry_timeout(*_args: Any, **_kwargs: Any) -> float:
     return 0.1
 
 
+class _RecordingJSONBackend:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def loads(self, obj: str | bytes) -> Any:
+        self.calls.append("loads")
+        return json.loads(obj)
+
+    def dumps(self, obj: Any) -> bytes:
+        self.calls.append("dumps")
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _uses_http2(client: OpenAI | AsyncOpenAI) -> bool:
+    transport = client._client._transport
+    assert isinstance(transport, httpx.HTTPTransport) or isinstance(transport, httpx.AsyncHTTPTransport)
+
+    return transport._pool._http2
+
+
 def _get_open_connections(client: OpenAI | AsyncOpenAI) -> int:
     transport = client._client._transport
     assert isinstance(transport, httpx.HTTPTransport) or isinstance(transport, httpx.AsyncHTTPTransport)
@@ -674,6 +722,524 @@ class TestOpenAI:
         assert isinstance(stream, Stream)
         stream.response.close()
 
+    @pytest.mark.respx(base_url=base_url)
+    def test_json_backend(self, respx_mock: MockRouter) -> None:
+        class Model(BaseModel):
+            foo: str
+
+        backend = _RecordingJSONBackend()
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, json_backend=backend)
+        assert client.copy()._json_backend is backend
+
+        route = respx_mock.post("/foo").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+        response = client.post("/foo", cast_to=Model, body={"a": 1, "b": [True, None]})
+        assert response.foo == "bar"
+        assert route.calls.last.request.content == b'{"a":1,"b":[true,null]}'
+        assert route.calls.last.request.headers["Content-Type"] == "application/json"
+        assert backend.calls == ["dumps", "loads"]
+
+        backend.calls.clear()
+        respx_mock.post("/stream").mock(
+            return_value=httpx.Response(200, content=b'data: {"foo": "a"}\n\ndata: {"foo": "b"}\n\ndata: [DONE]\n\n')
+        )
+        stream = client.post("/stream", cast_to=Model, body={}, stream=True, stream_cls=Stream[Model])
+        assert [chunk.foo for chunk in stream] == ["a", "b"]
+        assert backend.calls == ["dumps", "loads", "loads"]
+
+    def test_json_backend_multipart(self) -> None:
+        backend = _RecordingJSONBackend()
+        client = OpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, json_backend=backend)
+
+        request = client._build_request(
+            FinalRequestOptions.construct(
+                method="post",
+                url="/foo",
+                headers={"Content-Type": "multipart/form-data; boundary=6b7ba517decee4a450543ea6ae821c82"},
+                json_data={"purpose": "assistants"},
+                files=[("file", b"hello")],
+            )
+        )
+        assert b'name="purpose"' in request.read()
+        assert backend.calls == []
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_completion_cache(self, respx_mock: MockRouter) -> None:
+        cache = CompletionCache()
+        client = self.client.with_options(completion_cache=cache)
+        assert client.copy()._completion_cache is cache
+
+        route = respx_mock.post("/embeddings").mock(
+            return_value=httpx.Response(200, json={"object": "list", "data": [{"embedding": [1.0], "index": 0}]})
+        )
+        for _ in range(2):
+            response = client.embeddings.create(input="hello", model="text-embedding-3-small")
+            assert response.data[0].embedding == [1.0]
+        assert route.call_count == 1
+
+        client.embeddings.create(input="goodbye", model="text-embedding-3-small")
+        assert route.call_count == 2
+
+        chunks = [
+            {
+                "id": "1",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": {"content": text}}],
+            }
+            for text in ("Hello", " world")
+        ]
+        body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+        chat = respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body.encode())
+        )
+
+        # streams are only cached once they have been read to completion
+        stream = client.chat.completions.create(messages=[], model="gpt-4o", stream=True)
+        next(iter(stream))
+        stream.close()
+
+        for _ in range(2):
+            stream = client.chat.completions.create(messages=[], model="gpt-4o", stream=True)
+            assert [chunk.choices[0].delta.content for chunk in stream] == ["Hello", " world"]
+        assert chat.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_response_cache(self, respx_mock: MockRouter) -> None:
+        cache = ResponseCache()
+        client = self.client.with_options(response_cache=cache)
+        assert client.copy()._response_cache is cache
+
+        route = respx_mock.get("/models/gpt-4o").mock(
+            return_value=httpx.Response(
+                200,
+                headers={"x-request-id": "req_123"},
+                json={"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"},
+            )
+        )
+
+        model = client.models.retrieve("gpt-4o")
+        assert model.id == "gpt-4o"
+        assert model._request_id == "req_123"
+
+        # cached responses are returned as if they were sent by the API
+        response = client.models.with_raw_response.retrieve("gpt-4o")
+        assert response.headers["x-request-id"] == "req_123"
+        assert response.request_id == "req_123"
+        assert response.parse().id == "gpt-4o"
+        assert route.call_count == 1
+
+        client.models.retrieve("gpt-4o", extra_headers={"Cache-Control": "no-cache"})
+        assert route.call_count == 2
+
+        # other endpoints aren't cached
+        chat = respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json={}))
+        client.chat.completions.create(messages=[], model="gpt-4o")
+        client.chat.completions.create(messages=[], model="gpt-4o")
+        assert chat.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_coalesce_requests(self, respx_mock: MockRouter) -> None:
+        client = self.client.with_options(coalesce_requests=True)
+        assert client.copy()._single_flight is client._single_flight
+        assert client.copy(coalesce_requests=False)._single_flight is None
+        assert client.copy(coalesce_requests=True)._single_flight not in (None, client._single_flight)
+
+        # copies with other credentials don't share requests
+        options = FinalRequestOptions.construct(method="get", url="/models/gpt-4o")
+        keys = {
+            coalescing_key(
+                Model, options, stream=False, base_url=str(derived.base_url), default_headers=derived.default_headers
+            )
+            for derived in (client, client.copy(), client.copy(api_key="other"))
+        }
+        assert len(keys) == 2
+
+        started = threading.Event()
+        release = threading.Event()
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            started.set()
+            release.wait(5)
+            return httpx.Response(200, json={"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"})
+
+        respx_mock.get("/models/gpt-4o").mock(side_effect=handler)
+
+        results: list[object] = []
+
+        def retrieve() -> None:
+            results.append(client.models.retrieve("gpt-4o"))
+
+        threads = [threading.Thread(target=retrieve) for _ in range(5)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # give the other threads time to join the in-flight request
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(requests) == 1
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+
+        # requests are only shared while they are in flight, and raw responses are never shared
+        client.models.retrieve("gpt-4o")
+        client.models.with_raw_response.retrieve("gpt-4o")
+        assert len(requests) == 3
+
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_stream_request_body(self, respx_mock: MockRouter) -> None:
+        class Model(BaseModel):
+            foo: str
+
+        client = OpenAI(base_url=base_url, api_key=api_key, stream_request_body=True)
+        assert client.copy()._stream_request_body is True
+        assert client.copy(stream_request_body=False)._stream_request_body is False
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(500 if len(requests) == 1 else 200, json={"foo": "bar"})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+        body = {"content": "a" * 100_000, "b": [True, None]}
+        response = client.post("/foo", cast_to=Model, body=body)
+        assert response.foo == "bar"
+
+        # the retry sends the same body again
+        assert len(requests) == 2
+        for request in requests:
+            assert request.read() == json.dumps(body, separators=(",", ":")).encode()
+            assert request.headers["Transfer-Encoding"] == "chunked"
+            assert request.headers["Content-Type"] == "application/json"
+            assert "Content-Length" not in request.headers
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_response_mode_raw(self, respx_mock: MockRouter) -> None:
+        client = self.client.with_options(response_mode="raw")
+        assert client.copy()._response_mode == "raw"
+
+        completion: dict[str, Any] = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "choices": [],
+            "created": 0,
+            "model": "gpt-4o",
+        }
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, json=completion, headers={"x-request-id": "req_123"})
+        )
+        response = client.chat.completions.create(messages=[], model="gpt-4o")
+        assert type(response) is RawDict
+        assert response == completion
+        assert response._request_id == "req_123"
+
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, content=b'data: {"id": "a"}\n\ndata: {"id": "b"}\n\ndata: [DONE]\n\n')
+        )
+        stream = client.chat.completions.create(messages=[], model="gpt-4o", stream=True)
+        assert list(stream) == [{"id": "a"}, {"id": "b"}]
+
+        embedding = base64.b64encode(array.array("f", [1.0, 2.0]).tobytes()).decode()
+        respx_mock.post("/embeddings").mock(
+            return_value=httpx.Response(200, json={"object": "list", "data": [{"embedding": embedding, "index": 0}]})
+        )
+        embeddings = client.embeddings.create(input="hello", model="text-embedding-3-small")
+        assert cast(Any, embeddings)["data"][0]["embedding"] == [1.0, 2.0]
+
+        # pages are still constructed so that pagination works
+        respx_mock.get("/models").mock(
+            return_value=httpx.Response(200, json={"object": "list", "data": [{"id": "gpt-4o", "object": "model"}]})
+        )
+        page = client.models.list()
+        assert [model.id for model in page] == ["gpt-4o"]
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_response_mode_raw_helpers(self, respx_mock: MockRouter) -> None:
+        client = self.client.with_options(response_mode="raw")
+
+        completion: dict[str, Any] = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "logprobs": None,
+                    "message": {"role": "assistant", "content": "hello"},
+                }
+            ],
+            "created": 0,
+            "model": "gpt-4o",
+        }
+        respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json=completion))
+        parsed = client.chat.completions.parse(messages=[], model="gpt-4o")
+        assert isinstance(parsed, ParsedChatCompletion)
+        assert parsed.choices[0].message.content == "hello"
+        assert RESPONSE_MODE_HEADER not in respx_mock.calls.last.request.headers
+
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}],
+        }
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, content=b"data: " + json.dumps(chunk).encode() + b"\n\ndata: [DONE]\n\n")
+        )
+        with client.chat.completions.stream(messages=[], model="gpt-4o") as stream:
+            events = [event.type for event in stream]
+            final = stream.get_final_completion()
+        assert events == ["chunk", "content.delta", "content.done"]
+        assert final.choices[0].message.content == "hello"
+        assert RESPONSE_MODE_HEADER not in respx_mock.calls.last.request.headers
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_rate_limiter(self, respx_mock: MockRouter) -> None:
+        limiter = RateLimiter()
+        client = self.client.with_options(rate_limiter=limiter)
+        assert client.copy()._rate_limiter is limiter
+
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(
+                200,
+                json={},
+                headers={
+                    "x-ratelimit-limit-requests": "10",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1m0s",
+                    "x-ratelimit-limit-tokens": "1000",
+                    "x-ratelimit-remaining-tokens": "900",
+                    "x-ratelimit-reset-tokens": "6m0s",
+                },
+            )
+        )
+
+        with mock.patch("time.sleep") as sleep:
+            # no budget is known until the first response
+            client.chat.completions.create(messages=[], model="gpt-4o")
+            assert sleep.call_count == 0
+
+            (status,) = limiter.status()
+            assert status.endpoint == "/chat/completions"
+            assert status.model == "gpt-4o"
+            assert status.remaining_requests is not None and round(status.remaining_requests) == 0
+            assert status.remaining_tokens is not None and round(status.remaining_tokens) == 900
+            assert status.queued == 0
+
+            # the request budget is refilled at 10 requests per minute
+            client.chat.completions.create(messages=[], model="gpt-4o")
+            assert sleep.call_count == 1
+            assert round(sleep.call_args[0][0]) == 6
+
+        # other models are tracked separately
+        client.chat.completions.create(messages=[], model="gpt-4o-mini")
+        assert [status.model for status in limiter.status()] == ["gpt-4o", "gpt-4o-mini"]
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_retry_policy(self, respx_mock: MockRouter) -> None:
+        policy = RetryPolicy(initial_delay=0.001, max_delay=0.01, max_retries_by_status={500: 1, 409: 0})
+        client = self.client.with_options(retry_policy=policy, max_retries=3)
+        assert client.copy()._retry_policy is policy
+
+        route = respx_mock.get("/models").mock(return_value=httpx.Response(500))
+        with pytest.raises(APIStatusError):
+            client.models.list()
+        assert route.call_count == 1 + 1
+
+        route.mock(return_value=httpx.Response(409))
+        with pytest.raises(APIStatusError):
+            client.models.list()
+        assert route.call_count == 2 + 1
+
+        # other status codes are still retried `max_retries` times
+        route.mock(return_value=httpx.Response(503))
+        with pytest.raises(APIStatusError):
+            client.models.list()
+        assert route.call_count == 3 + 4
+
+        # retries stop once `max_elapsed` has passed
+        client = client.with_options(retry_policy=RetryPolicy(max_elapsed=0))
+        with pytest.raises(APIStatusError):
+            client.models.list()
+        assert route.call_count == 7 + 1
+
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_retry_budget(self, respx_mock: MockRouter) -> None:
+        budget = RetryBudget(ratio=0.5, burst=2)
+        client = self.client.with_options(retry_budget=budget, max_retries=3)
+        assert client.copy()._retry_budget is budget
+
+        route = respx_mock.get("/models").mock(return_value=httpx.Response(500))
+
+        # the initial allowance is used up by the first request
+        with pytest.raises(APIStatusError):
+            client.models.list()
+        assert route.call_count == 3
+        assert budget.status() == RetryBudgetStatus(available=0, retried=2, denied=1)
+
+        with pytest.raises(APIStatusError):
+            client.models.list()
+        assert route.call_count == 4
+
+        # every successful request allows half a retry
+        route.mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+        client.models.list()
+        client.models.list()
+        assert budget.status().available == 1
+
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_circuit_breaker(self, respx_mock: MockRouter) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+        client = self.client.with_options(circuit_breaker=breaker, max_retries=5)
+        assert client.copy()._circuit_breaker is breaker
+
+        route = respx_mock.get("/models").mock(side_effect=httpx.ConnectError("oops"))
+
+        # the circuit is opened after two failures, which also stops retrying
+        with pytest.raises(CircuitBreakerOpenError):
+            client.models.list()
+        assert route.call_count == 2
+
+        with pytest.raises(CircuitBreakerOpenError):
+            client.models.list()
+        assert route.call_count == 2
+
+        (status,) = breaker.status()
+        assert status.path == "/models"
+        assert status.state == "open"
+        assert status.consecutive_failures == 2
+        assert status.rejected == 2
+
+        # other endpoints are not affected
+        respx_mock.get("/files").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+        client.files.list()
+
+        # after `recovery_time` a trial request is let through and closes the circuit again
+        route.mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 60):
+            client.models.list()
+        assert breaker.status()[0].state == "closed"
+
+    @pytest.mark.skipif(not _connections.h2_available(), reason="requires the `h2` package")
+    def test_http2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OpenAI(base_url=base_url, api_key=api_key, http2=True)
+        assert _uses_http2(client)
+        assert client.copy()._http2 is True
+        assert not _uses_http2(client.copy(http_client=DefaultHttpxClient()))
+
+        assert not _uses_http2(OpenAI(base_url=base_url, api_key=api_key))
+
+        monkeypatch.setattr(_connections, "h2_available", lambda: False)
+        assert not _uses_http2(OpenAI(base_url=base_url, api_key=api_key, http2="auto"))
+        monkeypatch.setattr(_connections, "h2_available", lambda: True)
+        assert _uses_http2(OpenAI(base_url=base_url, api_key=api_key, http2="auto"))
+
+    def test_connection_pool_status(self) -> None:
+        client = OpenAI(base_url=base_url, api_key=api_key)
+        assert client.connection_pool_status() == ConnectionPoolStatus(
+            connections=0, http2_connections=0, idle_connections=0, active_streams=0, queued_requests=0
+        )
+
+        # the pool of a custom transport can't be inspected
+        http_client = httpx.Client(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+        assert client.copy(http_client=http_client).connection_pool_status() is None
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_warmup(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.head("/").mock(return_value=httpx.Response(404))
+
+        self.client.warmup(n_connections=3)
+        assert route.call_count == 3
+
+        with pytest.raises(ValueError, match="n_connections"):
+            self.client.warmup(n_connections=0)
+        # a keepalive policy without connections has nothing to open
+        OpenAI(base_url=base_url, api_key=api_key, keepalive=KeepalivePolicy(connections=0)).warmup()
+        assert route.call_count == 3
+
+        route.mock(side_effect=httpx.ConnectError("oops"))
+        with pytest.raises(APIConnectionError):
+            self.client.warmup()
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_keepalive(self, respx_mock: MockRouter) -> None:
+        keepalive = KeepalivePolicy(connections=2, interval=0.01, idle_timeout=0.5)
+        client = OpenAI(base_url=base_url, api_key=api_key, keepalive=keepalive)
+        assert client.copy()._keepalive is keepalive
+        assert isinstance(client._client, SyncHttpxClientWrapper)
+
+        pings = respx_mock.head("/").mock(return_value=httpx.Response(404))
+        respx_mock.get("/models").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+
+        # connections are only pinged once the client is used
+        time.sleep(0.05)
+        assert pings.call_count == 0
+
+        client.models.list()
+        pinger = client._client._pinger
+        assert pinger is not None
+
+        # pinging stops once no request has been made for `idle_timeout` seconds
+        pinger.join(timeout=5)
+        assert not pinger.is_alive()
+        assert pings.call_count >= 4
+
+        client.close()
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_transport_registry(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/models").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+
+        registry = TransportRegistry()
+        first = OpenAI(base_url=base_url, api_key="first", transport_registry=registry)
+        second = OpenAI(base_url=base_url, api_key="second", transport_registry=registry)
+        derived = first.with_options(default_headers={"X-Tenant": "a"})
+        assert derived._transport_registry is registry
+        assert derived._client is not first._client
+
+        (transport,) = {
+            cast(SharedTransport, client._client._transport).transport for client in (first, second, derived)
+        }
+
+        # requests are counted per client
+        with first.with_streaming_response.models.list():
+            assert first.in_flight_requests() == 1
+            assert second.in_flight_requests() == 0
+            assert derived.in_flight_requests() == 0
+        assert first.in_flight_requests() == 0
+
+        derived.models.list()
+        assert derived.in_flight_requests() == 0
+
+        (status,) = registry.status()
+        assert status.origin == base_url
+        assert not status.asynchronous
+
+        # closing a client doesn't close the shared pool
+        first.close()
+        second.models.list()
+
+        registry.close()
+        assert registry.status() == []
+        assert transport._pool.connections == []
+
+        # the registry isn't used by clients with a custom http client
+        http_client = httpx.Client()
+        client = OpenAI(base_url=base_url, api_key=api_key, http_client=http_client, transport_registry=registry)
+        assert client.in_flight_requests() is None
+        assert client.copy()._client is http_client
+
     @pytest.mark.respx(base_url=base_url)
     def test_received_text_for_expected_json(self, respx_mock: MockRouter) -> None:
         class Model(BaseModel):
@@ -795,6 +1361,52 @@ class TestOpenAI:
         assert response.retries_taken == failures_before_success
         assert int(response.http_request.headers.get("x-stainless-retry-count")) == failures_before_success
 
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    def test_retries_reuse_encoded_body(self, respx_mock: MockRouter) -> None:
+        backend = _RecordingJSONBackend()
+        client = OpenAI(base_url=base_url, api_key=api_key, max_retries=2, json_backend=backend)
+
+        attempts = 0
+        prepare_options = client._prepare_options
+
+        def prepare_attempt(options: FinalRequestOptions) -> FinalRequestOptions:
+            nonlocal attempts
+            attempts += 1
+            options = prepare_options(options)
+            # e.g. a credential that is refreshed between attempts
+            options.headers = {**(options.headers or {}), f"x-attempt-{attempts}": "true"}
+            return options
+
+        client._prepare_options = prepare_attempt  # type: ignore[method-assign]
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) < 3:
+                return httpx.Response(500)
+            return httpx.Response(
+                200, json={"object": "list", "data": [{"object": "embedding", "embedding": [1.0], "index": 0}]}
+            )
+
+        respx_mock.post("/embeddings").mock(side_effect=handler)
+
+        client.embeddings.create(input="hello", model="text-embedding-3-small")
+
+        # the body is only encoded for the first attempt
+        assert backend.calls.count("dumps") == 1
+        assert len({request.content for request in requests}) == 1
+        assert [request.headers["x-stainless-retry-count"] for request in requests] == ["0", "1", "2"]
+        # the headers of previous attempts aren't sent again
+        assert [[key for key in request.headers if key.startswith("x-attempt-")] for request in requests] == [
+            ["x-attempt-1"],
+            ["x-attempt-2"],
+            ["x-attempt-3"],
+        ]
+        assert all(request.headers["content-type"] == "application/json" for request in requests)
+        assert all(request.headers["content-length"] == str(len(requests[0].content)) for request in requests)
+
     @pytest.mark.parametrize("failures_before_success", [0, 2, 4])
     @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url)
@@ -1572,6 +2184,517 @@ class TestAsyncOpenAI:
         assert isinstance(stream, AsyncStream)
         await stream.response.aclose()
 
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_json_backend(self, respx_mock: MockRouter) -> None:
+        class Model(BaseModel):
+            foo: str
+
+        backend = _RecordingJSONBackend()
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, _strict_response_validation=True, json_backend=backend)
+        assert client.copy()._json_backend is backend
+
+        route = respx_mock.post("/foo").mock(return_value=httpx.Response(200, json={"foo": "bar"}))
+        response = await client.post("/foo", cast_to=Model, body={"a": 1, "b": [True, None]})
+        assert response.foo == "bar"
+        assert route.calls.last.request.content == b'{"a":1,"b":[true,null]}'
+        assert route.calls.last.request.headers["Content-Type"] == "application/json"
+        assert backend.calls == ["dumps", "loads"]
+
+        backend.calls.clear()
+        respx_mock.post("/stream").mock(
+            return_value=httpx.Response(200, content=b'data: {"foo": "a"}\n\ndata: {"foo": "b"}\n\ndata: [DONE]\n\n')
+        )
+        stream = await client.post("/stream", cast_to=Model, body={}, stream=True, stream_cls=AsyncStream[Model])
+        assert [chunk.foo async for chunk in stream] == ["a", "b"]
+        assert backend.calls == ["dumps", "loads", "loads"]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_completion_cache(self, respx_mock: MockRouter) -> None:
+        cache = CompletionCache()
+        client = self.client.with_options(completion_cache=cache)
+        assert client.copy()._completion_cache is cache
+
+        route = respx_mock.post("/embeddings").mock(
+            return_value=httpx.Response(200, json={"object": "list", "data": [{"embedding": [1.0], "index": 0}]})
+        )
+        for _ in range(2):
+            response = await client.embeddings.create(input="hello", model="text-embedding-3-small")
+            assert response.data[0].embedding == [1.0]
+        assert route.call_count == 1
+
+        await client.embeddings.create(input="goodbye", model="text-embedding-3-small")
+        assert route.call_count == 2
+
+        chunks = [
+            {
+                "id": "1",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": {"content": text}}],
+            }
+            for text in ("Hello", " world")
+        ]
+        body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+        chat = respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body.encode())
+        )
+
+        # streams are only cached once they have been read to completion
+        stream = await client.chat.completions.create(messages=[], model="gpt-4o", stream=True)
+        await stream.__anext__()
+        await stream.close()
+
+        for _ in range(2):
+            stream = await client.chat.completions.create(messages=[], model="gpt-4o", stream=True)
+            assert [chunk.choices[0].delta.content async for chunk in stream] == ["Hello", " world"]
+        assert chat.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_response_cache(self, respx_mock: MockRouter) -> None:
+        cache = ResponseCache()
+        client = self.client.with_options(response_cache=cache)
+        assert client.copy()._response_cache is cache
+
+        route = respx_mock.get("/models/gpt-4o").mock(
+            return_value=httpx.Response(
+                200,
+                headers={"x-request-id": "req_123"},
+                json={"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"},
+            )
+        )
+
+        model = await client.models.retrieve("gpt-4o")
+        assert model.id == "gpt-4o"
+        assert model._request_id == "req_123"
+
+        # cached responses are returned as if they were sent by the API
+        response = await client.models.with_raw_response.retrieve("gpt-4o")
+        assert response.headers["x-request-id"] == "req_123"
+        assert response.request_id == "req_123"
+        assert response.parse().id == "gpt-4o"
+        assert route.call_count == 1
+
+        await client.models.retrieve("gpt-4o", extra_headers={"Cache-Control": "no-cache"})
+        assert route.call_count == 2
+
+        # other endpoints aren't cached
+        chat = respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json={}))
+        await client.chat.completions.create(messages=[], model="gpt-4o")
+        await client.chat.completions.create(messages=[], model="gpt-4o")
+        assert chat.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_coalesce_requests(self, respx_mock: MockRouter) -> None:
+        client = self.client.with_options(coalesce_requests=True)
+        assert client.copy()._single_flight is client._single_flight
+        assert client.copy(coalesce_requests=False)._single_flight is None
+        assert client.copy(coalesce_requests=True)._single_flight not in (None, client._single_flight)
+
+        # copies with other credentials don't share requests
+        options = FinalRequestOptions.construct(method="get", url="/models/gpt-4o")
+        keys = {
+            coalescing_key(
+                Model, options, stream=False, base_url=str(derived.base_url), default_headers=derived.default_headers
+            )
+            for derived in (client, client.copy(), client.copy(api_key="other"))
+        }
+        assert len(keys) == 2
+
+        requests: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json={"id": "gpt-4o", "object": "model", "created": 0, "owned_by": "openai"})
+
+        respx_mock.get("/models/gpt-4o").mock(side_effect=handler)
+
+        results = await asyncio.gather(*[client.models.retrieve("gpt-4o") for _ in range(5)])
+        assert len(requests) == 1
+        assert all(result is results[0] for result in results)
+
+        # cancelling the request that the others are waiting for makes one of them send it again
+        tasks = [asyncio.create_task(client.models.retrieve("gpt-4o")) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        tasks[0].cancel()
+        results = await asyncio.gather(*tasks[1:])
+        assert len(requests) == 3
+        assert results[0] is results[1]
+
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    async def test_stream_request_body(self, respx_mock: MockRouter) -> None:
+        class Model(BaseModel):
+            foo: str
+
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, stream_request_body=True)
+        assert client.copy()._stream_request_body is True
+        assert client.copy(stream_request_body=False)._stream_request_body is False
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(500 if len(requests) == 1 else 200, json={"foo": "bar"})
+
+        respx_mock.post("/foo").mock(side_effect=handler)
+        body = {"content": "a" * 100_000, "b": [True, None]}
+        response = await client.post("/foo", cast_to=Model, body=body)
+        assert response.foo == "bar"
+
+        # the retry sends the same body again
+        assert len(requests) == 2
+        for request in requests:
+            assert request.read() == json.dumps(body, separators=(",", ":")).encode()
+            assert request.headers["Transfer-Encoding"] == "chunked"
+            assert request.headers["Content-Type"] == "application/json"
+            assert "Content-Length" not in request.headers
+
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_response_mode_raw(self, respx_mock: MockRouter) -> None:
+        client = self.client.with_options(response_mode="raw")
+        assert client.copy()._response_mode == "raw"
+
+        completion: dict[str, Any] = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "choices": [],
+            "created": 0,
+            "model": "gpt-4o",
+        }
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, json=completion, headers={"x-request-id": "req_123"})
+        )
+        response = await client.chat.completions.create(messages=[], model="gpt-4o")
+        assert type(response) is RawDict
+        assert response == completion
+        assert response._request_id == "req_123"
+
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, content=b'data: {"id": "a"}\n\ndata: {"id": "b"}\n\ndata: [DONE]\n\n')
+        )
+        stream = await client.chat.completions.create(messages=[], model="gpt-4o", stream=True)
+        assert [chunk async for chunk in stream] == [{"id": "a"}, {"id": "b"}]
+
+        embedding = base64.b64encode(array.array("f", [1.0, 2.0]).tobytes()).decode()
+        respx_mock.post("/embeddings").mock(
+            return_value=httpx.Response(200, json={"object": "list", "data": [{"embedding": embedding, "index": 0}]})
+        )
+        embeddings = await client.embeddings.create(input="hello", model="text-embedding-3-small")
+        assert cast(Any, embeddings)["data"][0]["embedding"] == [1.0, 2.0]
+
+        # pages are still constructed so that pagination works
+        respx_mock.get("/models").mock(
+            return_value=httpx.Response(200, json={"object": "list", "data": [{"id": "gpt-4o", "object": "model"}]})
+        )
+        page = client.models.list()
+        assert [model.id async for model in page] == ["gpt-4o"]
+
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_response_mode_raw_helpers(self, respx_mock: MockRouter) -> None:
+        client = self.client.with_options(response_mode="raw")
+
+        completion: dict[str, Any] = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "logprobs": None,
+                    "message": {"role": "assistant", "content": "hello"},
+                }
+            ],
+            "created": 0,
+            "model": "gpt-4o",
+        }
+        respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json=completion))
+        parsed = await client.chat.completions.parse(messages=[], model="gpt-4o")
+        assert isinstance(parsed, ParsedChatCompletion)
+        assert parsed.choices[0].message.content == "hello"
+        assert RESPONSE_MODE_HEADER not in respx_mock.calls.last.request.headers
+
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}],
+        }
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(200, content=b"data: " + json.dumps(chunk).encode() + b"\n\ndata: [DONE]\n\n")
+        )
+        async with client.chat.completions.stream(messages=[], model="gpt-4o") as stream:
+            events = [event.type async for event in stream]
+            final = await stream.get_final_completion()
+        assert events == ["chunk", "content.delta", "content.done"]
+        assert final.choices[0].message.content == "hello"
+        assert RESPONSE_MODE_HEADER not in respx_mock.calls.last.request.headers
+
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_rate_limiter(self, respx_mock: MockRouter) -> None:
+        limiter = RateLimiter()
+        client = self.client.with_options(rate_limiter=limiter)
+        assert client.copy()._rate_limiter is limiter
+
+        respx_mock.post("/chat/completions").mock(
+            return_value=httpx.Response(
+                200,
+                json={},
+                headers={
+                    "x-ratelimit-limit-requests": "10",
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": "1m0s",
+                    "x-ratelimit-limit-tokens": "1000",
+                    "x-ratelimit-remaining-tokens": "900",
+                    "x-ratelimit-reset-tokens": "6m0s",
+                },
+            )
+        )
+
+        with mock.patch("anyio.sleep") as sleep:
+            # no budget is known until the first response
+            await client.chat.completions.create(messages=[], model="gpt-4o")
+            assert sleep.call_count == 0
+
+            (status,) = limiter.status()
+            assert status.endpoint == "/chat/completions"
+            assert status.model == "gpt-4o"
+            assert status.remaining_requests is not None and round(status.remaining_requests) == 0
+            assert status.remaining_tokens is not None and round(status.remaining_tokens) == 900
+            assert status.queued == 0
+
+            # the request budget is refilled at 10 requests per minute
+            await client.chat.completions.create(messages=[], model="gpt-4o")
+            assert sleep.call_count == 1
+            assert round(sleep.call_args[0][0]) == 6
+
+        # other models are tracked separately
+        await client.chat.completions.create(messages=[], model="gpt-4o-mini")
+        assert [status.model for status in limiter.status()] == ["gpt-4o", "gpt-4o-mini"]
+
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_retry_policy(self, respx_mock: MockRouter) -> None:
+        policy = RetryPolicy(initial_delay=0.001, max_delay=0.01, max_retries_by_status={500: 1, 409: 0})
+        client = self.client.with_options(retry_policy=policy, max_retries=3)
+        assert client.copy()._retry_policy is policy
+
+        route = respx_mock.get("/models").mock(return_value=httpx.Response(500))
+        with pytest.raises(APIStatusError):
+            await client.models.list()
+        assert route.call_count == 1 + 1
+
+        route.mock(return_value=httpx.Response(409))
+        with pytest.raises(APIStatusError):
+            await client.models.list()
+        assert route.call_count == 2 + 1
+
+        # other status codes are still retried `max_retries` times
+        route.mock(return_value=httpx.Response(503))
+        with pytest.raises(APIStatusError):
+            await client.models.list()
+        assert route.call_count == 3 + 4
+
+        # retries stop once `max_elapsed` has passed
+        client = client.with_options(retry_policy=RetryPolicy(max_elapsed=0))
+        with pytest.raises(APIStatusError):
+            await client.models.list()
+        assert route.call_count == 7 + 1
+
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_retry_budget(self, respx_mock: MockRouter) -> None:
+        budget = RetryBudget(ratio=0.5, burst=2)
+        client = self.client.with_options(retry_budget=budget, max_retries=3)
+        assert client.copy()._retry_budget is budget
+
+        route = respx_mock.get("/models").mock(return_value=httpx.Response(500))
+
+        # the initial allowance is used up by the first request
+        with pytest.raises(APIStatusError):
+            await client.models.list()
+        assert route.call_count == 3
+        assert budget.status() == RetryBudgetStatus(available=0, retried=2, denied=1)
+
+        with pytest.raises(APIStatusError):
+            await client.models.list()
+        assert route.call_count == 4
+
+        # every successful request allows half a retry
+        route.mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+        await client.models.list()
+        await client.models.list()
+        assert budget.status().available == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_hedging(self, respx_mock: MockRouter) -> None:
+        policy = HedgingPolicy(percentile=50, min_samples=1, min_delay=0.05)
+        client = self.client.with_options(hedging=policy)
+        assert client.copy()._hedging is policy
+
+        requests: list[httpx.Request] = []
+        delays = [0.0, 10.0, 0.0]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(delays[len(requests) - 1])
+            return httpx.Response(200, json={"object": "list", "data": [{"embedding": [1.0], "index": 0}]})
+
+        respx_mock.post("/embeddings").mock(side_effect=handler)
+
+        # the first request only records its latency
+        await client.embeddings.create(input="hello", model="text-embedding-3-small")
+        assert len(requests) == 1
+
+        # the second one is slow, so an identical request is sent which responds first
+        start = time.monotonic()
+        await client.embeddings.create(input="hello", model="text-embedding-3-small")
+        assert time.monotonic() - start < 5
+        assert len(requests) == 3
+        assert requests[1].content == requests[2].content
+        assert requests[1].headers == requests[2].headers
+
+        (status,) = policy.status()
+        assert status.path == "/embeddings"
+        assert status.hedged == 1
+        assert status.hedge_wins == 1
+
+        # other endpoints are not hedged
+        respx_mock.post("/chat/completions").mock(return_value=httpx.Response(200, json={}))
+        await client.chat.completions.create(messages=[], model="gpt-4o")
+        assert [status.path for status in policy.status()] == ["/embeddings"]
+
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    @pytest.mark.asyncio
+    async def test_circuit_breaker(self, respx_mock: MockRouter) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=60)
+        client = self.client.with_options(circuit_breaker=breaker, max_retries=5)
+        assert client.copy()._circuit_breaker is breaker
+
+        route = respx_mock.get("/models").mock(side_effect=httpx.ConnectError("oops"))
+
+        # the circuit is opened after two failures, which also stops retrying
+        with pytest.raises(CircuitBreakerOpenError):
+            await client.models.list()
+        assert route.call_count == 2
+
+        with pytest.raises(CircuitBreakerOpenError):
+            await client.models.list()
+        assert route.call_count == 2
+
+        (status,) = breaker.status()
+        assert status.path == "/models"
+        assert status.state == "open"
+        assert status.consecutive_failures == 2
+        assert status.rejected == 2
+
+        # other endpoints are not affected
+        respx_mock.get("/files").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+        await client.files.list()
+
+        # after `recovery_time` a trial request is let through and closes the circuit again
+        route.mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 60):
+            await client.models.list()
+        assert breaker.status()[0].state == "closed"
+
+    @pytest.mark.skipif(not _connections.h2_available(), reason="requires the `h2` package")
+    async def test_http2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, http2=True)
+        assert _uses_http2(client)
+        assert client.copy()._http2 is True
+
+        monkeypatch.setattr(_connections, "h2_available", lambda: False)
+        assert not _uses_http2(AsyncOpenAI(base_url=base_url, api_key=api_key, http2="auto"))
+        monkeypatch.setattr(_connections, "h2_available", lambda: True)
+        assert _uses_http2(AsyncOpenAI(base_url=base_url, api_key=api_key, http2="auto"))
+
+    async def test_connection_pool_status(self) -> None:
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+        assert client.connection_pool_status() == ConnectionPoolStatus(
+            connections=0, http2_connections=0, idle_connections=0, active_streams=0, queued_requests=0
+        )
+
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+        assert client.copy(http_client=http_client).connection_pool_status() is None
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_warmup(self, respx_mock: MockRouter) -> None:
+        route = respx_mock.head("/").mock(return_value=httpx.Response(404))
+
+        await self.client.warmup(n_connections=3)
+        assert route.call_count == 3
+
+        with pytest.raises(ValueError, match="n_connections"):
+            await self.client.warmup(n_connections=0)
+        # a keepalive policy without connections has nothing to open
+        await AsyncOpenAI(base_url=base_url, api_key=api_key, keepalive=KeepalivePolicy(connections=0)).warmup()
+        assert route.call_count == 3
+
+        route.mock(side_effect=httpx.ConnectError("oops"))
+        with pytest.raises(APIConnectionError):
+            await self.client.warmup()
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_keepalive(self, respx_mock: MockRouter) -> None:
+        keepalive = KeepalivePolicy(connections=2, interval=0.01, idle_timeout=0.5)
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, keepalive=keepalive)
+        assert client.copy()._keepalive is keepalive
+        assert isinstance(client._client, AsyncHttpxClientWrapper)
+
+        pings = respx_mock.head("/").mock(return_value=httpx.Response(404))
+        respx_mock.get("/models").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+
+        await client.models.list()
+        pinger = client._client._pinger
+        assert pinger is not None
+
+        # pinging stops once no request has been made for `idle_timeout` seconds
+        await asyncio.wait_for(pinger, timeout=5)
+        assert pings.call_count >= 4
+
+        await client.close()
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_transport_registry(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/models").mock(return_value=httpx.Response(200, json={"object": "list", "data": []}))
+
+        registry = TransportRegistry()
+        first = AsyncOpenAI(base_url=base_url, api_key="first", transport_registry=registry)
+        second = AsyncOpenAI(base_url=base_url, api_key="second", transport_registry=registry)
+        derived = first.with_options(default_headers={"X-Tenant": "a"})
+        assert derived._transport_registry is registry
+
+        (transport,) = {
+            cast(AsyncSharedTransport, client._client._transport).transport for client in (first, second, derived)
+        }
+
+        async with first.with_streaming_response.models.list():
+            assert first.in_flight_requests() == 1
+            assert second.in_flight_requests() == 0
+            assert derived.in_flight_requests() == 0
+        assert first.in_flight_requests() == 0
+
+        await first.close()
+        await second.models.list()
+
+        (status,) = registry.status()
+        assert status.origin == base_url
+        assert status.asynchronous
+
+        await registry.aclose()
+        assert registry.status() == []
+        assert transport._pool.connections == []
+
     @pytest.mark.respx(base_url=base_url)
     @pytest.mark.asyncio
     async def test_received_text_for_expected_json(self, respx_mock: MockRouter) -> None:
@@ -1696,6 +2819,52 @@ class TestAsyncOpenAI:
         assert response.retries_taken == failures_before_success
         assert int(response.http_request.headers.get("x-stainless-retry-count")) == failures_before_success
 
+    @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
+    @pytest.mark.respx(base_url=base_url)
+    async def test_retries_reuse_encoded_body(self, respx_mock: MockRouter) -> None:
+        backend = _RecordingJSONBackend()
+        client = AsyncOpenAI(base_url=base_url, api_key=api_key, max_retries=2, json_backend=backend)
+
+        attempts = 0
+        prepare_options = client._prepare_options
+
+        async def prepare_attempt(options: FinalRequestOptions) -> FinalRequestOptions:
+            nonlocal attempts
+            attempts += 1
+            options = await prepare_options(options)
+            # e.g. a credential that is refreshed between attempts
+            options.headers = {**(options.headers or {}), f"x-attempt-{attempts}": "true"}
+            return options
+
+        client._prepare_options = prepare_attempt  # type: ignore[method-assign]
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) < 3:
+                return httpx.Response(500)
+            return httpx.Response(
+                200, json={"object": "list", "data": [{"object": "embedding", "embedding": [1.0], "index": 0}]}
+            )
+
+        respx_mock.post("/embeddings").mock(side_effect=handler)
+
+        await client.embeddings.create(input="hello", model="text-embedding-3-small")
+
+        # the body is only encoded for the first attempt
+        assert backend.calls.count("dumps") == 1
+        assert len({request.content for request in requests}) == 1
+        assert [request.headers["x-stainless-retry-count"] for request in requests] == ["0", "1", "2"]
+        # the headers of previous attempts aren't sent again
+        assert [[key for key in request.headers if key.startswith("x-attempt-")] for request in requests] == [
+            ["x-attempt-1"],
+            ["x-attempt-2"],
+            ["x-attempt-3"],
+        ]
+        assert all(request.headers["content-type"] == "application/json" for request in requests)
+        assert all(request.headers["content-length"] == str(len(requests[0].content)) for request in requests)
+
     @pytest.mark.parametrize("failures_before_success", [0, 2, 4])
     @mock.patch("openai._base_client.BaseClient._calculate_retry_timeout", _low_retry_timeout)
     @pytest.mark.respx(base_url=base_url)
@@ -1,15 +1,19 @@
+import gc
 import json
+import weakref
 from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional, cast
 from datetime import datetime, timezone
+from unittest import mock
 from typing_extensions import Literal, Annotated, TypeAliasType
 
 import pytest
 import pydantic
 from pydantic import Field
 
+from openai import _models
 from openai._utils import PropertyInfo
 from openai._compat import PYDANTIC_V2, parse_obj, model_dump, model_json
-from openai._models import BaseModel, construct_type
+from openai._models import BaseModel, construct_type, construct_update
 
 
 class BasicModel(BaseModel):
@@ -961,3 +965,91 @@ def test_extra_properties() -> None:
     assert model.a.prop == 1
     assert isinstance(model.a, Item)
     assert model.other == "foo"
+
+
+def test_union_variant_order() -> None:
+    class A(BaseModel):
+        a: str
+
+    class B(BaseModel):
+        b: str
+
+    # these unions compare equal but the first variant that can be constructed should still be used
+    assert Union[A, B] == Union[B, A]
+
+    m = construct_type(value={"c": "foo"}, type_=cast(Any, Union[A, B]))
+    assert isinstance(m, A)
+
+    m = construct_type(value={"c": "foo"}, type_=cast(Any, Union[B, A]))
+    assert isinstance(m, B)
+
+
+@pytest.mark.skipif(not PYDANTIC_V2, reason="TypeAliasType is not supported in Pydantic v1")
+def test_recursive_type_alias_type() -> None:
+    class Model(BaseModel):
+        created_at: datetime
+
+    Tree = TypeAliasType("Tree", Union[Model, List["Tree"]])  # pyright: ignore
+
+    class Container(BaseModel):
+        tree: Tree
+
+    m = construct_type(
+        value={"tree": [{"created_at": "2023-01-01T00:00:00Z"}, [{"created_at": "2023-01-02T00:00:00Z"}]]},
+        type_=Container,
+    )
+    assert isinstance(m, Container)
+    assert isinstance(m.tree, list)
+    assert isinstance(m.tree[0], Model)
+    assert m.tree[0].created_at == datetime(2023, 1, 1, tzinfo=timezone.utc)
+    assert isinstance(m.tree[1], list)
+    assert isinstance(m.tree[1][0], Model)
+
+
+def test_construct_update() -> None:
+    class Child(BaseModel):
+        name: str
+
+    class Model(BaseModel):
+        created_at: Optional[datetime] = None
+        child: Child
+        count: int = 0
+
+    m = Model.construct(child={"name": "foo"}, other="bar")
+    updated = construct_update(m, {"created_at": "2023-01-01T00:00:00Z", "extra": 1}, built={"count": 2})
+
+    assert updated.created_at == datetime(2023, 1, 1, tzinfo=timezone.utc)
+    assert updated.count == 2
+    assert updated.child is m.child
+    assert updated.model_fields_set == {"created_at", "child", "count"} | (set() if PYDANTIC_V2 else {"other", "extra"})
+    assert cast(Any, updated).other == "bar"
+    assert cast(Any, updated).extra == 1
+
+    # the model that was updated is unchanged
+    assert m.created_at is None
+    assert m.count == 0
+    assert not hasattr(m, "extra")
+
+    assert construct_update(m, {"created_at": None}).created_at is None
+
+
+def test_construct_caches_are_bounded() -> None:
+    def make_model() -> "type[BaseModel]":
+        class Model(BaseModel):
+            name: str
+
+        return Model
+
+    # the plans of models that are created at runtime don't keep them alive
+    model = make_model()
+    assert cast(Any, model.construct(name="foo")).name == "foo"
+    assert model in _models._construct_plans
+    ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert ref() is None
+
+    with mock.patch.object(_models, "_MAX_TYPE_CONSTRUCTORS", 2):
+        for _ in range(5):
+            construct_type(type_=List[make_model()], value=[{"name": "foo"}])
+            assert len(_models._type_constructors) <= 2
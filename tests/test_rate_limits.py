@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Optional
+from unittest import mock
+
+import httpx
+import pytest
+
+from openai import RateLimiter
+from openai._rate_limits import estimate_tokens, parse_reset_duration
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1s", 1.0),
+        ("20ms", 0.02),
+        ("6m0s", 360.0),
+        ("1h2m3.5s", 3723.5),
+        ("", None),
+        (None, None),
+        ("soon", None),
+        ("1s later", None),
+    ],
+)
+def test_parse_reset_duration(value: Optional[str], expected: Optional[float]) -> None:
+    assert parse_reset_duration(value) == expected
+
+
+def make_request(limiter: RateLimiter, json_data: object = None) -> httpx.Request:
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    limiter.prepare(request, endpoint="/embeddings", json_data=json_data)
+    return request
+
+
+def test_queued_requests_share_the_budget() -> None:
+    limiter = RateLimiter()
+    request = make_request(limiter, {"model": "m"})
+    limiter.update(
+        httpx.Response(
+            200,
+            headers={
+                "x-ratelimit-limit-requests": "100",
+                "x-ratelimit-remaining-requests": "1",
+                "x-ratelimit-reset-requests": "1s",
+            },
+            request=request,
+        ),
+    )
+
+    # one request can be sent right away, the others are released as the budget refills at 99 requests/s
+    start = time.monotonic()
+    requests = [make_request(limiter, {"model": "m"}) for _ in range(3)]
+    threads = [threading.Thread(target=limiter.acquire, args=(request,)) for request in requests]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 0.015
+
+    (status,) = limiter.status()
+    assert status.model == "m"
+    assert status.queued == 0
+    assert status.remaining_tokens is None
+
+    # the budget is reset by the next response
+    limiter.update(
+        httpx.Response(
+            200,
+            headers={"x-ratelimit-limit-requests": "100", "x-ratelimit-remaining-requests": "50"},
+            request=requests[0],
+        ),
+    )
+    (status,) = limiter.status()
+    assert status.remaining_requests is not None and round(status.remaining_requests) == 50
+
+
+def test_ignores_responses_without_headers() -> None:
+    limiter = RateLimiter()
+    request = make_request(limiter)
+    limiter.update(httpx.Response(200, headers={"x-ratelimit-remaining-requests": "not-a-number"}, request=request))
+    limiter.acquire(request)
+    assert limiter.status() == []
+
+
+def test_estimate_tokens() -> None:
+    assert estimate_tokens(None) == (0, 0)
+    assert estimate_tokens({"model": "gpt-4o", "messages": []}) == (0, 0)
+    assert estimate_tokens(
+        {
+            "model": "gpt-4o",
+            "messages": [
+                {"role": "user", "content": "Say this is a test"},
+                {"role": "user", "content": [{"type": "image_url", "image_url": {"url": "data:image/png;base64,..."}}]},
+            ],
+            "max_completion_tokens": 100,
+            "temperature": 0.5,
+        }
+    ) == (19, 100)
+    assert estimate_tokens({"model": "text-embedding-3-small", "input": [[1, 2, 3], [4, 5]]}) == (5, 0)
+
+
+def test_token_budget() -> None:
+    limiter = RateLimiter()
+    body = {"model": "gpt-4o", "input": "x" * 400, "max_output_tokens": 100}
+    request = make_request(limiter, body)
+    limiter.update(
+        httpx.Response(
+            200,
+            headers={
+                "x-ratelimit-limit-tokens": "60000",
+                "x-ratelimit-remaining-tokens": "100",
+                "x-ratelimit-reset-tokens": "1h0m0s",
+            },
+            request=request,
+        ),
+    )
+
+    # the budget is refilled at ~16.6 tokens/s and the request needs 100 more than are available
+    with mock.patch("time.sleep") as sleep:
+        limiter.acquire(make_request(limiter, body))
+    assert round(sleep.call_args[0][0]) == 6
+
+    # the API used fewer tokens than estimated, so later requests reserve fewer tokens
+    for _ in range(10):
+        limiter.record_usage(httpx.Response(200, request=request), {"usage": {"input_tokens": 50, "output_tokens": 10}})
+
+    with mock.patch("time.sleep") as sleep:
+        limiter.acquire(make_request(limiter, body))
+    (status,) = limiter.status()
+    assert status.remaining_tokens is not None and -300 < status.remaining_tokens < -200
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import httpx
+
+from openai import RetryPolicy, CircuitBreaker
+
+
+def test_full_jitter() -> None:
+    policy = RetryPolicy(strategy="full_jitter", initial_delay=1, max_delay=5)
+    for retries_taken, upper in [(0, 1), (1, 2), (2, 4), (3, 5), (10, 5)]:
+        timeouts = [
+            policy.compute_timeout(retries_taken=retries_taken, retry_after=None, previous_timeout=None, elapsed=0)
+            for _ in range(100)
+        ]
+        assert all(0 <= timeout <= upper for timeout in timeouts)
+        assert len(set(timeouts)) > 1
+
+
+def test_decorrelated_jitter() -> None:
+    policy = RetryPolicy(strategy="decorrelated_jitter", initial_delay=1, max_delay=20)
+    previous = None
+    for retries_taken in range(20):
+        timeout = policy.compute_timeout(
+            retries_taken=retries_taken, retry_after=None, previous_timeout=previous, elapsed=0
+        )
+        assert 1 <= timeout <= min(20, (previous or 1) * 3)
+        previous = timeout
+
+
+def test_server_hint_first() -> None:
+    policy = RetryPolicy(strategy="server_hint_first", initial_delay=1, max_delay=5)
+    assert policy.compute_timeout(retries_taken=0, retry_after=30, previous_timeout=None, elapsed=0) == 30
+
+    # unreasonable hints are ignored
+    assert policy.compute_timeout(retries_taken=0, retry_after=120, previous_timeout=None, elapsed=0) <= 1
+
+    # the jitter strategies use the hint as the minimum
+    policy = RetryPolicy(strategy="full_jitter", initial_delay=1, max_delay=5)
+    assert policy.compute_timeout(retries_taken=0, retry_after=3, previous_timeout=None, elapsed=0) == 3
+
+
+def test_max_elapsed() -> None:
+    policy = RetryPolicy(strategy="server_hint_first", max_elapsed=10)
+    assert policy.compute_timeout(retries_taken=0, retry_after=30, previous_timeout=None, elapsed=8) == 2
+    assert policy.allows_retry(retries_taken=0, status_code=500, elapsed=9)
+    assert not policy.allows_retry(retries_taken=0, status_code=500, elapsed=10)
+
+
+def test_max_retries_by_status() -> None:
+    policy = RetryPolicy(max_retries_by_status={429: 3, 500: 0})
+    assert policy.allows_retry(retries_taken=2, status_code=429, elapsed=0)
+    assert not policy.allows_retry(retries_taken=3, status_code=429, elapsed=0)
+    assert not policy.allows_retry(retries_taken=0, status_code=500, elapsed=0)
+    assert policy.allows_retry(retries_taken=5, status_code=503, elapsed=0)
+    assert policy.allows_retry(retries_taken=5, status_code=None, elapsed=0)
+
+
+def test_circuit_breaker_endpoints() -> None:
+    breaker = CircuitBreaker(failure_threshold=2)
+    for file_id in ("file-abc123", "file-def456"):
+        breaker.record(httpx.Request("GET", f"https://api.openai.com/v1/files/{file_id}/content"), None)
+
+    # requests for different objects share the circuit of their endpoint
+    (status,) = breaker.status()
+    assert status.path == "/v1/files/{id}/content"
+    assert status.state == "open"
+
+    # only the most recently used circuits are kept
+    with mock.patch("openai._retries._MAX_CIRCUITS", 3):
+        for host in ("a.example.com", "b.example.com", "c.example.com"):
+            breaker.record(httpx.Request("GET", f"https://{host}/v1/models/gpt-4o"), None)
+    assert [(status.host, status.path) for status in breaker.status()] == [
+        ("a.example.com", "/v1/models/{id}"),
+        ("b.example.com", "/v1/models/{id}"),
+        ("c.example.com", "/v1/models/{id}"),
+    ]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Iterator, AsyncIterator
+import time
+import threading
+from typing import List, Iterator, AsyncIterator
 
 import httpx
 import pytest
 
-from openai import OpenAI, AsyncOpenAI
-from openai._streaming import Stream, AsyncStream, ServerSentEvent
+from openai import OpenAI, APIError, AsyncOpenAI, AzureOpenAI
+from openai._streaming import Stream, SSEDecoder, AsyncStream, ServerSentEvent, BufferedSSEDecoder
 
 
 @pytest.mark.asyncio
@@ -216,6 +218,245 @@ async def test_multi_byte_character_multiple_chunks(
     assert sse.json() == {"content": "известни"}
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_crlf_split_across_chunks(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'data: {"foo":true}\r'
+        yield b"\n\r"
+        yield b'\ndata: {"bar":false}\r\n\r\n'
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert sse.json() == {"foo": True}
+
+    sse = await iter_next(iterator)
+    assert sse.json() == {"bar": False}
+
+    await assert_empty_iter(iterator)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_buffered_decoder_matches_line_decoder(chunk_size: int) -> None:
+    raw = (
+        b"event: completion\n"
+        b'data: {"content":"\xd0\xb8\xd0\xb7\xd0\xb2"}\n\n'
+        b": keep-alive comment\r\r"
+        b"id: 1\r\nretry: 10\r\ndata: first\r\ndata: second\r\n\r\n"
+        b"event: ping\n\n"
+        b"data: [DONE]\n\n"
+        b"data: trailing without terminator"
+    )
+    chunks = [raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)]
+
+    def as_tuples(events: Iterator[ServerSentEvent]) -> list[tuple[object, ...]]:
+        return [(sse.event, sse.data, sse.id, sse.retry) for sse in events]
+
+    expected = as_tuples(SSEDecoder().iter_bytes(iter([raw])))
+    assert len(expected) == 4
+    assert as_tuples(BufferedSSEDecoder().iter_bytes(iter(chunks))) == expected
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_text_deltas(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
+    def body() -> Iterator[bytes]:
+        # chat completion chunks
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"role":"assistant","content":""}}]}\n\n'
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":"Hello"}}]}\n\n'
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"tool_calls":[]}}]}\n\n'
+        yield b'data: {"object":"chat.completion.chunk","choices":[]}\n\n'
+        # completions
+        yield b'data: {"object":"text_completion","choices":[{"index":0,"text":" there"}]}\n\n'
+        # responses events
+        yield b'event: response.output_text.delta\ndata: {"type":"response.output_text.delta","delta":" from"}\n\n'
+        yield b'event: response.output_text.done\ndata: {"type":"response.output_text.done","text":"from"}\n\n'
+        # assistants events
+        yield b'event: thread.message.delta\ndata: {"delta":{"content":[{"index":0,"type":"text","text":{"value":" the"}},{"index":1,"type":"image_file"}]}}\n\n'
+        yield b'event: thread.run.step.delta\ndata: {"delta":{}}\n\n'
+        # transcription events
+        yield b'data: {"type":"transcript.text.delta","delta":" API"}\n\n'
+        yield b"data: [DONE]\n\n"
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":"!"}}]}\n\n'
+
+    if sync:
+        stream = Stream(cast_to=object, client=client, response=httpx.Response(200, content=body()))
+        texts = list(stream.text_deltas())
+    else:
+        async_stream = AsyncStream(
+            cast_to=object, client=async_client, response=httpx.Response(200, content=to_aiter(body()))
+        )
+        texts = [text async for text in async_stream.text_deltas()]
+
+    assert texts == ["Hello", " there", " from", " the", " API"]
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_text_deltas_error(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":"Hello"}}]}\n\n'
+        yield b'data: {"error":{"message":"oops"}}\n\n'
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    texts: List[str] = []
+    with pytest.raises(APIError, match="oops"):
+        if sync:
+            stream = Stream(
+                cast_to=object, client=client, response=httpx.Response(200, content=body(), request=request)
+            )
+            for text in stream.text_deltas():
+                texts.append(text)
+        else:
+            async_stream = AsyncStream(
+                cast_to=object,
+                client=async_client,
+                response=httpx.Response(200, content=to_aiter(body()), request=request),
+            )
+            async for text in async_stream.text_deltas():
+                texts.append(text)
+
+    assert texts == ["Hello"]
+
+
+def test_prefetch(client: OpenAI) -> None:
+    threads: List[str] = []
+
+    def body() -> Iterator[bytes]:
+        for i in range(5):
+            threads.append(threading.current_thread().name)
+            yield f'data: {{"index":{i}}}\n\n'.encode()
+        yield b"data: [DONE]\n\n"
+
+    stream = Stream(cast_to=object, client=client, response=httpx.Response(200, content=body()), prefetch=2)
+    assert [item for item in stream] == [{"index": i} for i in range(5)]
+    assert set(threads) == {"openai-stream-prefetch"}
+
+    # the client option sets the default for every stream
+    stream = Stream(
+        cast_to=object, client=client.with_options(stream_prefetch=2), response=httpx.Response(200, content=body())
+    )
+    assert list(stream.text_deltas()) == []
+    assert stream._reader is not None
+    stream = Stream(
+        cast_to=object,
+        client=client.with_options(stream_prefetch=2),
+        response=httpx.Response(200, content=body()),
+        prefetch=0,
+    )
+    assert next(stream) == {"index": 0}
+    assert stream._reader is None
+
+
+def test_prefetch_error(client: OpenAI) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":"Hello"}}]}\n\n'
+        yield b'data: {"error":{"message":"oops"}}\n\n'
+
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    stream = Stream(
+        cast_to=object, client=client, response=httpx.Response(200, content=body(), request=request), prefetch=4
+    )
+    texts: List[str] = []
+    with pytest.raises(APIError, match="oops"):
+        for text in stream.text_deltas():
+            texts.append(text)
+    # the events before the error are returned first
+    assert texts == ["Hello"]
+
+
+def test_prefetch_close(client: OpenAI) -> None:
+    reads: List[int] = []
+
+    def body() -> Iterator[bytes]:
+        for i in range(100):
+            reads.append(i)
+            yield f'data: {{"index":{i}}}\n\n'.encode()
+
+    stream = Stream(cast_to=object, client=client, response=httpx.Response(200, content=body()), prefetch=2)
+    assert next(stream) == {"index": 0}
+
+    reader = stream._reader
+    assert reader is not None
+    # the reader stops once the queue is full
+    for _ in range(100):
+        if len(reader._items) == 2:
+            break
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert len(reads) == 4
+
+    stream.close()
+    reader._thread.join(timeout=5)
+    assert not reader._thread.is_alive()
+    assert stream.response.is_closed
+    assert len(reads) == 4
+    assert list(stream) == []
+
+
+def test_prefetch_close_idle(client: OpenAI) -> None:
+    idle = threading.Event()
+
+    def body() -> Iterator[bytes]:
+        yield b'data: {"index":0}\n\n'
+        # the server goes idle without closing the connection
+        idle.wait(timeout=5)
+        yield b"data: [DONE]\n\n"
+
+    stream = Stream(cast_to=object, client=client, response=httpx.Response(200, content=body()), prefetch=2)
+    try:
+        with stream:
+            assert next(stream) == {"index": 0}
+        assert stream.response.is_closed
+    finally:
+        idle.set()
+
+    reader = stream._reader
+    assert reader is not None
+    reader._thread.join(timeout=5)
+    assert not reader._thread.is_alive()
+
+
+def test_prefetch_invalid(client: OpenAI) -> None:
+    with pytest.raises(ValueError, match="Expected `prefetch` to be at least 0 but got -1"):
+        Stream(cast_to=object, client=client, response=httpx.Response(200), prefetch=-1)
+
+    with pytest.raises(ValueError, match="Expected `stream_prefetch` to be at least 0 but got -1"):
+        client.with_options(stream_prefetch=-1)
+
+    with pytest.raises(ValueError, match="Expected `stream_prefetch` to be at least 0 but got -1"):
+        OpenAI(api_key="My API Key", stream_prefetch=-1)
+
+    with pytest.raises(ValueError, match="Expected `stream_prefetch` to be at least 0 but got -1"):
+        AzureOpenAI(
+            api_key="My API Key",
+            api_version="2024-02-01",
+            azure_endpoint="https://example.azure.com",
+            stream_prefetch=-1,
+        )
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_text_deltas_multiple_choices(sync: bool, client: OpenAI, async_client: AsyncOpenAI) -> None:
+    def body() -> Iterator[bytes]:
+        # with `n=2` the chunks of both choices are interleaved
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":0,"delta":{"content":"Hello"}}]}\n\n'
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":1,"delta":{"content":"Hi"}}]}\n\n'
+        yield b'data: {"object":"chat.completion.chunk","choices":[{"index":1,"delta":{"content":" you"}},{"index":0,"delta":{"content":" there"}}]}\n\n'
+        yield b'data: {"object":"text_completion","choices":[{"index":1,"text":" again"}]}\n\n'
+        yield b"data: [DONE]\n\n"
+
+    if sync:
+        stream = Stream(cast_to=object, client=client, response=httpx.Response(200, content=body()))
+        texts = list(stream.text_deltas())
+    else:
+        async_stream = AsyncStream(
+            cast_to=object, client=async_client, response=httpx.Response(200, content=to_aiter(body()))
+        )
+        texts = [text async for text in async_stream.text_deltas()]
+
+    # only the first choice is read
+    assert texts == ["Hello", " there"]
+
+
 async def to_aiter(iter: Iterator[bytes]) -> AsyncIterator[bytes]:
     for chunk in iter:
         yield chunk
@@ -434,6 +434,23 @@ async def test_base64_file_input(use_async: bool) -> None:
     }  # type: ignore[comparison-overlap]
 
 
+class TypedDictBase64Dict(TypedDict):
+    files: Dict[str, Annotated[Base64FileInput, PropertyInfo(format="base64")]]
+
+
+@pytest.mark.asyncio
+async def test_async_base64_file_input_dict(monkeypatch: pytest.MonkeyPatch) -> None:
+    def sync_format_data(*_args: object) -> object:
+        raise AssertionError("the async transform must not read files synchronously")
+
+    monkeypatch.setattr("openai._utils._transform._format_data", sync_format_data)
+
+    result = await _async_transform(
+        {"files": {"path": SAMPLE_FILE_PATH, "io": io.BytesIO(b"Hello, world!")}}, expected_type=TypedDictBase64Dict
+    )
+    assert result == {"files": {"path": "SGVsbG8sIHdvcmxkIQo=", "io": "SGVsbG8sIHdvcmxkIQ=="}}  # type: ignore[comparison-overlap]
+
+
 @parametrize
 @pytest.mark.asyncio
 async def test_transform_skipping(use_async: bool) -> None:
@@ -451,3 +468,52 @@ async def test_transform_skipping(use_async: bool) -> None:
 async def test_strips_notgiven(use_async: bool) -> None:
     assert await transform({"foo_bar": "bar"}, Foo1, use_async) == {"fooBar": "bar"}
     assert await transform({"foo_bar": NOT_GIVEN}, Foo1, use_async) == {}
+
+
+class Message(TypedDict, total=False):
+    role: Required[str]
+    content: Union[str, Iterable[Dict[str, object]]]
+
+
+class MessagesParams(TypedDict, total=False):
+    messages: Required[Iterable[Message]]
+    children: Iterable[MessagesParams]
+    created_at: Annotated[date, PropertyInfo(format="iso8601")]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_passthrough_without_copying(use_async: bool) -> None:
+    messages = [{"role": "user", "content": "hello"}, {"role": "user", "content": [{"type": "text", "text": "hi"}]}]
+    params = {"messages": messages, "created_at": date(2023, 2, 23), "children": [{"messages": messages}]}
+
+    result = await transform(params, MessagesParams, use_async)
+    assert result == {**params, "created_at": "2023-02-23"}
+    assert result["messages"] is messages
+
+    # the nested `created_at` needs formatting so the recursive list has to be transformed
+    params = {"messages": messages, "children": [{"messages": messages, "created_at": date(2023, 2, 23)}]}
+    result = await transform(params, MessagesParams, use_async)
+    assert result == {"messages": messages, "children": [{"messages": messages, "created_at": "2023-02-23"}]}
+    assert result["children"] is not params["children"]
+    assert result["children"][0]["messages"] is messages
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_passthrough_still_transforms_values(use_async: bool) -> None:
+    class Content(BaseModel):
+        type: str
+
+    messages = [
+        {"role": "user", "content": "hello", "name": NOT_GIVEN},
+        {"role": "user", "content": iter([{"type": "text"}])},
+        {"role": "user", "content": [Content(type="text")]},
+    ]
+    assert await transform({"messages": messages}, MessagesParams, use_async) == {
+        "messages": [
+            {"role": "user", "content": "hello"},
+            {"role": "user", "content": [{"type": "text"}]},
+            {"role": "user", "content": [{"type": "text"}]},
+        ]
+    }
@@ -0,0 +1,55 @@
+import json
+from typing import Any
+
+import pytest
+
+from openai._utils._json_stream import JSONBodyStream, AsyncJSONBodyStream, iter_json
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        "",
+        None,
+        {"model": "gpt-4o", "temperature": 0.5, "stream": False, "n": 1, "stop": None},
+        {"messages": [{"role": "user", "content": [{"type": "image_url", "image_url": {"url": "a" * 10_000}}]}]},
+        {"input": ['ü é \n " \\   😀' * 500, [1, 2, 3], (4, 5)]},
+        {1: "int", 2.5: "float", True: "bool", None: "null"},
+    ],
+)
+def test_matches_json_dumps(value: Any) -> None:
+    assert b"".join(iter_json(value, chunk_size=100)) == _dumps(value)
+
+
+def test_chunks_long_strings() -> None:
+    chunks = list(iter_json({"content": "a" * 10_000}, chunk_size=1000))
+    assert len(chunks) == 11
+    assert max(len(chunk) for chunk in chunks) <= 2000
+
+
+def test_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        b"".join(iter_json({"temperature": float("nan")}))
+
+    with pytest.raises(TypeError, match="keys must be str, int, float, bool or None, not tuple"):
+        b"".join(iter_json({(1, 2): "tuple"}))
+
+    with pytest.raises(TypeError, match="is not JSON serializable"):
+        b"".join(iter_json({"value": object()}))
+
+
+async def test_body_streams_can_be_iterated_again() -> None:
+    value = {"input": "hello"}
+
+    stream = JSONBodyStream(value)
+    assert b"".join(stream) == b"".join(stream) == _dumps(value)
+
+    async_stream = AsyncJSONBodyStream(value)
+    for _ in range(2):
+        assert b"".join([chunk async for chunk in async_stream]) == _dumps(value)